@@ -0,0 +1,317 @@
+"""Generate synthetic ontologies for benchmarking `turtle-canon`.
+
+The ontologies are generated from a seed, such that the same seed and size always
+generate the same Turtle file, and written as they are generated, such that even
+ontologies of millions of triples are generated in constant memory.
+
+An ontology holds a mix of what is found in real-world OWL ontologies:
+
+- Classes, with labels and comments in several languages, and a superclass.
+- Object and datatype properties, with domains and ranges.
+- Individuals, with typed literals (integers, decimals, booleans, dates and strings)
+  and language-tagged literals.
+- OWL restrictions, i.e., blank nodes, as anonymous superclasses.
+- RDF lists of classes, as unions and intersections of anonymous classes.
+
+The statements of the ontology are shuffled, since a canonical ontology is not much of
+a benchmark.
+
+Example:
+    ```shell
+    python benchmarks/generate.py --triples 100k --seed 42 ontology.ttl
+    ```
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+    from typing import TextIO
+
+DEFAULT_SEED = 0
+"""The default seed of the random generator."""
+
+NAMESPACE = "http://example.org/benchmark#"
+"""The namespace of the generated classes, properties and individuals."""
+
+PREFIXES = {
+    "ex": NAMESPACE,
+    "owl": "http://www.w3.org/2002/07/owl#",
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+}
+
+SIZE_UNITS = {"": 1, "K": 1000, "M": 1000**2}
+
+LANGUAGES = ("en", "de", "fr", "nb")
+
+WORDS = (
+    "atom",
+    "bond",
+    "crystal",
+    "density",
+    "energy",
+    "force",
+    "grain",
+    "heat",
+    "interface",
+    "lattice",
+    "mass",
+    "phase",
+    "process",
+    "quantity",
+    "structure",
+    "temperature",
+    "unit",
+    "volume",
+)
+
+DATATYPES = ("integer", "decimal", "boolean", "dateTime", "string")
+
+# The relative number of statements of each kind
+_KINDS = (
+    ("class", 30),
+    ("object_property", 4),
+    ("datatype_property", 4),
+    ("individual", 40),
+    ("restriction", 14),
+    ("list", 8),
+)
+
+# The number of statements shuffled at a time
+_CHUNK_SIZE = 1000
+
+
+def parse_size(value: str) -> int:
+    """Parse a number of triples, e.g., `1k` or `10M`."""
+    number, unit = value.strip(), ""
+    if number[-1:].upper() in SIZE_UNITS:
+        number, unit = number[:-1], number[-1].upper()
+    try:
+        size = int(float(number) * SIZE_UNITS[unit])
+    except (ValueError, OverflowError) as exc:
+        raise argparse.ArgumentTypeError(
+            f"invalid number of triples: {value!r}"
+        ) from exc
+    if size < 1:
+        raise argparse.ArgumentTypeError(
+            f"number of triples must be positive: {value!r}"
+        )
+    return size
+
+
+def format_size(triples: int) -> str:
+    """Format a number of triples, e.g., `10k`, inverse to `parse_size()`."""
+    for unit in ("M", "K"):
+        if triples % SIZE_UNITS[unit] == 0:
+            return f"{triples // SIZE_UNITS[unit]}{unit.lower()}"
+    return str(triples)
+
+
+def generate(triples: int, output: TextIO, seed: int = DEFAULT_SEED) -> int:
+    """Generate a synthetic ontology as Turtle.
+
+    Parameters:
+        triples: The (minimum) number of triples to generate. Statements are generated
+            until there are at least this many triples, i.e., a few more triples may be
+            generated.
+        output: The text stream to write the Turtle to.
+        seed: The seed of the random generator.
+
+    Returns:
+        The number of (distinct) triples generated.
+
+    """
+    output.writelines(
+        f"@prefix {prefix}: <{namespace}> .\n" for prefix, namespace in PREFIXES.items()
+    )
+    output.write("\n")
+
+    generated = 0
+    chunk: list[str] = []
+    rng = random.Random(seed)
+    for statement, count in _Generator(rng).statements():
+        chunk.append(statement)
+        generated += count
+        if generated >= triples or len(chunk) == _CHUNK_SIZE:
+            rng.shuffle(chunk)
+            output.writelines(chunk)
+            chunk.clear()
+        if generated >= triples:
+            break
+    return generated
+
+
+class _Generator:
+    """Generate the statements of a synthetic ontology."""
+
+    def __init__(self, rng: random.Random) -> None:
+        self._rng = rng
+        self._classes = 0
+        self._object_properties = 0
+        self._datatype_properties = 0
+        self._individuals = 0
+
+    def statements(self) -> Iterator[tuple[str, int]]:
+        """Yield statements in Turtle, each with its number of triples."""
+        kinds, weights = zip(*_KINDS, strict=True)
+        # Anything else refers to at least one class and property of each kind
+        yield self._class()
+        yield self._object_property()
+        yield self._datatype_property()
+        while True:
+            (kind,) = self._rng.choices(kinds, weights)
+            yield getattr(self, f"_{kind}")()
+
+    def _class_name(self) -> str:
+        return f"ex:Class{self._rng.randrange(self._classes)}"
+
+    def _label(self) -> str:
+        return " ".join(self._rng.choices(WORDS, k=self._rng.randint(1, 3)))
+
+    def _class(self) -> tuple[str, int]:
+        name = f"ex:Class{self._classes}"
+        lines = [f"{name} a owl:Class"]
+        if self._classes:
+            lines.append(f"rdfs:subClassOf {self._class_name()}")
+        self._classes += 1
+
+        languages = self._rng.sample(LANGUAGES, k=self._rng.randint(1, 3))
+        lines.append(
+            "rdfs:label "
+            + ", ".join(f'"{self._label()} {name[3:]}"@{_}' for _ in languages)
+        )
+        triples = len(lines) - 1 + len(languages)
+        if self._rng.random() < 0.5:
+            lines.append(f'rdfs:comment """A {self._label()}.\nSee also {name}."""')
+            triples += 1
+        return _statement(lines), triples
+
+    def _object_property(self) -> tuple[str, int]:
+        name = f"ex:objectProperty{self._object_properties}"
+        self._object_properties += 1
+        lines = [
+            f"{name} a owl:ObjectProperty",
+            f"rdfs:domain {self._class_name()}",
+            f"rdfs:range {self._class_name()}",
+            f'rdfs:label "{self._label()}"@en',
+        ]
+        return _statement(lines), len(lines)
+
+    def _datatype_property(self) -> tuple[str, int]:
+        name = f"ex:datatypeProperty{self._datatype_properties}"
+        self._datatype_properties += 1
+        lines = [
+            f"{name} a owl:DatatypeProperty",
+            f"rdfs:domain {self._class_name()}",
+            f"rdfs:range xsd:{self._rng.choice(DATATYPES)}",
+        ]
+        return _statement(lines), len(lines)
+
+    def _individual(self) -> tuple[str, int]:
+        name = f"ex:individual{self._individuals}"
+        self._individuals += 1
+        lines = [f"{name} a {self._class_name()}, owl:NamedIndividual"]
+        properties = self._rng.sample(
+            range(self._datatype_properties),
+            k=min(self._datatype_properties, self._rng.randint(1, 4)),
+        )
+        for index in properties:
+            lines.append(f"ex:datatypeProperty{index} {self._literal()}")
+        if self._individuals > 1 and self._rng.random() < 0.5:
+            other = self._rng.randrange(self._individuals - 1)
+            lines.append(
+                f"ex:objectProperty{self._rng.randrange(self._object_properties)} "
+                f"ex:individual{other}"
+            )
+        lines.append(f'rdfs:label "{self._label()}"@{self._rng.choice(LANGUAGES)}')
+        return _statement(lines), len(lines) + 1
+
+    def _literal(self) -> str:
+        datatype = self._rng.choice(DATATYPES)
+        if datatype == "integer":
+            return str(self._rng.randint(-1000, 100000))
+        if datatype == "decimal":
+            return f"{self._rng.uniform(-1000, 1000):.3f}"
+        if datatype == "boolean":
+            return self._rng.choice(("true", "false"))
+        if datatype == "dateTime":
+            return (
+                f'"20{self._rng.randint(10, 29)}-{self._rng.randint(1, 12):02d}-'
+                f'{self._rng.randint(1, 28):02d}T12:00:00Z"^^xsd:dateTime'
+            )
+        return f'"{self._label()}"^^xsd:string'
+
+    def _restriction(self) -> tuple[str, int]:
+        restrictions = self._rng.randint(1, 3)
+        lines = [f"{self._class_name()} rdfs:subClassOf"]
+        # The superclass, its type and its property of each restriction
+        triples = 3 * restrictions
+        for index in range(restrictions):
+            kind = self._rng.choice(("someValuesFrom", "allValuesFrom", "cardinality"))
+            if kind == "cardinality":
+                value = (
+                    f'owl:minQualifiedCardinality "{self._rng.randint(0, 3)}"'
+                    f"^^xsd:nonNegativeInteger ; owl:onClass {self._class_name()}"
+                )
+                triples += 2
+            else:
+                value = f"owl:{kind} {self._class_name()}"
+                triples += 1
+            separator = "," if index < restrictions - 1 else ""
+            lines.append(
+                "    [ a owl:Restriction ; owl:onProperty "
+                f"ex:objectProperty{self._rng.randrange(self._object_properties)} ; "
+                f"{value} ]{separator}"
+            )
+        return "\n".join(lines) + " .\n\n", triples
+
+    def _list(self) -> tuple[str, int]:
+        members = [self._class_name() for _ in range(self._rng.randint(2, 6))]
+        operator = self._rng.choice(("owl:unionOf", "owl:intersectionOf"))
+        lines = [
+            f"{self._class_name()} owl:equivalentClass",
+            f"    [ a owl:Class ; {operator} ( {' '.join(members)} ) ]",
+        ]
+        # The equivalent class, its type, its list and the first and rest of each node
+        return "\n".join(lines) + " .\n\n", 3 + 2 * len(members)
+
+
+def _statement(lines: list[str]) -> str:
+    """Join the predicate-object lines of a subject into a statement."""
+    return " ;\n    ".join(lines) + " .\n\n"
+
+
+def main(args: list[str] | None = None) -> None:
+    """Generate a synthetic ontology for benchmarking Turtle Canon."""
+    parser = argparse.ArgumentParser(
+        description=main.__doc__,
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--triples",
+        type=parse_size,
+        help="The number of triples to generate, e.g., '1k' or '10M'.",
+        default="10k",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="The seed of the random generator.",
+        default=DEFAULT_SEED,
+    )
+    parser.add_argument("output", type=Path, help="The Turtle file to write.")
+    parsed_args = parser.parse_args(args)
+
+    with parsed_args.output.open("w", encoding="utf8") as output:
+        generate(parsed_args.triples, output, seed=parsed_args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""Benchmark `turtle-canon` on synthetic ontologies, comparing against a baseline.
+
+The stages of canonizing a Turtle file are benchmarked separately, see `BENCHMARKS`,
+for synthetic ontologies of several sizes, see `generate.py`.
+Each benchmark is timed as the best of a number of runs, while its peak memory is
+traced with `tracemalloc` in a separate run, since tracing slows down the run
+considerably.
+
+The results are compared against a stored baseline, `baseline.json`, and the run
+fails if any benchmark is slower, or uses more memory, than the baseline beyond a
+tolerance.
+The baseline is machine dependent, hence it should be updated, with
+`--update-baseline`, on the machine the benchmarks are compared on.
+
+Example:
+    ```shell
+    python benchmarks/run.py --sizes 1k 10k 100k
+    ```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import sys
+import time
+import tracemalloc
+from functools import partial
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+
+from generate import DEFAULT_SEED, format_size, generate, parse_size
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Sequence
+    from typing import Any
+
+BENCHMARKS = ("validate_turtle", "sort_ontology", "export_ontology", "canonize")
+"""The benchmarks, i.e., the functions of `turtle_canon.canon` benchmarked:
+
+- `validate_turtle`: Validate the Turtle file.
+- `sort_ontology`: Parse and sort the triples of the Turtle file.
+- `export_ontology`: Serialize the sorted triples and write them to the Turtle file.
+- `canonize`: Canonize the Turtle file end-to-end (without any cache).
+"""
+
+DEFAULT_SIZES = ("1k", "10k", "100k")
+"""The default sizes of the synthetic ontologies, in number of triples."""
+
+DEFAULT_REPEAT = 3
+"""The default number of runs of each benchmark, of which the fastest is kept."""
+
+DEFAULT_TOLERANCE = 0.2
+"""The default relative increase of time or memory beyond which a benchmark has
+regressed compared with the baseline."""
+
+MIN_TIME = 0.001
+"""The time in seconds below which a benchmark is too fast to have regressed, since the
+time is dominated by noise."""
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+"""The stored baseline."""
+
+
+def run_benchmarks(
+    sizes: Sequence[int],
+    data_dir: Path,
+    benchmarks: Sequence[str] = BENCHMARKS,
+    repeat: int = DEFAULT_REPEAT,
+    seed: int = DEFAULT_SEED,
+    memory: bool = True,
+) -> dict[str, Any]:
+    """Run the benchmarks for synthetic ontologies of several sizes.
+
+    Parameters:
+        sizes: The sizes of the synthetic ontologies, in number of triples.
+        data_dir: The directory of the synthetic ontologies. Ontologies already
+            generated in it, with the same size and seed, are reused.
+        benchmarks: The benchmarks to run, see `BENCHMARKS`.
+        repeat: The number of runs of each benchmark, of which the fastest is kept.
+        seed: The seed of the synthetic ontologies.
+        memory: Whether or not to trace the peak memory of each benchmark.
+
+    Returns:
+        The results, with the time in seconds and the peak memory in bytes of each
+        benchmark, for each size.
+
+    """
+    from turtle_canon import __version__
+
+    results: dict[str, Any] = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "sizes": {},
+    }
+    for size in sizes:
+        ontology = data_dir / f"ontology-{format_size(size)}-{seed}.ttl"
+        if not ontology.exists():
+            with ontology.open("w", encoding="utf8") as output:
+                triples = generate(size, output, seed=seed)
+            ontology.with_suffix(".json").write_text(json.dumps({"triples": triples}))
+        triples = json.loads(ontology.with_suffix(".json").read_text())["triples"]
+
+        size_results: dict[str, Any] = {
+            "triples": triples,
+            "bytes": ontology.stat().st_size,
+        }
+        for name in benchmarks:
+            run, setup = _BENCHMARKS[name](ontology, data_dir / f"work-{ontology.name}")
+            size_results[name] = {
+                "time": min(_time(run, setup) for _ in range(repeat)),
+                "peak_memory": _peak_memory(run, setup) if memory else None,
+            }
+            print(
+                f"{format_size(size):>6} {name:<16} "
+                f"{size_results[name]['time']:10.4f} s",
+                file=sys.stderr,
+            )
+        results["sizes"][format_size(size)] = size_results
+    return results
+
+
+def _time(run: Callable[[], object], setup: Callable[[], object]) -> float:
+    """Return the time in seconds of a run."""
+    setup()
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def _peak_memory(run: Callable[[], object], setup: Callable[[], object]) -> int:
+    """Return the peak size in bytes of the memory allocated by a run."""
+    setup()
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _validate_turtle(
+    ontology: Path, _: Path
+) -> tuple[Callable[[], object], Callable[[], object]]:
+    from turtle_canon.canon import validate_turtle
+
+    return (lambda: validate_turtle(ontology)), (lambda: None)
+
+
+def _sort_ontology(
+    ontology: Path, _: Path
+) -> tuple[Callable[[], object], Callable[[], object]]:
+    from turtle_canon.canon import sort_ontology
+
+    content = ontology.read_bytes()
+    return (lambda: sort_ontology(ontology, content=content)), (lambda: None)
+
+
+def _export_ontology(
+    ontology: Path, work_file: Path
+) -> tuple[Callable[[], object], Callable[[], object]]:
+    from turtle_canon.canon import export_ontology, sort_ontology
+
+    # The sorted ontology is exported to a copy of the (non-canonical) ontology, such
+    # that it is written every time
+    sorted_ontology = sort_ontology(ontology)
+    return (
+        (lambda: export_ontology(sorted_ontology, work_file)),
+        partial(shutil.copyfile, ontology, work_file),
+    )
+
+
+def _canonize(
+    ontology: Path, work_file: Path
+) -> tuple[Callable[[], object], Callable[[], object]]:
+    from turtle_canon.canon import canonize
+
+    return (
+        (lambda: canonize(work_file)),
+        partial(shutil.copyfile, ontology, work_file),
+    )
+
+
+_BENCHMARKS = {
+    "validate_turtle": _validate_turtle,
+    "sort_ontology": _sort_ontology,
+    "export_ontology": _export_ontology,
+    "canonize": _canonize,
+}
+"""The set up of each benchmark, returning its run and the set up of each run."""
+
+
+def compare(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[tuple[str, str, str, float | None, float | None, bool]]:
+    """Compare results against a baseline.
+
+    Only the benchmarks in both the results and the baseline are compared.
+    Benchmarks faster than `MIN_TIME` are never considered slower than the baseline.
+
+    Parameters:
+        results: The results, see `run_benchmarks()`.
+        baseline: The baseline results.
+        tolerance: The relative increase of time or memory beyond which a benchmark
+            has regressed.
+
+    Returns:
+        For each benchmark and measure (`time` or `peak_memory`): the size, the
+        benchmark, the measure, the result, the ratio of the result to the baseline,
+        and whether or not the benchmark has regressed.
+
+    """
+    comparison = []
+    for size, size_results in results["sizes"].items():
+        size_baseline = baseline.get("sizes", {}).get(size, {})
+        for name in BENCHMARKS:
+            if name not in size_results or name not in size_baseline:
+                continue
+            for measure in ("time", "peak_memory"):
+                value = size_results[name][measure]
+                reference = size_baseline[name][measure]
+                ratio = value / reference if value is not None and reference else None
+                regressed = ratio is not None and ratio > 1 + tolerance
+                if measure == "time" and value < MIN_TIME:
+                    regressed = False
+                comparison.append((size, name, measure, value, ratio, regressed))
+    return comparison
+
+
+def _format(measure: str, value: float | None) -> str:
+    """Format a time in seconds as milliseconds, or a size in bytes as megabytes."""
+    if value is None:
+        return "-"
+    if measure == "time":
+        return f"{value * 1000:.1f} ms"
+    return f"{value / 1024**2:.2f} MB"
+
+
+def main(args: list[str] | None = None) -> None:
+    """Benchmark Turtle Canon on synthetic ontologies."""
+    parser = argparse.ArgumentParser(
+        description=main.__doc__,
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=parse_size,
+        help="The sizes of the synthetic ontologies, e.g., '1k' or '10M' triples.",
+        default=[parse_size(_) for _ in DEFAULT_SIZES],
+    )
+    parser.add_argument(
+        "--benchmarks",
+        nargs="+",
+        choices=BENCHMARKS,
+        help="The benchmarks to run.",
+        default=list(BENCHMARKS),
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        help="The number of runs of each benchmark, of which the fastest is kept.",
+        default=DEFAULT_REPEAT,
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="The seed of the synthetic ontologies.",
+        default=DEFAULT_SEED,
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Do not trace the peak memory of each benchmark.",
+    )
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        help=(
+            "The directory to generate the synthetic ontologies in, reusing those "
+            "already generated. By default, a temporary directory is used."
+        ),
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Write the results as JSON to a file."
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="The baseline to compare the results against.",
+        default=BASELINE,
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the results to the baseline, instead of comparing against it.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        help=(
+            "The relative increase of time or memory compared with the baseline, "
+            "beyond which a benchmark has regressed, e.g., 0.2 for 20%%."
+        ),
+        default=DEFAULT_TOLERANCE,
+    )
+    parsed_args = parser.parse_args(args)
+
+    if parsed_args.repeat < 1:
+        parser.error("argument --repeat: must be a positive integer")
+
+    with TemporaryDirectory() as tmp_dir:
+        data_dir = parsed_args.data_dir or Path(tmp_dir)
+        data_dir.mkdir(parents=True, exist_ok=True)
+        results = run_benchmarks(
+            parsed_args.sizes,
+            data_dir,
+            benchmarks=parsed_args.benchmarks,
+            repeat=parsed_args.repeat,
+            seed=parsed_args.seed,
+            memory=not parsed_args.no_memory,
+        )
+
+    serialized = json.dumps(results, indent=2) + "\n"
+    if parsed_args.output is not None:
+        parsed_args.output.write_text(serialized, encoding="utf8")
+    if parsed_args.update_baseline:
+        parsed_args.baseline.write_text(serialized, encoding="utf8")
+        print(f"Updated the baseline {parsed_args.baseline}")
+        return
+
+    if not parsed_args.baseline.exists():
+        sys.exit(f"The baseline {parsed_args.baseline} does not exist.")
+    baseline = json.loads(parsed_args.baseline.read_text(encoding="utf8"))
+    comparison = compare(results, baseline, tolerance=parsed_args.tolerance)
+
+    print(
+        f"Compared with the baseline of Turtle Canon {baseline.get('version')} "
+        f"(Python {baseline.get('python')}):\n"
+    )
+    for size, name, measure, value, ratio, regressed in comparison:
+        print(
+            f"{size:>6}  {name:<16} {measure:<12} {_format(measure, value):>12}  "
+            f"{'-' if ratio is None else f'{ratio:.2f}x':>6}"
+            f"{'  REGRESSED' if regressed else ''}"
+        )
+
+    regressions = sum(regressed for *_, regressed in comparison)
+    if regressions:
+        sys.exit(
+            f"\n{regressions} benchmark(s) regressed by more than "
+            f"{parsed_args.tolerance:.0%} compared with the baseline."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Test `turtle-canon diff`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .conftest import CLIRunner
+
+
+def _write_versions(tmp_dir: Path) -> tuple[Path, Path]:
+    """Write an old and a new version of an ontology."""
+    old_file = tmp_dir / "old.ttl"
+    old_file.write_text(
+        "@prefix : <http://example.org/> .\n:s :p :o, :removed .\n:t :p :o .\n",
+        encoding="utf8",
+    )
+    new_file = tmp_dir / "new.ttl"
+    new_file.write_text(
+        "@prefix : <http://example.org/> .\n:t :p :o .\n:s :p :added, :o .\n",
+        encoding="utf8",
+    )
+    return old_file, new_file
+
+
+def test_diff_text(clirunner: CLIRunner, tmp_dir: Path) -> None:
+    """Test `turtle-canon diff` with text output."""
+    old_file, new_file = _write_versions(tmp_dir)
+
+    output = clirunner(
+        ["diff", str(old_file), str(new_file)],
+        expected_error="<http://example.org/s>",
+        run_dir=tmp_dir,
+    )
+    assert output.returncode == 1
+    assert output.stdout.splitlines() == [
+        "<http://example.org/s>",
+        "+ <http://example.org/p> <http://example.org/added>",
+        "- <http://example.org/p> <http://example.org/removed>",
+    ]
+
+    output = clirunner(["diff", str(old_file), str(old_file)], run_dir=tmp_dir)
+    assert output.returncode == 0
+    assert not output.stdout
+
+
+def test_diff_json(clirunner: CLIRunner, tmp_dir: Path) -> None:
+    """Test `turtle-canon diff --format json`."""
+    import json
+
+    old_file, new_file = _write_versions(tmp_dir)
+
+    output = clirunner(
+        ["diff", "--format=json", "--parser=fast", str(old_file), str(new_file)],
+        expected_error="<http://example.org/s>",
+        run_dir=tmp_dir,
+    )
+    assert json.loads(output.stdout) == {
+        "old": str(old_file),
+        "new": str(new_file),
+        "subjects": [
+            {
+                "subject": "<http://example.org/s>",
+                "removed": [["<http://example.org/p>", "<http://example.org/removed>"]],
+                "added": [["<http://example.org/p>", "<http://example.org/added>"]],
+            }
+        ],
+        "removed": 1,
+        "added": 1,
+    }
+
+    output = clirunner(
+        ["diff", "--format=json", str(old_file), str(old_file)], run_dir=tmp_dir
+    )
+    assert json.loads(output.stdout)["subjects"] == []
+
+
+def test_diff_missing_file(clirunner: CLIRunner, tmp_dir: Path) -> None:
+    """Test `turtle-canon diff` with a missing file."""
+    old_file, _ = _write_versions(tmp_dir)
+
+    clirunner(
+        ["diff", str(old_file), str(tmp_dir / "missing.ttl")],
+        expected_error="not found",
+        run_dir=tmp_dir,
+    )
@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import pytest
+
 if TYPE_CHECKING:
     from .conftest import CLIRunner
 
@@ -198,3 +200,443 @@ def test_fail_fast(
     assert "*" not in output.stderr, assertion_help
     assert not output.stdout, assertion_help
     assert "Successful" not in output.stdout, assertion_help
+
+
+def test_jobs(
+    clirunner: CLIRunner, single_turtle_permutations: list[Path], tmp_dir: Path
+) -> None:
+    """Test `--jobs` gives the same summary in the same order for any number of
+    workers."""
+    warning_file = tmp_dir / "empty.ttl"
+    warning_file.touch()
+
+    turtle_files = [str(_) for _ in single_turtle_permutations]
+    turtle_files.insert(1, str(warning_file))
+
+    outputs = []
+    for jobs in ("1", "2"):
+        for turtle_file in single_turtle_permutations:
+            turtle_file.write_text(
+                turtle_file.read_text(encoding="utf8") + "\n", encoding="utf8"
+            )
+
+        output = clirunner(["--jobs", jobs, *turtle_files])
+
+        assertion_help = (
+            f"STDOUT: {output.stdout}\nSTDERR: {output.stderr}\nRETURN_CODE: "
+            f"{output.returncode}"
+        )
+
+        assert output.returncode == 0, assertion_help
+        assert str(warning_file) in output.stderr, assertion_help
+        changed_files = output.stdout.split("Changed files:\n", maxsplit=1)[-1]
+        assert changed_files.rstrip("\n").split("{}\n") == [
+            str(_) for _ in single_turtle_permutations
+        ], assertion_help
+        outputs.append(output)
+
+    assert outputs[0].stdout == outputs[1].stdout
+    assert outputs[0].stderr == outputs[1].stderr
+
+
+def test_cache(clirunner: CLIRunner, simple_turtle_file: Path, tmp_dir: Path) -> None:
+    """Test `--cache-dir` and `--no-cache`."""
+    cache_dir = tmp_dir / "cache"
+
+    output = clirunner(["--no-cache", str(simple_turtle_file)], run_dir=tmp_dir)
+    assert output.returncode == 0
+    assert not (tmp_dir / ".turtle_canon_cache").exists()
+
+    output = clirunner(["--cache-dir", str(cache_dir), str(simple_turtle_file)])
+    assert output.returncode == 0
+    assert cache_dir.is_dir()
+    assert any(cache_dir.glob("*/*"))
+
+    # Make the file non-canonical again, which should not be hidden by the cache
+    simple_turtle_file.write_text(
+        simple_turtle_file.read_text(encoding="utf8") + "\n", encoding="utf8"
+    )
+    output = clirunner(["--cache-dir", str(cache_dir), str(simple_turtle_file)])
+    assert output.returncode == 0
+    assert str(simple_turtle_file) in output.stdout
+
+
+@pytest.mark.parametrize("verify", ["none", "roundtrip"])
+def test_verify(
+    clirunner: CLIRunner,
+    single_turtle_permutations: list[Path],
+    tmp_dir: Path,
+    verify: str,
+) -> None:
+    """Test `--verify`."""
+    from turtle_canon.canon import canonize
+
+    reference_file = tmp_dir / "reference.ttl"
+    reference_file.write_bytes(single_turtle_permutations[0].read_bytes())
+    canonize(reference_file)
+
+    output = clirunner(
+        ["--no-cache", "--verify", verify, *map(str, single_turtle_permutations)],
+        run_dir=tmp_dir,
+    )
+    assert output.returncode == 0
+    for turtle_file in single_turtle_permutations:
+        assert turtle_file.read_bytes() == reference_file.read_bytes()
+
+
+def test_verify_unknown_level(clirunner: CLIRunner, simple_turtle_file: Path) -> None:
+    """Test `--verify` with an unknown verification level."""
+    clirunner(
+        ["--verify", "some", str(simple_turtle_file)],
+        expected_error="invalid choice: 'some'",
+    )
+
+
+def test_check(
+    clirunner: CLIRunner, single_turtle_permutations: list[Path], tmp_dir: Path
+) -> None:
+    """Test `--check`."""
+    turtle_files = [str(_) for _ in single_turtle_permutations]
+    original_contents = [_.read_bytes() for _ in single_turtle_permutations]
+
+    output = clirunner(
+        ["--no-cache", "--check", *turtle_files],
+        run_dir=tmp_dir,
+        expected_error="Files that would be changed:",
+    )
+    assert output.returncode == 1
+    assert [_.read_bytes() for _ in single_turtle_permutations] == original_contents
+
+    output = clirunner(["--no-cache", *turtle_files], run_dir=tmp_dir)
+    assert output.returncode == 0
+
+    output = clirunner(["--no-cache", "--check", *turtle_files], run_dir=tmp_dir)
+    assert output.returncode == 0
+    assert "Successful Fire !" in output.stdout
+
+
+def test_max_memory(clirunner: CLIRunner, tmp_dir: Path) -> None:
+    """Test `--max-memory`."""
+    ntriples_file = tmp_dir / "ontology.nt"
+    ntriples_file.write_text(
+        "".join(
+            f"<http://ex.org/c{index % 7}> <http://ex.org/p> <http://ex.org/o{index}> ."
+            "\n"
+            for index in range(100, 0, -1)
+        ),
+        encoding="utf8",
+    )
+
+    output = clirunner(
+        ["--no-cache", "--max-memory", "1K", str(ntriples_file)], run_dir=tmp_dir
+    )
+    assert output.returncode == 0
+    assert str(ntriples_file) in output.stdout
+    lines = ntriples_file.read_text(encoding="utf8").splitlines()
+    assert lines == sorted(lines)
+    assert len(lines) == 100
+
+    clirunner(
+        ["--max-memory", "lots", str(ntriples_file)],
+        expected_error="invalid memory size: 'lots'",
+    )
+
+    # Turtle files are canonized in memory
+    turtle_file = tmp_dir / "ontology.ttl"
+    turtle_file.write_text(
+        "<http://ex.org/s> <http://ex.org/p> <http://ex.org/o> .\n", encoding="utf8"
+    )
+    clirunner(
+        ["--no-cache", "--max-memory", "1K", str(turtle_file)],
+        expected_error="only applies to N-Triples and N-Quads files",
+    )
+    clirunner(
+        ["--max-memory", "1K", "--watch", str(tmp_dir)],
+        expected_error="cannot be combined",
+    )
+
+
+def test_parser(
+    clirunner: CLIRunner, single_turtle_permutations: list[Path], tmp_dir: Path
+) -> None:
+    """Test `--parser`."""
+    from turtle_canon.canon import canonize
+
+    reference_file = tmp_dir / "reference.ttl"
+    reference_file.write_bytes(single_turtle_permutations[0].read_bytes())
+    canonize(reference_file)
+
+    output = clirunner(
+        ["--no-cache", "--parser", "fast", *map(str, single_turtle_permutations)],
+        run_dir=tmp_dir,
+    )
+    assert output.returncode == 0
+    for turtle_file in single_turtle_permutations:
+        assert turtle_file.read_bytes() == reference_file.read_bytes()
+
+    clirunner(
+        ["--parser", "some", str(reference_file)],
+        expected_error="invalid choice: 'some'",
+    )
+
+
+def test_canonical_blank_nodes(clirunner: CLIRunner, tmp_dir: Path) -> None:
+    """Test `--canonical-blank-nodes`."""
+    content = "@prefix : <http://example.org/> .\n:s :p [ :q :o ], [ :q :o2 ] .\n"
+    outputs = set()
+    for _ in range(2):
+        turtle_file = tmp_dir / "blank_nodes.ttl"
+        turtle_file.write_text(content, encoding="utf8")
+        output = clirunner(
+            ["--no-cache", "--canonical-blank-nodes", str(turtle_file)],
+            run_dir=tmp_dir,
+        )
+        assert output.returncode == 0
+        outputs.add(turtle_file.read_bytes())
+    assert len(outputs) == 1
+
+
+def test_digest(clirunner: CLIRunner, simple_turtle_file: Path, tmp_dir: Path) -> None:
+    """Test `--digest`."""
+    from turtle_canon.canon import digest
+
+    content = simple_turtle_file.read_bytes()
+    output = clirunner(
+        ["--digest", "--jobs=2", str(simple_turtle_file), str(tmp_dir / "missing.ttl")],
+        expected_error="not found",
+        run_dir=tmp_dir,
+    )
+    assert output.stdout.splitlines() == [
+        f"{digest(simple_turtle_file)}  {simple_turtle_file}"
+    ]
+    assert simple_turtle_file.read_bytes() == content
+
+
+def test_stdin(simple_turtle_file: Path, tmp_dir: Path) -> None:
+    """Test reading from standard input and writing to standard output with `-`."""
+    from subprocess import run
+
+    from turtle_canon.canon import canonize_bytes
+
+    content = simple_turtle_file.read_bytes()
+    output = run(["turtle-canon", "-"], input=content, capture_output=True, check=True)
+    assert output.stdout == canonize_bytes(content)
+    assert simple_turtle_file.read_bytes() == content
+
+    # Content without triples is passed on unchanged
+    output = run(
+        ["turtle-canon", "-"], input=b"# Comment\n", capture_output=True, check=True
+    )
+    assert output.stdout == b"# Comment\n"
+    assert b"No triples found" in output.stderr
+
+    output = run(
+        ["turtle-canon", "-"], input=b"not turtle", capture_output=True, check=False
+    )
+    assert output.returncode == 1
+    assert not output.stdout
+
+    output = run(
+        ["turtle-canon", "-", str(simple_turtle_file)],
+        capture_output=True,
+        check=False,
+        cwd=tmp_dir,
+    )
+    assert output.returncode == 2
+    assert b"cannot be combined" in output.stderr
+
+
+def test_watch(simple_turtle_file: Path, tmp_dir: Path) -> None:
+    """Test canonizing changed Turtle files with `--watch`."""
+    import time
+    from shutil import copy
+    from subprocess import PIPE, Popen
+
+    from turtle_canon.canon import canonize_bytes
+
+    content = simple_turtle_file.read_bytes()
+    canonical = canonize_bytes(content)
+    assert canonical != content
+
+    with Popen(
+        ["turtle-canon", "--watch", str(tmp_dir), "--no-cache"],
+        stdout=PIPE,
+        stderr=PIPE,
+        text=True,
+    ) as watcher:
+        try:
+            assert watcher.stdout is not None
+            assert watcher.stdout.readline().startswith("Watching")
+            # Let the watcher start watching
+            time.sleep(1)
+
+            turtle_file = Path(copy(simple_turtle_file, tmp_dir / "ontology.ttl"))
+            deadline = time.monotonic() + 20
+            while turtle_file.read_bytes() != canonical:
+                assert time.monotonic() < deadline, "The file was not canonized"
+                time.sleep(0.1)
+            # Let the watcher see its own write
+            time.sleep(1)
+        finally:
+            watcher.terminate()
+            stdout, stderr = watcher.communicate(timeout=10)
+
+    assert watcher.returncode == 0, stderr
+    # The file is reported once, not again after the write of the canonized content
+    assert stdout.count(str(turtle_file)) == 1
+
+
+def test_watch_invalid_arguments(
+    simple_turtle_file: Path, clirunner: CLIRunner
+) -> None:
+    """Ensure `--watch` takes a directory and cannot be combined with files."""
+    clirunner(["--watch", str(simple_turtle_file)], expected_error="not a directory")
+    clirunner(
+        ["--watch", str(simple_turtle_file.parent), str(simple_turtle_file)],
+        expected_error="cannot be combined",
+    )
+
+
+def test_changed_since(
+    simple_turtle_file: Path, tmp_dir: Path, clirunner: CLIRunner
+) -> None:
+    """Test only canonizing the Turtle files changed since a Git revision."""
+    from shutil import copy
+    from subprocess import run
+
+    content = simple_turtle_file.read_bytes()
+    unchanged = Path(copy(simple_turtle_file, tmp_dir / "unchanged.ttl"))
+    modified = Path(copy(simple_turtle_file, tmp_dir / "modified.ttl"))
+    for args in (
+        ["init", "--quiet"],
+        ["add", "."],
+        ["commit", "--quiet", "-m", "Initial commit"],
+    ):
+        run(
+            ["git", "-c", "user.name=Turtle", "-c", "user.email=turtle@canon", *args],
+            check=True,
+            capture_output=True,
+            cwd=tmp_dir,
+        )
+    modified.write_bytes(content + b"\n# Modified\n")
+
+    output = clirunner(
+        ["--changed-since", "HEAD", "--no-cache", "--no-daemon"], run_dir=tmp_dir
+    )
+    assert "Changed files:\nmodified.ttl" in output.stdout
+    assert unchanged.read_bytes() == content
+    assert modified.read_bytes() != content + b"\n# Modified\n"
+
+    clirunner(
+        ["--changed-since", "no-such-revision"],
+        expected_error="no-such-revision",
+        run_dir=tmp_dir,
+    )
+    clirunner(
+        ["--untracked", "modified.ttl"], expected_error="requires --changed-since"
+    )
+
+
+def test_directories(
+    simple_turtle_file: Path, tmp_dir: Path, clirunner: CLIRunner
+) -> None:
+    """Test canonizing the Turtle files found in directories."""
+    from shutil import copy
+
+    content = simple_turtle_file.read_bytes()
+    (tmp_dir / "ontologies" / "vendor").mkdir(parents=True)
+    canonized = [
+        Path(copy(simple_turtle_file, tmp_dir / "ontologies" / name))
+        for name in ("a.ttl", "b.ttl")
+    ]
+    vendored = Path(
+        copy(simple_turtle_file, tmp_dir / "ontologies" / "vendor" / "c.ttl")
+    )
+    (tmp_dir / "ontologies" / "notes.md").write_text("# Notes\n")
+
+    output = clirunner(
+        [
+            "--no-cache",
+            "--no-daemon",
+            "--jobs",
+            "2",
+            "--exclude",
+            "vendor/",
+            "ontologies",
+        ],
+        run_dir=tmp_dir,
+    )
+    for turtle_file in canonized:
+        assert turtle_file.read_bytes() != content
+        assert str(turtle_file.relative_to(tmp_dir)) in output.stdout
+    assert vendored.read_bytes() == content
+
+
+def test_include_and_exclude_help(clirunner: CLIRunner) -> None:
+    """Ensure the help shows the actual defaults of `--include` and `--exclude`."""
+    import re
+
+    output = clirunner(["--help"])
+    help_text = re.sub(r"\s+", " ", output.stdout)
+    include = help_text[help_text.rindex("--include PATTERN") :]
+    include = include[: include.index("--exclude PATTERN")]
+    assert include.endswith("(default: *.ttl) ")
+    assert include.count("default") == 1
+    exclude = help_text[help_text.rindex("--exclude PATTERN") :]
+    exclude = exclude[: exclude.index("--no-gitignore")]
+    assert "default" not in exclude
+
+
+def test_timings_and_report(
+    simple_turtle_file: Path, tmp_dir: Path, clirunner: CLIRunner
+) -> None:
+    """Test printing the timings of each stage and writing a JSON report."""
+    import json
+
+    from turtle_canon.utils.metrics import STAGES
+
+    report_file = tmp_dir / "report.json"
+    output = clirunner(
+        [
+            "--no-cache",
+            "--timings",
+            "--report",
+            str(report_file),
+            str(simple_turtle_file),
+        ]
+    )
+    assert "Timings (ms):" in output.stdout
+    assert "triples/s" in output.stdout
+
+    report = json.loads(report_file.read_text(encoding="utf8"))
+    (file_report,) = report["files"]
+    assert file_report["file"] == str(simple_turtle_file)
+    assert file_report["changed"]
+    assert file_report["triples"] == 13
+    assert set(file_report["stages"]) == set(STAGES)
+    assert report["summary"]["files"] == 1
+    assert report["summary"]["triples"] == 13
+    assert report["summary"]["triples_per_second"] > 0
+
+
+def test_profile_and_trace_memory(
+    simple_turtle_file: Path, tmp_dir: Path, clirunner: CLIRunner
+) -> None:
+    """Test profiling each file and tracing the memory allocated."""
+    import pstats
+
+    output = clirunner(
+        [
+            "--no-cache",
+            "--profile",
+            str(tmp_dir / "profiles"),
+            "--trace-memory",
+            simple_turtle_file.name,
+        ],
+        run_dir=simple_turtle_file.parent,
+    )
+    assert f"Memory traced for {simple_turtle_file.name}: peak" in output.stdout
+    assert "blocks" in output.stdout
+
+    pstats.Stats(str(tmp_dir / "profiles" / f"{simple_turtle_file.name}.pstats"))
+    assert simple_turtle_file.read_text(encoding="utf8").startswith("@prefix")
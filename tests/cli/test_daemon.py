@@ -0,0 +1,169 @@
+"""Test `turtle_canon.cli.daemon`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from .conftest import CLIRunner
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(__import__("socket"), "AF_UNIX"),
+    reason="The daemon requires Unix domain sockets.",
+)
+
+
+@pytest.fixture
+def daemon_socket(tmp_dir: Path) -> Generator[Path]:
+    """Run a daemon, yielding the path of its socket."""
+    from subprocess import PIPE, Popen
+
+    socket_path = tmp_dir / "daemon.sock"
+    with Popen(
+        ["turtle-canon", "--daemon", "--socket", str(socket_path)],
+        stdout=PIPE,
+        text=True,
+    ) as daemon:
+        try:
+            assert daemon.stdout is not None
+            assert daemon.stdout.readline().strip() == f"Serving on {socket_path}"
+            yield socket_path
+        finally:
+            daemon.terminate()
+            assert daemon.wait(timeout=10) == 0
+    assert not socket_path.exists()
+
+
+def test_canonize_files(
+    daemon_socket: Path,
+    single_turtle_permutations: list[Path],
+    tmp_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure the daemon canonizes and checks files like `turtle-canon` itself."""
+    import turtle_canon
+    from turtle_canon.cli.daemon import canonize_files
+    from turtle_canon.utils.exceptions import TurtleFileNotFound
+
+    turtle_files = [*single_turtle_permutations, tmp_dir / "missing.ttl"]
+
+    results = canonize_files(daemon_socket, turtle_files, check=True)
+    assert results is not None
+    outcomes = {index: (changed, exception) for index, changed, exception in results}
+    assert sorted(outcomes) == list(range(len(turtle_files)))
+    assert isinstance(outcomes[len(turtle_files) - 1][1], TurtleFileNotFound)
+    would_change = [changed for changed, _ in outcomes.values() if changed]
+    assert would_change
+
+    results = canonize_files(
+        daemon_socket, single_turtle_permutations, cache_dir=tmp_dir / "cache"
+    )
+    assert results is not None
+    assert [changed for _, changed, _ in results if changed] == would_change
+    assert len({_.read_bytes() for _ in single_turtle_permutations}) == 1
+
+    results = canonize_files(
+        daemon_socket, single_turtle_permutations, cache_dir=tmp_dir / "cache"
+    )
+    assert results is not None
+    assert not [changed for _, changed, _ in results if changed]
+
+    # A client of another version does not use the daemon
+    monkeypatch.setattr(turtle_canon, "__version__", "0.0.0")
+    assert canonize_files(daemon_socket, single_turtle_permutations) is None
+
+
+def test_daemon_of_other_user(
+    monkeypatch: pytest.MonkeyPatch, daemon_socket: Path, simple_turtle_file: Path
+) -> None:
+    """Ensure a daemon listening on a socket owned by another user is not used."""
+    import os
+
+    from turtle_canon.cli.daemon import canonize_files
+
+    monkeypatch.setattr(os, "getuid", lambda: daemon_socket.stat().st_uid + 1)
+    assert canonize_files(daemon_socket, [simple_turtle_file]) is None
+
+
+def test_serve_unremovable_socket(tmp_dir: Path) -> None:
+    """Ensure a socket path that cannot be removed is reported as a `DaemonError`."""
+    from turtle_canon.cli.daemon import serve
+    from turtle_canon.utils.exceptions import DaemonError
+
+    socket_path = tmp_dir / "daemon.sock"
+    (socket_path / "other").mkdir(parents=True)
+    with pytest.raises(DaemonError, match="Cannot listen on"):
+        serve(socket_path)
+
+
+def test_no_daemon(tmp_dir: Path, simple_turtle_file: Path) -> None:
+    """Ensure no results are given if the daemon is not running."""
+    from turtle_canon.cli.daemon import canonize_files
+
+    assert canonize_files(tmp_dir / "daemon.sock", [simple_turtle_file]) is None
+
+
+def test_cli(
+    clirunner: CLIRunner, daemon_socket: Path, single_turtle_permutations: list[Path]
+) -> None:
+    """Test `turtle-canon` with a running daemon."""
+    turtle_files = [str(_) for _ in single_turtle_permutations]
+
+    clirunner(
+        ["--socket", str(daemon_socket), "--check", *turtle_files],
+        expected_error="Files that would be changed",
+    )
+    clirunner(["--socket", str(daemon_socket), *turtle_files])
+    assert len({_.read_bytes() for _ in single_turtle_permutations}) == 1
+    output = clirunner(["--socket", str(daemon_socket), "--check", *turtle_files])
+    assert output.returncode == 0
+
+    clirunner(
+        ["--daemon", "--socket", str(daemon_socket)],
+        expected_error="already listening",
+    )
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_cli_large_batch(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_dir: Path,
+    simple_turtle_file: Path,
+    jobs: int,
+) -> None:
+    """Ensure large batches of files are only sent to the daemon without worker
+    processes."""
+    import shutil
+
+    from turtle_canon.cli import cmd_turtle_canon, daemon
+
+    batches: list[list[Path]] = []
+
+    def _canonize_files(_: Path, turtle_files: list[Path], **__: object) -> None:
+        batches.append(list(turtle_files))
+
+    monkeypatch.setattr(daemon, "canonize_files", _canonize_files)
+    socket_path = tmp_dir / "daemon.sock"
+    socket_path.touch()
+
+    turtle_files = []
+    for index in range(cmd_turtle_canon.DAEMON_MAX_FILES + 1):
+        turtle_files.append(tmp_dir / f"{index}.ttl")
+        shutil.copyfile(simple_turtle_file, turtle_files[-1])
+    options = ["--socket", str(socket_path), "--jobs", str(jobs)]
+
+    with pytest.raises(SystemExit) as exit_info:
+        cmd_turtle_canon.main([*options, *map(str, turtle_files[:-1])])
+    assert not exit_info.value.code
+    assert batches == [turtle_files[:-1]]
+
+    batches.clear()
+    with pytest.raises(SystemExit) as exit_info:
+        cmd_turtle_canon.main([*options, *map(str, turtle_files)])
+    assert not exit_info.value.code
+    assert batches == ([turtle_files] if jobs == 1 else [])
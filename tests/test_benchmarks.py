@@ -0,0 +1,72 @@
+"""Test the benchmark suite in `benchmarks/`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def benchmarks_dir(top_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Make the benchmark scripts importable."""
+    monkeypatch.syspath_prepend(str(top_dir / "benchmarks"))
+    return top_dir / "benchmarks"
+
+
+def test_generate() -> None:
+    """Ensure the generated ontology is seeded, and has the number of triples
+    reported."""
+    from io import StringIO
+
+    from generate import generate, parse_size
+    from rdflib import BNode, Graph, Literal
+
+    outputs = [StringIO(), StringIO(), StringIO()]
+    triples = [
+        generate(parse_size("2k"), output, seed=seed)
+        for output, seed in zip(outputs, [1, 1, 2], strict=True)
+    ]
+    assert outputs[0].getvalue() == outputs[1].getvalue() != outputs[2].getvalue()
+
+    graph = Graph().parse(data=outputs[0].getvalue(), format="turtle")
+    assert len(graph) == triples[0] >= 2000
+    assert any(isinstance(subject, BNode) for subject in graph.subjects())
+    assert {_.language for _ in graph.objects() if isinstance(_, Literal)} > {"en"}
+
+
+def test_run_and_compare(tmp_dir: Path) -> None:
+    """Test running the benchmarks and comparing them against a baseline."""
+    from run import BENCHMARKS, compare, run_benchmarks
+
+    results = run_benchmarks([100], tmp_dir, repeat=1)
+    assert results["sizes"]["100"]["triples"] >= 100
+    assert all(
+        results["sizes"]["100"][name]["time"] > 0
+        and results["sizes"]["100"][name]["peak_memory"] > 0
+        for name in BENCHMARKS
+    )
+    # The generated ontology is reused
+    assert (tmp_dir / "ontology-100-0.ttl").exists()
+
+    assert not any(regressed for *_, regressed in compare(results, results))
+
+    baseline = {
+        "sizes": {
+            "100": {
+                "canonize": {"time": 1e-6, "peak_memory": 1},
+                "sort_ontology": {"time": 60.0, "peak_memory": 1024**3},
+            }
+        }
+    }
+    comparison = compare(results, baseline, tolerance=0.5)
+    assert [(name, measure) for _, name, measure, *_ in comparison] == [
+        ("sort_ontology", "time"),
+        ("sort_ontology", "peak_memory"),
+        ("canonize", "time"),
+        ("canonize", "peak_memory"),
+    ]
+    assert [regressed for *_, regressed in comparison] == [False, False, True, True]
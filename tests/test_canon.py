@@ -277,3 +277,513 @@ def test_sort_ontology_unparseable_file(tmp_dir: Path) -> None:
     finally:
         unparseable_file.chmod(0o644)
         assert unparseable_file.read_text()
+
+
+def test_canonize_unchanged_file_not_written(simple_turtle_file: Path) -> None:
+    """Ensure an already canonical file is not written to."""
+    import os
+
+    from turtle_canon.canon import canonize
+
+    assert canonize(simple_turtle_file) == simple_turtle_file
+
+    os.utime(simple_turtle_file, ns=(1_000_000_000, 1_000_000_000))
+    assert canonize(simple_turtle_file) is None
+    assert simple_turtle_file.stat().st_mtime_ns == 1_000_000_000
+
+
+def test_sort_ontology_from_content(simple_turtle_file: Path) -> None:
+    """Ensure parsing already read content gives the same ontology as parsing the
+    file."""
+    from turtle_canon.canon import sort_ontology
+
+    from_content = sort_ontology(
+        simple_turtle_file, content=simple_turtle_file.read_bytes()
+    )
+    from_file = sort_ontology(simple_turtle_file)
+
+    assert set(from_content) == set(from_file)
+    assert sorted(from_content.namespaces()) == sorted(from_file.namespaces())
+
+
+@pytest.mark.parametrize("spill_threshold", [0, 512])
+def test_canonize_spilled_output(
+    simple_turtle_file: Path, monkeypatch: pytest.MonkeyPatch, spill_threshold: int
+) -> None:
+    """Ensure spilling large serialized output to disk gives the same result."""
+    import shutil
+
+    from turtle_canon import canon
+
+    in_memory_file = simple_turtle_file.with_stem("in_memory")
+    shutil.copy(simple_turtle_file, in_memory_file)
+    simple_turtle_file.chmod(0o640)
+
+    assert canon.canonize(in_memory_file) == in_memory_file
+
+    monkeypatch.setattr(canon, "SPILL_THRESHOLD", spill_threshold)
+    assert canon.canonize(simple_turtle_file) == simple_turtle_file
+    assert canon.canonize(simple_turtle_file) is None
+
+    assert simple_turtle_file.read_bytes() == in_memory_file.read_bytes()
+    assert simple_turtle_file.stat().st_mode & 0o777 == 0o640
+    assert sorted(_.name for _ in simple_turtle_file.parent.iterdir()) == sorted(
+        [simple_turtle_file.name, in_memory_file.name]
+    )
+
+
+@pytest.mark.parametrize("suffix", [".ttl", ".nt"])
+def test_canonize_spilled_output_cached(
+    simple_turtle_file: Path, monkeypatch: pytest.MonkeyPatch, suffix: str
+) -> None:
+    """Ensure the cache records the content of spilled output, once it has replaced
+    the file."""
+    from rdflib import Graph
+
+    from turtle_canon import canon
+    from turtle_canon.utils.cache import CanonCache
+
+    turtle_file = simple_turtle_file
+    if suffix == ".nt":
+        turtle_file = simple_turtle_file.with_suffix(suffix)
+        Graph().parse(simple_turtle_file, format="turtle").serialize(
+            turtle_file, format="nt", encoding="utf-8"
+        )
+    cache = CanonCache(simple_turtle_file.parent / ".turtle_canon_cache")
+    monkeypatch.setattr(canon, "SPILL_THRESHOLD", 16)
+
+    assert canon.canonize(turtle_file, cache=cache) == turtle_file
+    assert cache.is_canonical(turtle_file.read_bytes())
+
+    metrics = canon.Metrics(turtle_file)
+    assert canon.canonize(turtle_file, cache=cache, metrics=metrics) is None
+    assert metrics.cached
+
+
+@pytest.mark.parametrize("check_only", [False, True])
+def test_canonize_max_memory_turtle(simple_turtle_file: Path, check_only: bool) -> None:
+    """Ensure a maximum amount of memory is rejected for Turtle files."""
+    from turtle_canon.canon import canonize, check
+    from turtle_canon.utils.exceptions import UnsupportedMaxMemory
+
+    content = simple_turtle_file.read_bytes()
+    with pytest.raises(UnsupportedMaxMemory, match="only applies to N-Triples"):
+        (check if check_only else canonize)(simple_turtle_file, max_memory=1024**3)
+    assert simple_turtle_file.read_bytes() == content
+
+
+def test_canonize_nan_next_to_decimal(tmp_dir: Path) -> None:
+    """Ensure a NaN double and a decimal in different triples are canonized."""
+    from turtle_canon.canon import canonize
+
+    turtle_file = tmp_dir / "nan.ttl"
+    turtle_file.write_text(
+        "@prefix ex: <http://example.org/> .\n"
+        "@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .\n\n"
+        'ex:b ex:p "1.5"^^xsd:decimal .\n'
+        'ex:a ex:p "NaN"^^xsd:double .\n',
+        encoding="utf8",
+    )
+    assert canonize(turtle_file) == turtle_file
+    canonized = turtle_file.read_text(encoding="utf8")
+    assert canonized.index("ex:a") < canonized.index("ex:b")
+
+
+def test_sort_ontology_sorted_triples(simple_turtle_file: Path) -> None:
+    """Ensure the sorted ontology iterates over its triples in sorted order and keeps
+    the namespace bindings of the parsed Turtle file."""
+    from rdflib import Graph
+
+    from turtle_canon.canon import sort_ontology
+
+    parsed_ontology = Graph().parse(simple_turtle_file, format="turtle")
+    ontology = sort_ontology(simple_turtle_file)
+
+    assert list(ontology) == sorted(parsed_ontology)
+    assert len(ontology) == len(parsed_ontology)
+    assert dict(ontology.namespaces()) == dict(parsed_ontology.namespaces())
+    assert ontology.namespace_manager.graph is ontology
+
+
+@pytest.mark.parametrize("verify", ["none", "count", "digest", "full"])
+def test_sort_ontology_fast_parser(simple_turtle_file: Path, verify: str) -> None:
+    """Ensure the fast parser results in the same sorted ontology as RDFlib's."""
+    from turtle_canon.canon import sort_ontology
+
+    reference_ontology = sort_ontology(simple_turtle_file)
+    ontology = sort_ontology(simple_turtle_file, verify=verify, parser="fast")
+
+    assert len(ontology) == len(reference_ontology)
+    assert dict(ontology.namespaces()) == dict(reference_ontology.namespaces())
+    assert ontology.namespace_manager.graph is ontology
+
+
+def test_sort_ontology_fast_parser_fallback(tmp_dir: Path) -> None:
+    """Ensure content unsupported by the fast parser is parsed with RDFlib."""
+    from turtle_canon.canon import sort_ontology
+
+    turtle_file = tmp_dir / "unsupported.ttl"
+    turtle_file.write_text(
+        "@prefix : <http://example.org/> .\n:a\u00d7b :p :o, :o .\n", encoding="utf8"
+    )
+
+    ontology = sort_ontology(turtle_file, parser="fast")
+    assert len(ontology) == 1
+    assert str(next(iter(ontology))[0]) == "http://example.org/a\u00d7b"
+
+
+def test_sort_ontology_unknown_parser(simple_turtle_file: Path) -> None:
+    """Ensure an unknown parser is not accepted."""
+    from turtle_canon.canon import sort_ontology
+
+    with pytest.raises(ValueError, match="Unknown parser 'some'"):
+        sort_ontology(simple_turtle_file, parser="some")
+
+
+@pytest.mark.parametrize("verify", ["digest", "full", "roundtrip"])
+def test_canonize_canonical_blank_nodes(tmp_dir: Path, verify: str) -> None:
+    """Ensure canonical blank node labels give the same output for every run."""
+    from turtle_canon.canon import canonize, check
+    from turtle_canon.utils.cache import CanonCache
+
+    content = (
+        "@prefix : <http://example.org/> .\n"
+        ":s :p [ :q :o ], [ :q :o2 ], _:shared .\n"
+        ":t :p _:shared .\n"
+        "_:shared :q ( 1 2 ) .\n"
+    )
+    outputs = set()
+    for parser in ("rdflib", "fast", "rdflib"):
+        turtle_file = tmp_dir / "blank_nodes.ttl"
+        turtle_file.write_text(content, encoding="utf8")
+        canonize(turtle_file, verify=verify, parser=parser, canonical_blank_nodes=True)
+        outputs.add(turtle_file.read_bytes())
+    assert len(outputs) == 1
+
+    cache = CanonCache(tmp_dir / "cache")
+    assert check(turtle_file, cache=cache, canonical_blank_nodes=True) is None
+    assert cache.is_canonical(turtle_file.read_bytes(), "canonical-blank-nodes")
+    assert not cache.is_canonical(turtle_file.read_bytes())
+
+
+def test_digest(single_turtle_permutations: list[Path], tmp_dir: Path) -> None:
+    """Ensure the digest only depends on the graph, for both parsers."""
+    import turtle_canon
+    from turtle_canon.canon import canonize, digest
+    from turtle_canon.utils.exceptions import FailedParsingFile
+
+    digests = {
+        digest(turtle_file, parser=parser)
+        for turtle_file in single_turtle_permutations
+        for parser in ("rdflib", "fast")
+    }
+    assert len(digests) == 1
+
+    # Canonizing does not change the graph
+    canonize(single_turtle_permutations[-1])
+    assert turtle_canon.digest(single_turtle_permutations[-1]) in digests
+
+    # Read-only files and N-Triples files are supported, N-Quads files are not
+    ntriples_file = tmp_dir / "digest.nt"
+    ntriples_file.write_text(
+        '<http://example.org/s> <http://example.org/p> "o" .\n', encoding="utf8"
+    )
+    ntriples_file.chmod(0o444)
+    assert digest(ntriples_file) == digest(ntriples_file, parser="rdflib")
+
+    nquads_file = tmp_dir / "digest.nq"
+    nquads_file.write_bytes(ntriples_file.read_bytes())
+    with pytest.raises(FailedParsingFile, match="N-Quads"):
+        digest(nquads_file)
+
+    with pytest.raises(ValueError, match="Unknown parser"):
+        digest(ntriples_file, parser="unknown")
+
+
+@pytest.mark.parametrize("verify", ["none", "count", "digest", "full", "roundtrip"])
+def test_canonize_verify(
+    single_turtle_permutations: list[Path], tmp_dir: Path, verify: str
+) -> None:
+    """Ensure all verification levels give the same result."""
+    import shutil
+
+    from turtle_canon.canon import canonize
+
+    for turtle_file in single_turtle_permutations:
+        reference_file = shutil.copy(turtle_file, tmp_dir / turtle_file.name)
+        canonize(reference_file)
+
+        canonize(turtle_file, verify=verify)
+        assert turtle_file.read_bytes() == reference_file.read_bytes()
+
+
+def test_sort_ontology_unknown_verification_level(simple_turtle_file: Path) -> None:
+    """Ensure an unknown verification level is not accepted."""
+    from turtle_canon.canon import sort_ontology
+
+    with pytest.raises(ValueError, match="Unknown verification level 'some'"):
+        sort_ontology(simple_turtle_file, verify="some")
+
+
+def test_canonize_verify_roundtrip_inconsistency(
+    simple_turtle_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure an exported ontology that does not re-parse to the same graph is caught
+    with the `roundtrip` verification level."""
+    from turtle_canon import canon
+    from turtle_canon.utils.exceptions import InconsistencyError
+
+    original_serialize_ontology = canon._serialize_ontology
+
+    def _serialize_ontology_losing_a_triple(ontology, filename):
+        with original_serialize_ontology(ontology, filename) as canonized:
+            content = b"".join(canonized.chunks())
+        corrupted = canon._CanonizedOutput(filename)
+        corrupted.write(content.replace(b" ;\n    rdfs:subClassOf", b" .\n#"))
+        return corrupted
+
+    monkeypatch.setattr(
+        canon, "_serialize_ontology", _serialize_ontology_losing_a_triple
+    )
+
+    original_content = simple_turtle_file.read_bytes()
+    with pytest.raises(InconsistencyError, match="re-parsing it, inconsistencies"):
+        canon.canonize(simple_turtle_file, verify="roundtrip")
+    assert simple_turtle_file.read_bytes() == original_content
+
+
+def test_check(single_turtle_permutations: list[Path]) -> None:
+    """Ensure `check()` reports non-canonical files without writing to them."""
+    from turtle_canon.canon import canonize, check
+
+    for turtle_file in single_turtle_permutations:
+        original_content = turtle_file.read_bytes()
+        original_mtime = turtle_file.stat().st_mtime_ns
+
+        changed_file = check(turtle_file)
+        assert turtle_file.read_bytes() == original_content
+        assert turtle_file.stat().st_mtime_ns == original_mtime
+
+        assert changed_file == canonize(turtle_file)
+        assert check(turtle_file) is None
+
+
+def test_check_stops_at_first_difference(
+    simple_turtle_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure `check()` stops the serialization at the first difference."""
+    from turtle_canon import canon
+
+    written: list[bytes] = []
+    original_write = canon._ComparingOutput.write
+
+    def _write(self, data: bytes) -> int:
+        written.append(data)
+        return original_write(self, data)
+
+    monkeypatch.setattr(canon._ComparingOutput, "write", _write)
+
+    canon.canonize(simple_turtle_file)
+    assert canon.check(simple_turtle_file) is None
+    number_of_writes = len(written)
+
+    content = simple_turtle_file.read_bytes()
+    simple_turtle_file.write_bytes(content.replace(b" .\n", b" .\n\n", 1))
+    written.clear()
+    assert canon.check(simple_turtle_file) == simple_turtle_file
+    assert 0 < len(written) < number_of_writes
+
+
+@pytest.mark.parametrize("suffix", [".nt", ".nq"])
+def test_canonize_ntriples(
+    simple_turtle_file: Path, tmp_dir: Path, suffix: str
+) -> None:
+    """Test canonizing N-Triples and N-Quads files without building a graph."""
+    from rdflib import Graph
+    from rdflib.compare import isomorphic
+
+    from turtle_canon import canon
+
+    graph = Graph().parse(simple_turtle_file, format="turtle")
+    lines = graph.serialize(format="nt").splitlines(keepends=True)
+    lines = [_ for _ in lines if _.strip()]
+
+    ntriples_file = tmp_dir / f"ontology{suffix}"
+    ntriples_file.write_text("".join(reversed(lines)) + lines[0], encoding="utf8")
+    permuted_file = tmp_dir / f"permuted{suffix}"
+    permuted_file.write_text(
+        "# A comment\n" + "".join(lines[1::2] + lines[::2]), encoding="utf8"
+    )
+
+    assert canon.check(ntriples_file) == ntriples_file
+    assert canon.canonize(ntriples_file) == ntriples_file
+    assert canon.check(ntriples_file) is None
+    assert canon.canonize(ntriples_file) is None
+    assert canon.canonize(permuted_file) == permuted_file
+    assert permuted_file.read_bytes() == ntriples_file.read_bytes()
+
+    canonized = ntriples_file.read_text(encoding="utf8").splitlines()
+    assert canonized == sorted(set(canonized))
+    assert len(canonized) == len(graph)
+    assert isomorphic(graph, Graph().parse(ntriples_file, format="nt"))
+
+
+def test_canonize_ntriples_invalid(tmp_dir: Path) -> None:
+    """Test canonizing invalid, empty and statement-less N-Triples files."""
+    from turtle_canon.canon import canonize
+    from turtle_canon.utils.exceptions import FailedParsingFile
+    from turtle_canon.utils.warnings import EmptyFile, NoTriples
+
+    ntriples_file = tmp_dir / "ontology.nt"
+
+    ntriples_file.write_text("<http://ex.org/a> <http://ex.org/p> .\n", encoding="utf8")
+    with pytest.raises(FailedParsingFile, match="Line 1: Invalid N-Triples"):
+        canonize(ntriples_file)
+
+    ntriples_file.write_text("# Only a comment\n", encoding="utf8")
+    with pytest.raises(NoTriples):
+        canonize(ntriples_file)
+
+    ntriples_file.write_text("", encoding="utf8")
+    with pytest.raises(EmptyFile):
+        canonize(ntriples_file)
+
+
+def test_canonize_ntriples_max_memory(tmp_dir: Path) -> None:
+    """Ensure an external merge sort gives the same result as sorting in memory."""
+    from turtle_canon.canon import canonize, check
+
+    lines = [
+        f"<http://ex.org/c{index % 97}> <http://ex.org/p{index % 3}> "
+        f'"{index % 211}"@en .\n'
+        for index in range(1_000)
+    ]
+    in_memory_file = tmp_dir / "in_memory.nt"
+    in_memory_file.write_text("".join(lines), encoding="utf8")
+    external_file = tmp_dir / "external.nt"
+    external_file.write_text("".join(lines), encoding="utf8")
+
+    assert canonize(in_memory_file) == in_memory_file
+    assert check(external_file, max_memory=2_048) == external_file
+    assert canonize(external_file, max_memory=2_048) == external_file
+    assert external_file.read_bytes() == in_memory_file.read_bytes()
+    assert check(external_file, max_memory=2_048) is None
+    assert sorted(_.name for _ in tmp_dir.iterdir()) == [
+        "external.nt",
+        "in_memory.nt",
+    ]
+
+
+def test_diff(tmp_dir: Path) -> None:
+    """Ensure only changed triples are reported, for both parsers."""
+    from turtle_canon.canon import diff
+
+    old_file = tmp_dir / "old.ttl"
+    old_file.write_text(
+        "@prefix : <http://example.org/> .\n:s :p :o ; :q [ :r :a ], [ :r :b ] .\n",
+        encoding="utf8",
+    )
+    new_file = tmp_dir / "new.ttl"
+    new_file.write_text(
+        "@prefix : <http://example.org/> .\n:s :q [ :r :b ], [ :r :c ] ; :p :o .\n",
+        encoding="utf8",
+    )
+
+    for parser in ("rdflib", "fast"):
+        assert not list(diff(old_file, old_file, parser=parser))
+
+        # The blank nodes `[ :r :b ]` are the same, the others are not
+        differences = [
+            (marker, predicate.n3(), object_.n3())
+            for marker, (_, predicate, object_) in diff(
+                old_file, new_file, parser=parser
+            )
+        ]
+        assert len(differences) == 4
+        assert ("-", "<http://example.org/r>", "<http://example.org/a>") in differences
+        assert ("+", "<http://example.org/r>", "<http://example.org/c>") in differences
+        assert sorted(
+            marker
+            for marker, predicate, _ in differences
+            if predicate == "<http://example.org/q>"
+        ) == ["+", "-"]
+
+
+@pytest.mark.parametrize("verify", ["none", "digest", "roundtrip"])
+def test_canonize_in_memory(
+    single_turtle_permutations: list[Path], tmp_dir: Path, verify: str
+) -> None:
+    """Ensure in-memory canonization gives the same output as `canonize()`."""
+    import shutil
+
+    from turtle_canon.canon import canonize, canonize_bytes, canonize_text
+
+    reference_file = shutil.copy(
+        single_turtle_permutations[0], tmp_dir / single_turtle_permutations[0].name
+    )
+    canonize(reference_file)
+    reference = reference_file.read_bytes()
+
+    for turtle_file in single_turtle_permutations:
+        content = turtle_file.read_bytes()
+        for parser in ("rdflib", "fast"):
+            assert canonize_bytes(content, verify=verify, parser=parser) == reference
+        assert canonize_text(content.decode("utf8"), verify=verify) == (
+            reference.decode("utf8")
+        )
+        # The file is not touched
+        assert turtle_file.read_bytes() == content
+
+
+def test_canonize_in_memory_invalid() -> None:
+    """Ensure invalid in-memory content raises the same as invalid files."""
+    from turtle_canon.canon import canonize_bytes
+    from turtle_canon.utils.exceptions import FailedParsingFile, FailedReadingFile
+    from turtle_canon.utils.warnings import EmptyFile, NoTriples
+
+    with pytest.raises(EmptyFile):
+        canonize_bytes(b"")
+    with pytest.raises(NoTriples):
+        canonize_bytes(b"# Only a comment\n")
+    with pytest.raises(FailedReadingFile):
+        canonize_bytes("<a> <b> 'æ' .".encode("latin1"))
+    with pytest.raises(FailedParsingFile, match="Turtle content"):
+        canonize_bytes(b"not turtle")
+
+
+@pytest.mark.parametrize("verify", ["digest", "roundtrip"])
+def test_canonize_metrics(simple_turtle_file: Path, tmp_dir: Path, verify: str) -> None:
+    """Ensure the metrics of each stage are recorded."""
+
+    from turtle_canon.canon import canonize, check
+    from turtle_canon.utils.cache import CanonCache
+    from turtle_canon.utils.metrics import STAGES, Metrics
+
+    cache = CanonCache(tmp_dir / "cache")
+    content = simple_turtle_file.read_bytes()
+
+    metrics = Metrics(simple_turtle_file)
+    assert check(simple_turtle_file, cache=cache, verify=verify, metrics=metrics)
+    # Nothing is written when checking a file that is not canonical
+    assert set(metrics.stages) == set(STAGES) - {"write"}
+    assert metrics.input_bytes == len(content)
+    assert metrics.triples == 13
+
+    metrics = Metrics(simple_turtle_file)
+    assert canonize(simple_turtle_file, cache=cache, verify=verify, metrics=metrics)
+    assert set(metrics.stages) == set(STAGES)
+    assert metrics.output_bytes == len(simple_turtle_file.read_bytes())
+    assert not metrics.cached
+
+    metrics = Metrics(simple_turtle_file)
+    assert canonize(simple_turtle_file, cache=cache, metrics=metrics) is None
+    assert metrics.cached
+    assert list(metrics.stages) == ["validate"]
+
+    ntriples_file = tmp_dir / "ontology.nt"
+    ntriples_file.write_text("<a:s> <a:p> <a:o> .\n<a:s> <a:p> <a:o> .\n")
+    metrics = Metrics(ntriples_file)
+    assert canonize(ntriples_file, metrics=metrics)
+    assert list(metrics.stages) == ["validate", "sort", "write"]
+    assert metrics.triples == 1
+    assert metrics.output_bytes == len(ntriples_file.read_bytes())
@@ -223,3 +223,22 @@ def test_different_sources(different_sources_ontologies: list[Path]) -> None:
             pytest.fail(
                 f"Failed canonizing file from source {source}.\n\nException:\n{exc}"
             )
+
+
+def test_cache(simple_turtle_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure already canonical content found in the cache is not parsed again."""
+    from turtle_canon import canon
+    from turtle_canon.utils.cache import CanonCache
+
+    cache = CanonCache(simple_turtle_file.parent / ".turtle_canon_cache")
+
+    assert canon.canonize(simple_turtle_file, cache=cache) == simple_turtle_file
+    canonized_content = simple_turtle_file.read_text(encoding="utf8")
+    assert cache.is_canonical(simple_turtle_file.read_bytes())
+
+    def _fail(*_, **__):
+        pytest.fail("The cached canonical file was parsed again !")
+
+    monkeypatch.setattr(canon, "sort_ontology", _fail)
+    assert canon.canonize(simple_turtle_file, cache=cache) is None
+    assert simple_turtle_file.read_text(encoding="utf8") == canonized_content
@@ -0,0 +1,89 @@
+"""Test `turtle_canon.utils.blank_nodes`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rdflib import Graph
+
+CONTENT = """
+    @prefix : <http://example.org/> .
+    @prefix owl: <http://www.w3.org/2002/07/owl#> .
+    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+    :A rdfs:subClassOf [ a owl:Restriction ; owl:onProperty :p ; owl:allValuesFrom :B ],
+            [ a owl:Restriction ; owl:onProperty :q ; owl:someValuesFrom :B ],
+            [ a owl:Restriction ; owl:onProperty :dup ; owl:hasValue 1 ],
+            [ a owl:Restriction ; owl:onProperty :dup ; owl:hasValue 1 ] ;
+        owl:equivalentClass [ owl:intersectionOf ( :B [ owl:unionOf ( :C :D ) ] ) ] .
+    :B owl:equivalentClass [ owl:intersectionOf ( :B [ owl:unionOf ( :C :D ) ] ) ] .
+    :C :list ( 1 1 1 1 ) .
+    [] a owl:AllDisjointClasses ; owl:members ( :A :B :C ) .
+    _:x :p _:y . _:y :p _:x .
+    _:z :p _:z .
+"""
+
+
+def _relabelled(graph: Graph) -> set:
+    """Intern the triples of a graph in random order and relabel the blank nodes."""
+    import random
+
+    from turtle_canon.utils.store import InternedTriples
+
+    triples = list(graph)
+    random.shuffle(triples)
+    return set(InternedTriples(triples).canonicalize_blank_nodes())
+
+
+def test_canonical_labels() -> None:
+    """Ensure the labels only depend on the triples, not on parsing or order."""
+    from rdflib import BNode, Graph
+    from rdflib.compare import isomorphic
+
+    graph = Graph().parse(data=CONTENT, format="turtle")
+    relabelled = _relabelled(graph)
+
+    for _ in range(5):
+        assert _relabelled(Graph().parse(data=CONTENT, format="turtle")) == relabelled
+
+    # The relabelling keeps all blank nodes apart
+    relabelled_graph = Graph()
+    for triple in relabelled:
+        relabelled_graph.add(triple)
+    assert isomorphic(relabelled_graph, graph)
+    assert len(
+        {_ for triple in relabelled for _ in triple if isinstance(_, BNode)}
+    ) == len({_ for triple in graph for _ in triple if isinstance(_, BNode)})
+
+
+def test_canonical_labels_depend_on_content() -> None:
+    """Ensure blank nodes in different contexts get different labels."""
+    from rdflib import BNode, Graph
+
+    def labels(content: str) -> set[BNode]:
+        """The canonical labels of the blank nodes in some content."""
+        graph = Graph().parse(data=content, format="turtle")
+        return {
+            _ for triple in _relabelled(graph) for _ in triple if isinstance(_, BNode)
+        }
+
+    prefix = "@prefix : <http://example.org/> .\n"
+    restriction = labels(f"{prefix}:A :p [ :q :B ] .")
+    assert len(restriction) == 1
+    assert labels(f"{prefix}:A :p [ :q :B ] .") == restriction
+    assert labels(f"{prefix}:A :p [ :q :C ] .") != restriction
+    assert labels(f"{prefix}:A :r [ :q :B ] .") != restriction
+    # Adding unrelated blank nodes does not change the label
+    assert restriction < labels(f"{prefix}:A :p [ :q :B ] . :C :p [ :q :D ] .")
+
+
+def test_no_blank_nodes() -> None:
+    """Ensure triples without blank nodes are left as they are."""
+    from rdflib import URIRef
+
+    from turtle_canon.utils.blank_nodes import canonical_blank_node_labels
+    from turtle_canon.utils.store import InternedTriples
+
+    triples = InternedTriples([(URIRef("http://example.org/s"),) * 3])
+    assert canonical_blank_node_labels(triples.terms, triples.columns) == {}
@@ -0,0 +1,162 @@
+"""Test `turtle_canon.utils.cache`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_is_canonical(tmp_dir: Path) -> None:
+    """Test recording and looking up content."""
+    from turtle_canon.utils.cache import CanonCache
+
+    cache = CanonCache(tmp_dir / "cache")
+    assert not cache.is_canonical(b"content")
+    assert not cache.directory.exists()
+
+    cache.add(b"content")
+    assert cache.is_canonical(b"content")
+    assert not cache.is_canonical(b"other content")
+    assert len(cache) == 1
+    assert (cache.directory / ".gitignore").exists()
+
+    # The cache is shared with other instances using the same directory
+    assert CanonCache(tmp_dir / "cache").is_canonical(b"content")
+
+    cache.clear()
+    assert not cache.is_canonical(b"content")
+    assert len(cache) == 0
+
+
+def test_key_depends_on_versions(
+    tmp_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure the cache is invalidated by a new Turtle Canon version."""
+    import turtle_canon
+    from turtle_canon.utils.cache import CanonCache
+
+    cache = CanonCache(tmp_dir)
+    cache.add(b"content")
+
+    monkeypatch.setattr(turtle_canon, "__version__", "0.0.0")
+    assert not CanonCache(tmp_dir).is_canonical(b"content")
+
+
+def test_key_depends_on_variant(tmp_dir: Path) -> None:
+    """Ensure content is only canonical for the variant it was recorded for."""
+    from turtle_canon.utils.cache import CanonCache
+
+    cache = CanonCache(tmp_dir)
+    cache.add(b"content", "variant")
+    assert cache.is_canonical(b"content", "variant")
+    assert not cache.is_canonical(b"content")
+    assert not cache.is_canonical(b"content", "other variant")
+
+
+def test_lru_eviction(tmp_dir: Path) -> None:
+    """Ensure the least recently used entries are evicted."""
+    import os
+
+    from turtle_canon.utils.cache import CanonCache
+
+    cache = CanonCache(tmp_dir, max_entries=2)
+
+    for age, content in enumerate((b"first", b"second")):
+        cache.add(content)
+        # Make entries distinguishable in time, most recent last
+        entry = tmp_dir / cache.key(content)[:2] / cache.key(content)
+        os.utime(entry, (1_000 + age, 1_000 + age))
+
+    # Use the oldest entry, making "second" the least recently used
+    assert cache.is_canonical(b"first")
+
+    cache.add(b"third")
+    assert len(cache) == 2
+    assert cache.is_canonical(b"first")
+    assert cache.is_canonical(b"third")
+    assert not cache.is_canonical(b"second")
+
+
+def test_number_of_entries(tmp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure recording entries does not count all entries, unless their number is
+    unknown or exceeds `max_entries`."""
+    from turtle_canon.utils.cache import CanonCache
+
+    cache = CanonCache(tmp_dir / "cache", max_entries=3)
+    cache.add(b"first")
+    count_file = cache.directory / ".count"
+    assert count_file.read_text(encoding="utf8") == "1"
+
+    counted: list[int] = []
+    original_entries = CanonCache._entries
+
+    def _counting_entries(self: CanonCache) -> list:
+        entries = original_entries(self)
+        counted.append(len(entries))
+        return entries
+
+    monkeypatch.setattr(CanonCache, "_entries", _counting_entries)
+
+    for content in (b"second", b"third"):
+        CanonCache(cache.directory, max_entries=3).add(content)
+    assert count_file.read_text(encoding="utf8") == "3"
+    assert not counted
+
+    # An entry beyond `max_entries` evicts the least recently used entries
+    cache.add(b"fourth")
+    assert counted == [4]
+    assert count_file.read_text(encoding="utf8") == "3"
+
+    # A missing or invalid number of entries is recovered by counting the entries
+    count_file.write_text("invalid", encoding="utf8")
+    cache.add(b"fifth")
+    assert counted == [4, 4, 4]
+    assert count_file.read_text(encoding="utf8") == "3"
+    assert len(cache) == 3
+
+    cache.clear()
+    assert count_file.read_text(encoding="utf8") == "0"
+
+
+def test_invalid_max_entries() -> None:
+    """Ensure `max_entries` must be positive."""
+    from turtle_canon.utils.cache import CanonCache
+
+    with pytest.raises(ValueError, match="max_entries must be a positive integer"):
+        CanonCache(max_entries=0)
+
+
+def test_memory_cache(tmp_dir: Path) -> None:
+    """Test the in-memory cache, with and without a persistent cache behind it."""
+    from turtle_canon.utils.cache import CanonCache, MemoryCanonCache
+
+    cache = MemoryCanonCache(max_entries=2)
+    cache.add(b"first")
+    cache.add(b"second")
+    assert cache.is_canonical(b"first")
+    cache.add(b"third")
+    # The least recently used content is evicted
+    assert not cache.is_canonical(b"second")
+    assert cache.is_canonical(b"first")
+    assert cache.is_canonical(b"third")
+    assert len(cache) == 2
+    assert cache.key(b"first") == CanonCache(tmp_dir).key(b"first")
+
+    backing = CanonCache(tmp_dir / "cache")
+    backing.add(b"persistent")
+    cache = MemoryCanonCache(backing=backing)
+    assert cache.is_canonical(b"persistent")
+    assert len(cache) == 1
+    cache.add([b"new ", b"content"], "variant")
+    assert backing.is_canonical(b"new content", "variant")
+
+    cache.clear()
+    assert not len(cache)
+    assert cache.is_canonical(b"new content", "variant")
+
+    with pytest.raises(ValueError, match="max_entries"):
+        MemoryCanonCache(max_entries=0)
@@ -0,0 +1,52 @@
+"""Test `turtle_canon.utils.diff`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from turtle_canon.utils.store import InternedTriples
+
+
+def _triples(content: str) -> InternedTriples:
+    """Parse Turtle content into interned triples, with canonical blank nodes."""
+    from rdflib import Graph
+
+    from turtle_canon.utils.store import InternedTriples
+
+    return InternedTriples(
+        Graph().parse(data=content, format="turtle")
+    ).canonicalize_blank_nodes()
+
+
+def test_diff_triples() -> None:
+    """Ensure removed and added triples are found, in sorted order."""
+    from decimal import Decimal
+
+    from rdflib import Literal, URIRef
+
+    from turtle_canon.utils.diff import ADDED, REMOVED, diff_triples
+
+    old = _triples("""
+        @prefix ex: <http://example.org/> .
+        ex:s ex:p ex:o, 1, "1"^^<http://www.w3.org/2001/XMLSchema#double> .
+        ex:t ex:p ex:o, [ ex:q ex:o ] .
+        """)
+    new = _triples("""
+        @prefix ex: <http://example.org/> .
+        ex:u ex:p ex:o .
+        ex:t ex:p ex:o, [ ex:q ex:o ] .
+        ex:s ex:p ex:o, 1.0, "1"^^<http://www.w3.org/2001/XMLSchema#double> .
+        """)
+
+    ex = "http://example.org/"
+    differences = list(diff_triples(old, new))
+    assert differences == [
+        (ADDED, (URIRef(f"{ex}s"), URIRef(f"{ex}p"), Literal(Decimal("1.0")))),
+        (REMOVED, (URIRef(f"{ex}s"), URIRef(f"{ex}p"), Literal(1))),
+        (ADDED, (URIRef(f"{ex}u"), URIRef(f"{ex}p"), URIRef(f"{ex}o"))),
+    ]
+
+    assert not list(diff_triples(old, old))
+    assert list(diff_triples(old, _triples(""))) == [(REMOVED, _) for _ in old.sort()]
+    assert list(diff_triples(_triples(""), new)) == [(ADDED, _) for _ in new.sort()]
@@ -0,0 +1,45 @@
+"""Test `turtle_canon.utils.digest`."""
+
+from __future__ import annotations
+
+
+def _triples(content: str) -> list:
+    """Parse Turtle content into a list of triples."""
+    from rdflib import Graph
+
+    return list(Graph().parse(data=content, format="turtle"))
+
+
+def test_digest_triples_order_independent() -> None:
+    """Ensure the digest does not depend on the order of the triples."""
+    from turtle_canon.utils.digest import digest_triples
+
+    triples = _triples("""
+        @prefix ex: <http://example.org/> .
+        ex:s ex:p ex:o, "literal"@en, 1 ; ex:q ex:r .
+        """)
+    digest = digest_triples(triples)
+    assert len(digest) == 64
+    assert int(digest, 16)
+    assert digest_triples(reversed(triples)) == digest
+    assert digest_triples(triples + triples[:2]) == digest
+    assert digest_triples(triples[1:]) != digest
+    assert digest_triples([]) == "0" * 64
+
+    # Distinct triples give the same digest without keeping their hashes
+    assert digest_triples(triples, distinct=True) == digest
+    assert digest_triples(triples + triples[:2], distinct=True) != digest
+
+
+def test_digest_triples_blank_nodes() -> None:
+    """Ensure the digest does not depend on the identifiers of blank nodes."""
+    from turtle_canon.utils.digest import digest_triples
+
+    content = """
+        @prefix ex: <http://example.org/> .
+        ex:s ex:p [ ex:q ex:o ], [ ex:q ex:o2 ; ex:r ( 1 2 ) ] .
+        """
+    digest = digest_triples(_triples(content))
+    assert digest_triples(_triples(content)) == digest
+    assert digest_triples(reversed(_triples(content))) == digest
+    assert digest_triples(_triples(content.replace("ex:o2", "ex:o3"))) != digest
@@ -0,0 +1,96 @@
+"""Test `turtle_canon.utils.discovery`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def tree(tmp_dir: Path) -> Path:
+    """Create a tree of files in a Git repository, returning its top-level directory."""
+    for name in (
+        "a.ttl",
+        "b.TTL",
+        "notes.md",
+        "ontologies/c.ttl",
+        "ontologies/generated/d.ttl",
+        "ontologies/keep/generated/e.ttl",
+        "vendor/f.ttl",
+        "vendor/sub/g.ttl",
+        ".hidden/h.ttl",
+        "ignored.ttl",
+    ):
+        path = tmp_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# {name}\n")
+    (tmp_dir / ".git" / "info").mkdir(parents=True)
+    (tmp_dir / ".git" / "info" / "exclude").write_text("ignored.ttl\n")
+    (tmp_dir / ".gitignore").write_text("# Generated files\ngenerated/\n")
+    (tmp_dir / "ontologies" / "keep" / ".gitignore").write_text("!generated/\n")
+    return tmp_dir
+
+
+def test_discover(tree: Path) -> None:
+    """Ensure directories are walked recursively, respecting `.gitignore` files."""
+    from turtle_canon.utils.discovery import discover
+
+    assert list(discover([tree])) == [
+        tree / "a.ttl",
+        tree / "ontologies" / "c.ttl",
+        tree / "ontologies" / "keep" / "generated" / "e.ttl",
+        tree / "vendor" / "f.ttl",
+        tree / "vendor" / "sub" / "g.ttl",
+    ]
+    assert list(discover([tree], gitignore=False)) == [
+        tree / "a.ttl",
+        tree / "ignored.ttl",
+        tree / "ontologies" / "c.ttl",
+        tree / "ontologies" / "generated" / "d.ttl",
+        tree / "ontologies" / "keep" / "generated" / "e.ttl",
+        tree / "vendor" / "f.ttl",
+        tree / "vendor" / "sub" / "g.ttl",
+    ]
+
+    # The `.gitignore` files of parent directories are respected as well
+    assert list(discover([tree / "ontologies"])) == [
+        tree / "ontologies" / "c.ttl",
+        tree / "ontologies" / "keep" / "generated" / "e.ttl",
+    ]
+
+
+def test_discover_patterns(tree: Path) -> None:
+    """Test including and excluding files and directories by patterns."""
+    from turtle_canon.utils.discovery import discover
+
+    included = discover(
+        [tree], include=["*.ttl", "*.TTL"], exclude=["vendor/**", "c.ttl"]
+    )
+    assert list(included) == [
+        tree / "a.ttl",
+        tree / "b.TTL",
+        tree / "ontologies" / "keep" / "generated" / "e.ttl",
+    ]
+    assert list(discover([tree], include=["ontologies/**/*.ttl"])) == [
+        tree / "ontologies" / "c.ttl",
+        tree / "ontologies" / "keep" / "generated" / "e.ttl",
+    ]
+    assert list(discover([tree], include=["[a-b].*"], exclude=["vendor/"])) == [
+        tree / "a.ttl",
+        tree / "b.TTL",
+    ]
+
+    # Files are yielded as given, independent of the patterns
+    assert list(
+        discover(
+            [tree / "notes.md", tree / "missing.ttl", tree / "vendor"], exclude=["sub"]
+        )
+    ) == [
+        tree / "notes.md",
+        tree / "missing.ttl",
+        tree / "vendor" / "f.ttl",
+    ]
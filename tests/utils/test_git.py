@@ -0,0 +1,101 @@
+"""Test `turtle_canon.utils.git`."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@pytest.fixture
+def git_repository(
+    tmp_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> Callable[..., None]:
+    """Create a Git repository with a commit, and return a function running Git in it.
+
+    The repository is the current working directory.
+    """
+    from subprocess import run
+
+    def git(*args: str) -> None:
+        """Run a Git command in the repository."""
+        run(
+            [
+                "git",
+                "-c",
+                "user.name=Turtle Canon",
+                "-c",
+                "user.email=turtle@canon.test",
+                *args,
+            ],
+            check=True,
+            capture_output=True,
+            cwd=tmp_dir,
+        )
+
+    (tmp_dir / "ontologies").mkdir()
+    for name in ("unchanged", "modified", "renamed", "deleted"):
+        (tmp_dir / "ontologies" / f"{name}.ttl").write_text(f"# {name}\n")
+    (tmp_dir / "README.md").write_text("# Ontologies\n")
+    (tmp_dir / ".gitignore").write_text("ignored.ttl\n")
+    git("init", "--quiet")
+    git("add", ".")
+    git("commit", "--quiet", "-m", "Initial commit")
+
+    monkeypatch.chdir(tmp_dir)
+    return git
+
+
+def test_changed_files(
+    git_repository: Callable[..., None],
+    tmp_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure only the added, modified and renamed Turtle files are listed."""
+    from turtle_canon.utils.git import changed_files
+
+    ontologies = Path("ontologies")
+    (ontologies / "modified.ttl").write_text("# modified\n# more\n")
+    (ontologies / "deleted.ttl").unlink()
+    git_repository("mv", "ontologies/renamed.ttl", "ontologies/new_name.ttl")
+    (ontologies / "added.ttl").write_text("# added\n")
+    git_repository("add", "ontologies/added.ttl")
+    (ontologies / "untracked.ttl").write_text("# untracked\n")
+    (ontologies / "ignored.ttl").write_text("# ignored\n")
+    Path("README.md").write_text("# Changed\n")
+
+    assert changed_files("HEAD") == [
+        ontologies / "added.ttl",
+        ontologies / "modified.ttl",
+        ontologies / "new_name.ttl",
+    ]
+    assert changed_files("HEAD", untracked=True) == [
+        ontologies / "added.ttl",
+        ontologies / "modified.ttl",
+        ontologies / "new_name.ttl",
+        ontologies / "untracked.ttl",
+    ]
+    assert changed_files("HEAD", [ontologies / "modified.ttl"]) == [
+        ontologies / "modified.ttl"
+    ]
+
+    # The files are relative to the current working directory
+    monkeypatch.chdir(tmp_dir / "ontologies")
+    assert changed_files("HEAD", [Path("modified.ttl")]) == [Path("modified.ttl")]
+    assert changed_files("HEAD", [Path("..")], untracked=True)[-1] == Path(
+        "untracked.ttl"
+    )
+
+
+@pytest.mark.usefixtures("git_repository")
+def test_changed_files_invalid() -> None:
+    """Ensure Git's failures are raised as `GitError`."""
+    from turtle_canon.utils.exceptions import GitError
+    from turtle_canon.utils.git import changed_files
+
+    with pytest.raises(GitError, match="no-such-revision"):
+        changed_files("no-such-revision")
@@ -0,0 +1,46 @@
+"""Test `turtle_canon.utils.metrics`."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def test_stage() -> None:
+    """Ensure the time of a stage is added up, even if it raises."""
+    from turtle_canon.utils.metrics import Metrics
+
+    metrics = Metrics("ontology.ttl")
+    with metrics.stage("parse"):
+        pass
+    first = metrics.stages["parse"]
+    with pytest.raises(ValueError, match="Failed"), metrics.stage("parse"):
+        raise ValueError("Failed")
+
+    assert metrics.stages["parse"] >= first
+    assert metrics.total == metrics.stages["parse"]
+    assert list(metrics.as_dict()["stages"]) == ["parse"]
+
+
+def test_summarize() -> None:
+    """Test summarizing the metrics of several files."""
+    from turtle_canon.utils.metrics import STAGES, Metrics, summarize
+
+    metrics = [Metrics("a.ttl"), Metrics("b.ttl")]
+    for triples, file_metrics in enumerate(metrics, start=1):
+        file_metrics.triples = 1000 * triples
+        file_metrics.input_bytes = 1024**2 * triples
+        file_metrics.peak_rss = triples
+        file_metrics.stages = {"parse": 0.5, "write": 0.25}
+    metrics[1].changed = True
+
+    summary = summarize(metrics, wall_time=2.0)
+    assert summary["files"] == 2
+    assert summary["changed"] == 1
+    assert summary["triples"] == 3000
+    assert summary["peak_rss"] == 2
+    assert summary["stages"] == {
+        stage: {"parse": 1.0, "write": 0.5}.get(stage, 0.0) for stage in STAGES
+    }
+    assert summary["triples_per_second"] == 1500
+    assert summary["megabytes_per_second"] == 1.5
+    assert summarize([], wall_time=0.0)["triples_per_second"] is None
@@ -0,0 +1,141 @@
+"""Test `turtle_canon.utils.ntriples`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        (
+            "<http://ex.org/a>   <http://ex.org/p>\t<http://ex.org/b>.  # comment\r\n",
+            "<http://ex.org/a> <http://ex.org/p> <http://ex.org/b> .",
+        ),
+        (
+            r'_:b0 <http://ex.org/p> "æ\U0001F422\t\'\"\\\b\u0001\u007F" .',
+            '_:b0 <http://ex.org/p> "æ\U0001f422\\t\'\\"\\\\\\b\\u0001\\u007F" .',
+        ),
+        (
+            "<http://ex.org/a\\u0020b\\u00E6> <http://ex.org/p> _:b.1 .\n",
+            "<http://ex.org/a\\u0020bæ> <http://ex.org/p> _:b.1 .",
+        ),
+        (
+            '<http://ex.org/a> <http://ex.org/p> "chat"@EN-gb .',
+            '<http://ex.org/a> <http://ex.org/p> "chat"@en-gb .',
+        ),
+        (
+            (
+                '<http://ex.org/a> <http://ex.org/p> "s"^^'
+                "<http://www.w3.org/2001/XMLSchema#string> ."
+            ),
+            '<http://ex.org/a> <http://ex.org/p> "s" .',
+        ),
+        (
+            (
+                '<http://ex.org/a> <http://ex.org/p> "1"^^'
+                "<http://www.w3.org/2001/XMLSchema#integer> ."
+            ),
+            (
+                '<http://ex.org/a> <http://ex.org/p> "1"^^'
+                "<http://www.w3.org/2001/XMLSchema#integer> ."
+            ),
+        ),
+        ("   # comment only\n", None),
+        ("\r\n", None),
+    ],
+)
+def test_normalize_line(line: str, expected: str | None) -> None:
+    """Test normalizing N-Triples lines."""
+    from turtle_canon.utils.ntriples import normalize_line
+
+    assert normalize_line(line) == expected
+    if expected is not None:
+        assert normalize_line(expected) == expected
+
+
+def test_normalize_line_quads() -> None:
+    """Test normalizing N-Quads lines."""
+    from turtle_canon.utils.ntriples import normalize_line
+
+    quad = "<http://ex.org/a> <http://ex.org/p> <http://ex.org/b>  _:g1 ."
+    assert (
+        normalize_line(quad, quads=True)
+        == "<http://ex.org/a> <http://ex.org/p> <http://ex.org/b> _:g1 ."
+    )
+    with pytest.raises(ValueError, match="Invalid N-Triples"):
+        normalize_line(quad)
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "<http://ex.org/a> <http://ex.org/p> .",
+        "<http://ex.org/a> <http://ex.org/p> <http://ex.org/b>",
+        '"a" <http://ex.org/p> <http://ex.org/b> .',
+        "<http://ex.org/a> _:p <http://ex.org/b> .",
+        "<http://ex.org/a b> <http://ex.org/p> <http://ex.org/b> .",
+        '<http://ex.org/a> <http://ex.org/p> "\\x" .',
+        "_:b. <http://ex.org/p> <http://ex.org/b> .",
+    ],
+)
+def test_normalize_line_invalid(line: str) -> None:
+    """Test normalizing invalid N-Triples lines."""
+    from turtle_canon.utils.ntriples import normalize_line
+
+    with pytest.raises(ValueError, match="Invalid N-Triples"):
+        normalize_line(line)
+
+
+def test_normalize_lines_sort_lines() -> None:
+    """Test normalizing, sorting and de-duplicating lines."""
+    from turtle_canon.utils.ntriples import normalize_lines, sort_lines
+
+    lines = [
+        "<http://ex.org/b> <http://ex.org/p> <http://ex.org/æ> .\n",
+        "# comment\n",
+        "<http://ex.org/b>  <http://ex.org/p> <http://ex.org/\\u00E6> .\n",
+        "<http://ex.org/b> <http://ex.org/p> <http://ex.org/z> .\n",
+        "<http://ex.org/a> <http://ex.org/p> <http://ex.org/b> .\n",
+    ]
+    assert list(sort_lines(normalize_lines(lines))) == [
+        "<http://ex.org/a> <http://ex.org/p> <http://ex.org/b> .",
+        "<http://ex.org/b> <http://ex.org/p> <http://ex.org/z> .",
+        "<http://ex.org/b> <http://ex.org/p> <http://ex.org/æ> .",
+    ]
+
+    with pytest.raises(ValueError, match=r"^Line 2: Invalid N-Triples"):
+        list(normalize_lines([lines[0], "<http://ex.org/a> ."]))
+
+
+@pytest.mark.parametrize("max_merge_runs", [2, 64])
+def test_sort_lines_external(
+    tmp_dir: Path, monkeypatch: pytest.MonkeyPatch, max_merge_runs: int
+) -> None:
+    """Test sorting lines with an external merge sort."""
+    import random
+
+    from turtle_canon.utils import ntriples
+
+    monkeypatch.setattr(ntriples, "MAX_MERGE_RUNS", max_merge_runs)
+
+    random.seed(0)
+    prefixes = ["æ", "a", "\U0001f422"]
+    statements = [
+        f"<http://ex.org/{random.randint(0, 500)}> <http://ex.org/p> "
+        f'"{random.choice(prefixes)}{random.randint(0, 50)}" .'
+        for _ in range(2_000)
+    ]
+    expected = sorted(set(statements))
+    assert len(expected) < len(statements)
+
+    sorted_statements = ntriples.sort_lines(
+        statements, max_memory=4_096, directory=tmp_dir
+    )
+    assert list(sorted_statements) == expected
+    assert not list(tmp_dir.iterdir())
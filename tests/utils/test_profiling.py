@@ -0,0 +1,47 @@
+"""Test `turtle_canon.utils.profiling`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_profile(simple_turtle_file: Path, tmp_dir: Path) -> None:
+    """Ensure the statistics of the profiled code are written to a file."""
+    import pstats
+
+    from turtle_canon.canon import canonize
+    from turtle_canon.utils.profiling import profile
+
+    output = tmp_dir / "profiles" / "ontology.pstats"
+    with profile(output):
+        canonize(simple_turtle_file)
+
+    stats = pstats.Stats(str(output))
+    assert any(
+        function == "canonize" for _, _, function in stats.stats  # type: ignore[attr-defined]
+    )
+
+
+def test_trace_memory(simple_turtle_file: Path) -> None:
+    """Ensure the peak and the allocation sites are recorded at the stages of
+    canonizing a Turtle file."""
+    import tracemalloc
+
+    from turtle_canon.canon import canonize
+    from turtle_canon.utils.metrics import Metrics
+    from turtle_canon.utils.profiling import checkpoint, trace_memory
+
+    # Checkpoints are no-ops without any memory trace
+    checkpoint()
+
+    with trace_memory(limit=3) as trace:
+        canonize(simple_turtle_file, metrics=Metrics(simple_turtle_file))
+    assert not tracemalloc.is_tracing()
+
+    assert trace.peak >= trace.current > 0
+    assert len(trace.top) == 3
+    assert all(size > 0 and count > 0 for _, size, count in trace.top)
+    assert trace.as_dict()["top"][0]["location"] == trace.top[0][0]
@@ -0,0 +1,140 @@
+"""Test `turtle_canon.utils.sorting`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_sort_triples_static_files(top_dir: Path) -> None:
+    """Ensure the triples in all static test files are sorted as `sorted()` does."""
+    from rdflib import Graph
+
+    from turtle_canon.utils.sorting import sort_triples
+
+    turtle_files = list((top_dir / "tests" / "static").rglob("*.ttl"))
+    assert turtle_files
+
+    for turtle_file in turtle_files:
+        triples = list(Graph().parse(turtle_file, format="turtle"))
+        assert sort_triples(triples) == sorted(triples), turtle_file
+
+
+@pytest.mark.parametrize(
+    "extra_literals",
+    [
+        [],
+        # Several numeric datatypes are compared by value across datatypes
+        [("1.5", "decimal"), ("2", "int"), ("2.5", "double")],
+        # A non-numeric datatype is ordered in between the numeric datatypes
+        [("1.5", "decimal"), ("2.5", "float"), ("P1D", "duration")],
+        # Ill-typed literals cannot be compared by value
+        [("not a number", "integer")],
+    ],
+    ids=[
+        "single numeric datatype",
+        "several numeric datatypes",
+        "interleaved numeric datatypes",
+        "ill-typed",
+    ],
+)
+def test_sort_triples_literals(extra_literals: list[tuple[str, str]]) -> None:
+    """Ensure literals are sorted as `sorted()` does."""
+    import warnings
+    from random import Random
+
+    from rdflib import XSD, BNode, Literal, URIRef
+
+    from turtle_canon.utils.sorting import sort_triples
+    from turtle_canon.utils.store import InternedTriples
+
+    literals = [
+        Literal("b"),
+        Literal("a"),
+        Literal("a", datatype=XSD.string),
+        Literal("a", lang="en"),
+        Literal("a", lang="de"),
+        Literal("true", datatype=XSD.boolean),
+        Literal("0", datatype=XSD.boolean),
+        Literal("10", datatype=XSD.integer),
+        Literal("9", datatype=XSD.integer),
+        Literal("09", datatype=XSD.integer),
+        Literal("2021-01-01", datatype=XSD.date),
+        Literal("x", datatype=URIRef("http://example.org/datatype")),
+    ]
+    with warnings.catch_warnings():
+        # RDFlib warns about ill-typed literals
+        warnings.simplefilter("ignore")
+        literals.extend(
+            Literal(lexical, datatype=XSD[datatype])
+            for lexical, datatype in extra_literals
+        )
+
+    subjects = [URIRef("http://example.org/b"), URIRef("http://example.org/a")]
+    triples = [
+        (subject, URIRef("http://example.org/p"), object_)
+        for subject in subjects
+        for object_ in [*literals, BNode("b1"), URIRef("http://example.org/o")]
+    ]
+    triples.append((BNode("b2"), URIRef("http://example.org/p"), literals[0]))
+
+    Random(42).shuffle(triples)
+    assert sort_triples(triples) == sorted(triples)
+
+    # Triples RDFlib considers neither less nor greater than each other are ordered
+    # independently of the order they are given in
+    interned_triples = list(InternedTriples(triples).sort())
+    assert sorted(interned_triples) == interned_triples
+    Random(1).shuffle(triples)
+    assert list(InternedTriples(triples).sort()) == interned_triples
+
+
+def test_rank_terms() -> None:
+    """Test ranking distinct terms."""
+    from rdflib import XSD, BNode, Graph, Literal, URIRef
+    from rdflib.graph import QuotedGraph
+
+    from turtle_canon.utils.sorting import rank_terms
+
+    terms = [
+        Literal("2", datatype=XSD.integer),
+        URIRef("http://example.org/b"),
+        Literal("2", datatype=XSD.int),
+        BNode("b"),
+        Literal("a"),
+        URIRef("http://example.org/a"),
+    ]
+    assert rank_terms(terms) == [3, 2, 3, 0, 4, 1]
+    assert rank_terms(terms, distinct=True) == [4, 2, 3, 0, 5, 1]
+    assert rank_terms([]) == []
+    assert rank_terms([*terms, QuotedGraph(Graph().store, BNode())]) is None
+
+
+def test_sort_triples_nan_literals() -> None:
+    """Ensure NaN literals that RDFlib cannot compare with decimals are ranked after
+    all other literals."""
+    from rdflib import XSD, Literal, URIRef
+
+    from turtle_canon.utils.sorting import rank_literals, sort_triples
+
+    nan_double = Literal("NaN", datatype=XSD.double)
+    nan_float = Literal("NaN", datatype=XSD.float)
+    decimal = Literal("1.5", datatype=XSD.decimal)
+    integer = Literal("2", datatype=XSD.integer)
+    assert rank_literals([nan_float, integer, nan_double, decimal]) == {
+        decimal: 0,
+        integer: 1,
+        nan_double: 2,
+        nan_float: 3,
+    }
+
+    # As long as they are objects of different subjects, RDFlib never compares them
+    triples = [
+        (URIRef(f"http://example.org/{index}"), URIRef("http://example.org/p"), _)
+        for index, _ in enumerate([nan_double, decimal, integer])
+    ]
+    assert sort_triples(triples[::-1]) == sorted(triples) == triples
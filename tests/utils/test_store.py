@@ -0,0 +1,89 @@
+"""Test `turtle_canon.utils.store`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_sorted_triples_store() -> None:
+    """Test looking up triples in a `SortedTriplesStore`."""
+    from rdflib import RDF, RDFS, Graph, URIRef
+
+    from turtle_canon.utils.store import SortedTriplesStore
+
+    a, b, c = (URIRef(f"http://example.org/{_}") for _ in "abc")
+    triples = sorted(
+        [
+            (a, RDF.type, RDFS.Class),
+            (a, RDFS.label, c),
+            (b, RDF.type, RDFS.Class),
+            (b, RDFS.subClassOf, a),
+            (c, RDFS.subClassOf, b),
+        ]
+    )
+    graph = Graph(store=SortedTriplesStore(triples))
+
+    assert list(graph) == triples
+    assert len(graph) == len(triples)
+    assert list(graph.triples((b, None, None))) == triples[2:4]
+    assert list(graph.subjects(RDF.type, RDFS.Class)) == [a, b]
+    assert graph.value(c, RDFS.subClassOf) == b
+    assert list(graph.triples((URIRef("http://example.org/d"), None, None))) == []
+    assert (a, RDFS.label, c) in graph
+
+    with pytest.raises(TypeError, match="read-only"):
+        graph.add((c, RDFS.label, a))
+
+
+def test_sorted_triples_store_bind() -> None:
+    """Ensure namespaces are bound as in RDFlib's `Memory` store."""
+    from rdflib import URIRef
+    from rdflib.plugins.stores.memory import Memory
+
+    from turtle_canon.utils.store import SortedTriplesStore
+
+    sorted_triples_store, memory_store = SortedTriplesStore([]), Memory()
+    for store in (sorted_triples_store, memory_store):
+        store.bind("", URIRef("http://example.org/"))
+        store.bind("ex", URIRef("http://example.org/"))
+        store.bind("other", URIRef("http://example.org/other#"))
+        store.bind("other", URIRef("http://example.org/other/"), override=False)
+        store.bind("new", URIRef("http://example.org/other#"))
+
+    assert list(sorted_triples_store.namespaces()) == list(memory_store.namespaces())
+    assert sorted_triples_store.prefix(URIRef("http://example.org/")) == "ex"
+    assert sorted_triples_store.namespace("new") == URIRef("http://example.org/other#")
+
+
+def test_interned_triples(top_dir: Path) -> None:
+    """Test interning and sorting triples."""
+    from rdflib import Graph
+
+    from turtle_canon.utils.store import InternedTriples, SortedTriplesStore
+
+    turtle_file = top_dir / "tests" / "static" / "turtle_canon_tests.ttl"
+    triples = list(Graph().parse(turtle_file, format="turtle"))
+
+    interned_triples = InternedTriples(triples)
+    assert len(interned_triples) == len(triples)
+    assert list(interned_triples) == triples
+    assert interned_triples[-1] == triples[-1]
+    assert interned_triples[1:3] == triples[1:3]
+    assert len(interned_triples.terms) == len({_ for triple in triples for _ in triple})
+    assert all(len(column) == len(triples) for column in interned_triples.columns)
+    assert list(InternedTriples(triples + triples[:3], unique=True)) == triples
+
+    assert interned_triples.sort() is interned_triples
+    assert list(interned_triples) == sorted(triples)
+
+    graph = Graph(store=SortedTriplesStore(interned_triples))
+    assert list(graph) == sorted(triples)
+    for subject in {_[0] for _ in triples}:
+        assert list(graph.triples((subject, None, None))) == sorted(
+            _ for _ in triples if _[0] == subject
+        )
@@ -0,0 +1,155 @@
+"""Test `turtle_canon.utils.turtle`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from rdflib import Graph
+
+
+def _parse(content: str, base: str = "http://example.org/base/doc.ttl") -> Graph:
+    """Parse Turtle content with `TurtleParser` into an RDFlib graph."""
+    from rdflib import Graph
+
+    from turtle_canon.utils.turtle import TurtleParser
+
+    parser = TurtleParser(content, base=base)
+    graph = Graph()
+    for triple in parser.triples():
+        graph.add(triple)
+    for prefix, namespace in parser.namespaces.items():
+        graph.bind(prefix, namespace)
+    return graph
+
+
+def test_conformance_static_files(top_dir: Path, tmp_dir: Path) -> None:
+    """Ensure both parsers agree on all static test files."""
+    import shutil
+
+    from rdflib import Graph
+    from rdflib.compare import isomorphic
+
+    from turtle_canon.canon import canonize
+
+    turtle_files = list((top_dir / "tests" / "static").rglob("*.ttl"))
+    assert turtle_files
+
+    for turtle_file in turtle_files:
+        graph = Graph().parse(
+            data=turtle_file.read_bytes(),
+            format="turtle",
+            publicID=turtle_file.as_uri(),
+        )
+        fast_graph = _parse(
+            turtle_file.read_text(encoding="utf8"), turtle_file.as_uri()
+        )
+        assert isomorphic(fast_graph, graph), turtle_file
+        assert set(fast_graph.namespaces()) == set(graph.namespaces()), turtle_file
+
+        rdflib_file = shutil.copy(turtle_file, tmp_dir / "rdflib.ttl")
+        fast_file = shutil.copy(turtle_file, tmp_dir / "fast.ttl")
+        canonize(rdflib_file, parser="rdflib")
+        canonize(fast_file, parser="fast")
+        assert fast_file.read_bytes() == rdflib_file.read_bytes(), turtle_file
+
+
+def test_conformance_syntax() -> None:
+    """Ensure the supported Turtle syntax is parsed as RDFlib does."""
+    from rdflib import Graph, Literal
+    from rdflib.compare import isomorphic
+
+    content = r"""
+        # A comment
+        @prefix ex: <http://example.org/ns#> .
+        @prefix : <relative/> .
+        PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
+        @base <http://example.org/other/> .
+
+        ex:s a ex:Class ; # A comment within a statement
+            ex:iri <relative>, <#fragment>, <../up>, <http://example.org/é> ;
+            ex:local :name, ex:with.dot, ex:esc\-aped, ex:p%20c, ex:123 ;
+            ex:string "plain", 'single', "esc\"aped\né\U0001F600",
+                ~~~long "quoted" ""string""
+with a newline~~~"", '''long 'single' string''' ;
+            ex:tagged "tagged"@en-GB, "typed"^^xsd:token, "typed"^^<http://t.org/#t> ;
+            ex:number 1, +01, -0, 1.50, .5, -0.0, 1e3, 1.5E-3, true, false ;;
+            ex:list ( 1 [ ex:p ex:o ] ( ) ( "nested" ) ) , ( ) .
+
+        [ ex:p ex:o ] .
+        [] ex:p _:label ; ex:q [ ex:r [ ] ] .
+        _:label ex:p ( _:label ) .
+        ( ex:a ex:b ) ex:p ex:o .
+        BASE <http://example.org/sparql/>
+        <s> <p> <o> .
+    """.replace("~~~", '"""')
+    base = "http://example.org/base/doc.ttl"
+    graph = Graph().parse(data=content, format="turtle", publicID=base)
+    fast_graph = _parse(content, base)
+    assert isomorphic(fast_graph, graph)
+    assert set(fast_graph.namespaces()) == set(graph.namespaces())
+    # Literals are compared by their exact lexical forms
+    assert {_.n3() for _ in fast_graph.objects() if isinstance(_, Literal)} == {
+        _.n3() for _ in graph.objects() if isinstance(_, Literal)
+    }
+
+
+def test_blank_node_identifiers() -> None:
+    """Ensure blank node identifiers are ordered as RDFlib's parser orders them."""
+    from rdflib import BNode, Graph
+
+    content = """
+        @prefix ex: <http://example.org/> .
+        ex:s ex:p [ ex:q _:x ; ex:r ( 1 [ ex:z 2 ] 3 ) ] .
+        _:y ex:p _:x .
+        [] ex:p ex:o .
+    """
+    graph = Graph().parse(data=content, format="turtle")
+    fast_graph = _parse(content)
+
+    def ordered_blank_nodes(graph: Graph) -> list[tuple[str, ...]]:
+        """The triples with blank nodes replaced by their position in the order."""
+        blank_nodes = sorted({_ for _ in graph.all_nodes() if isinstance(_, BNode)})
+        positions = {node: str(index) for index, node in enumerate(blank_nodes)}
+        return sorted(
+            tuple(positions.get(term, str(term)) for term in triple)  # type: ignore[arg-type]
+            for triple in graph
+        )
+
+    assert ordered_blank_nodes(fast_graph) == ordered_blank_nodes(graph)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        # Notation3
+        "@prefix : <http://example.org/> . { :a :b :c } => { :d :e :f } .",
+        "@prefix : <http://example.org/> . :a = :b .",
+        # Names outside of the supported subset, which RDFlib accepts
+        "@prefix : <http://example.org/> . :a\u00d7b :p :o .",
+        # Invalid Turtle
+        "@prefix : <http://example.org/> . :s :p :o",
+        "@prefix : <http://example.org/> . :s :p .",
+        ":s :p :o .",
+        '@prefix : <http://example.org/> . :s :p "unterminated .',
+    ],
+    ids=[
+        "formula",
+        "same as",
+        "unsupported name",
+        "missing period",
+        "missing object",
+        "undeclared prefix",
+        "unterminated string",
+    ],
+)
+def test_unsupported(content: str) -> None:
+    """Ensure unsupported or invalid Turtle raises a `TurtleSyntaxError`."""
+    from turtle_canon.utils.turtle import TurtleSyntaxError
+
+    with pytest.raises(TurtleSyntaxError, match=r"^Line 1: "):
+        _parse(content)
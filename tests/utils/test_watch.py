@@ -0,0 +1,56 @@
+"""Test `turtle_canon.utils.watch`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def _after(delay: float, change: Callable[[], object]) -> None:
+    """Make a change in a background thread, after the watcher has started."""
+    from threading import Timer
+
+    Timer(delay, change).start()
+
+
+@pytest.mark.parametrize("use_inotify", [True, False], ids=["inotify", "polling"])
+def test_watch(tmp_dir: Path, use_inotify: bool) -> None:
+    """Ensure changed files are reported in debounced batches."""
+    from turtle_canon.utils.watch import watch
+
+    existing = tmp_dir / "existing.ttl"
+    existing.write_text("# existing\n")
+    (tmp_dir / ".hidden").mkdir()
+
+    def save() -> None:
+        """Save files like an editor, in a burst of writes."""
+        (tmp_dir / "ontology.ttl").write_text("# new\n")
+        (tmp_dir / "notes.txt").write_text("Not Turtle\n")
+        (tmp_dir / ".hidden" / "hidden.ttl").write_text("# hidden\n")
+        temporary = tmp_dir / "existing.ttl.tmp"
+        temporary.write_text("# changed\n")
+        temporary.replace(existing)
+
+    watcher = watch([tmp_dir], poll_interval=0.05, use_inotify=use_inotify)
+    try:
+        _after(0.3, save)
+        assert next(watcher) == [existing, tmp_dir / "ontology.ttl"]
+
+        def add_subdirectory() -> None:
+            """Add a subdirectory with a Turtle file."""
+            (tmp_dir / "sub").mkdir()
+            (tmp_dir / "sub" / "nested.TTL").write_text("# nested\n")
+
+        _after(0.3, add_subdirectory)
+        assert next(watcher) == [tmp_dir / "sub" / "nested.TTL"]
+
+        # Files in new subdirectories are watched as well
+        _after(0.3, lambda: (tmp_dir / "sub" / "nested.TTL").write_text("# changed\n"))
+        assert next(watcher) == [tmp_dir / "sub" / "nested.TTL"]
+    finally:
+        watcher.close()
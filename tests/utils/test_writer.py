@@ -0,0 +1,163 @@
+"""Test `turtle_canon.utils.writer`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from rdflib import Graph
+
+
+def _assert_compatible(ontology: Graph) -> None:
+    """Ensure `write_turtle()` writes the same output as RDFlib's serializer."""
+    from io import BytesIO
+
+    from turtle_canon.utils.writer import write_turtle
+
+    expected, written = BytesIO(), BytesIO()
+    ontology.serialize(expected, format="turtle", encoding="utf-8")
+    write_turtle(ontology, written)
+    assert written.getvalue() == expected.getvalue()
+
+
+@pytest.mark.parametrize("parser", ["rdflib", "fast"])
+def test_compatibility_static_files(top_dir: Path, parser: str) -> None:
+    """Ensure the output is identical to RDFlib's for all static test files."""
+    from turtle_canon.canon import sort_ontology
+
+    turtle_files = list((top_dir / "tests" / "static").rglob("*.ttl"))
+    assert turtle_files
+
+    for turtle_file in turtle_files:
+        _assert_compatible(sort_ontology(turtle_file, parser=parser))
+
+
+def test_compatibility_syntax(tmp_dir: Path) -> None:
+    """Ensure the output is identical to RDFlib's for subject ordering and inlining."""
+    from turtle_canon.canon import sort_ontology
+
+    turtle_file = tmp_dir / "syntax.ttl"
+    turtle_file.write_text(
+        """
+        @prefix ex: <http://example.org/ns#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+        @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+        ex:Class a rdfs:Class ; rdfs:label "Class"@en, "Klasse"@de .
+        ex:referenced ex:p ex:Class .
+        ex:s <http://other.org/vocab#p> <http://other.org/vocab#o> ;
+            ex:numbers 1.0, "1"^^xsd:int, 1, "1"^^xsd:double, "01"^^xsd:long ;
+            ex:typed "t"^^<http://other.org/vocab#T>, "x"^^xsd:token ;
+            ex:local ex:with%20escape, ex:with\\(parens\\), <http://example.org/ns#x.> ;
+            ex:once [ ex:nested [ ex:deeper ( 1 [ ex:in ex:list ] ( ) ) ] ] ;
+            ex:twice _:shared ;
+            ex:list ( ex:a ex:b ), ( ), [ ex:p ex:o ], [ ] ;
+            ex:self _:cycle .
+        ex:t ex:twice _:shared .
+        _:shared ex:p ex:o .
+        _:cycle ex:p [ ex:p _:cycle ] .
+        [] ex:unreferenced ex:o ; ex:other [ ex:p ex:o ] .
+        ( 1 2 ) ex:subject ex:list .
+        _:invalid <http://www.w3.org/1999/02/22-rdf-syntax-ns#first> ex:a ;
+            <http://www.w3.org/1999/02/22-rdf-syntax-ns#rest> () ; ex:p ex:o .
+        ex:u ex:p _:invalid .
+        """,
+        encoding="utf8",
+    )
+
+    # RDFlib's sort reorders objects around NaN, which is neither less nor greater
+    # than any number (RDFlib fails to compare NaN with decimals altogether)
+    nan_file = tmp_dir / "nan.ttl"
+    nan_file.write_text(
+        """
+        @prefix ex: <http://example.org/ns#> .
+        @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+        ex:s ex:p "NaN"^^xsd:double, "1"^^xsd:double, 2, "INF"^^xsd:double .
+        """,
+        encoding="utf8",
+    )
+
+    for parser in ("rdflib", "fast"):
+        _assert_compatible(sort_ontology(turtle_file, parser=parser))
+        _assert_compatible(sort_ontology(nan_file, parser=parser))
+
+
+def test_fallback() -> None:
+    """Ensure graphs not backed by interned triples are serialized by RDFlib."""
+    from rdflib import BNode, Graph, URIRef
+
+    ontology = Graph()
+    ontology.parse(
+        data="""
+            @prefix ex: <http://example.org/> .
+            ex:s ex:p [ ex:q ex:o ] .
+        """,
+        format="turtle",
+    )
+    _assert_compatible(ontology)
+
+    # Blank nodes as predicates are not supported by the writer
+    ontology.add((BNode(), BNode(), URIRef("http://example.org/o")))
+    _assert_compatible(ontology)
+
+
+def test_prefixed_names() -> None:
+    """Ensure prefixed names are the same as RDFlib's, also for unusual IRIs."""
+    from rdflib import Graph, URIRef
+    from rdflib.namespace import XMLNS
+    from rdflib.plugins.serializers.turtle import TurtleSerializer
+
+    from turtle_canon.utils.writer import _PrefixedNames
+
+    iris = [
+        "http://example.org/ns#name",
+        "http://example.org/ns#_name-1",
+        "http://example.org/ns#1name",
+        "http://example.org/ns#-name",
+        "http://example.org/ns#name.",
+        "http://example.org/ns#na.me",
+        "http://example.org/ns#na%20me",
+        "http://example.org/ns#na(me)",
+        "http://example.org/ns#nämé",
+        "http://example.org/ns#",
+        "http://example.org/ns#sub#name",
+        "http://example.org/extended/name",
+        "http://example.org/extended/sub/name",
+        "http://example.org/extended/subname",
+        "http://example.org/_/name",
+        "http://example.org/unbound#name",
+        "http://example.org/unbound#other",
+        "http://example.org/in valid#name",
+        f"{XMLNS}lang",
+        "urn:example:name",
+    ]
+    namespaces = {
+        "ex": "http://example.org/ns#",
+        "ext": "http://example.org/extended/",
+        "extsub": "http://example.org/extended/sub",
+        "_u": "http://example.org/_/",
+        "w3xml": "http://www.w3.org/XML/1998/",
+    }
+
+    def graph() -> Graph:
+        """A graph with the namespaces bound."""
+        graph = Graph(bind_namespaces="none")
+        for prefix, namespace in namespaces.items():
+            graph.bind(prefix, namespace)
+        return graph
+
+    serializer, expected_serializer = TurtleSerializer(graph()), TurtleSerializer(
+        graph()
+    )
+    prefixed_names = _PrefixedNames(serializer)
+    for generate in (False, True, False):
+        for iri in iris:
+            assert prefixed_names(
+                URIRef(iri), generate
+            ) == expected_serializer.get_pname(URIRef(iri), gen_prefix=generate), iri
+    assert serializer.namespaces == expected_serializer.namespaces
@@ -10,3 +10,14 @@ from __future__ import annotations
 __version__ = "0.1.1"
 __author__ = "Casper Welzel Andersen"
 __author_email__ = "casper.w.andersen@sintef.no"
+
+__all__ = ("digest",)
+
+
+def __getattr__(name: str) -> object:
+    """Import the public API lazily, keeping `import turtle_canon` fast."""
+    if name == "digest":
+        from turtle_canon.canon import digest
+
+        return digest
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,50 +2,486 @@
 
 from __future__ import annotations
 
+import os
 import re
+import shutil
+from contextlib import closing
+from io import BytesIO
+from itertools import chain, islice
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING
 
 from rdflib import Graph
 from rdflib.exceptions import Error as RDFlibError
 from rdflib.exceptions import ParserError
 
 from turtle_canon.utils import exceptions, warnings
+from turtle_canon.utils.diff import diff_triples
+from turtle_canon.utils.digest import checksum_triples, digest_triples
+from turtle_canon.utils.metrics import Metrics
+from turtle_canon.utils.ntriples import (
+    is_nquads,
+    is_ntriples,
+    normalize_lines,
+    sort_lines,
+)
+from turtle_canon.utils.options import PARSERS, VERIFICATION_LEVELS
+from turtle_canon.utils.store import InternedTriples, SortedTriplesStore
+from turtle_canon.utils.turtle import TurtleParser, TurtleSyntaxError
+from turtle_canon.utils.writer import write_turtle
 
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Generator, Iterable, Iterator
+    from typing import IO
 
-def canonize(turtle_file: Path | str) -> Path | None:
+    from rdflib.graph import _TripleType
+
+    from turtle_canon.utils.cache import CanonCache, MemoryCanonCache
+
+SPILL_THRESHOLD = 64 * 1024**2
+"""Size in bytes above which serialized output is spilled from memory to disk."""
+
+_CHUNK_SIZE = 1024**2
+_LINES_PER_WRITE = 10_000
+
+
+def canonize(
+    turtle_file: Path | str,
+    cache: CanonCache | MemoryCanonCache | None = None,
+    verify: str = "digest",
+    max_memory: int | None = None,
+    parser: str = "rdflib",
+    canonical_blank_nodes: bool = False,
+    metrics: Metrics | None = None,
+) -> Path | None:
     """The main function for running `turtle-canon`.
 
     Workflow:
 
     - **Validate** Turtle file.
       Check the file integrity, readability, writeability and content.
+      The file is read only once, during the validation.
     - **Parse** and **sort** Turtle file's triples.
-      Parse Turtle file using RDFlib.
-      Retrieve triples, sort them, and generate a new RDFlib `Graph` from the sorted
-      triples.
+      Parse the read content using RDFlib.
+      Retrieve triples, sort them, and generate a new RDFlib `Graph` backed only by
+      the sorted triples.
     - **Export** ontology as Turtle file.
       Overwriting loaded Turtle file, i.e., overall the canonization is done in-place.
+      The file is only written to if the canonized content differs from the read
+      content.
+
+    If a `cache` is given, a Turtle file whose content is recorded as canonical in the
+    cache is not parsed, sorted or exported, and the canonized content is recorded in
+    the cache afterwards.
+
+    N-Triples (`.nt`) and N-Quads (`.nq`) files are instead canonized by streaming
+    their lines, normalizing and sorting them without ever building an RDFlib `Graph`,
+    see `turtle_canon.utils.ntriples`.
 
     Parameters:
         turtle_file: An absolute path or `pathlib.Path` object representing the Turtle
             file location.
+        cache: A persistent cache of already canonical content.
+        verify: The level of verification of the sorted ontology, see
+            `VERIFICATION_LEVELS`. It does not apply to N-Triples and N-Quads files.
+        max_memory: The maximum amount of memory in bytes to use for sorting the lines
+            of N-Triples and N-Quads files, beyond which an external merge sort is
+            used, see `turtle_canon.utils.ntriples.sort_lines()`. If `None`, the lines
+            are sorted in memory, and the serialized output is spilled to disk
+            beyond it, if it is less than `SPILL_THRESHOLD`. Turtle files are
+            parsed, sorted and serialized as a whole graph in memory, hence
+            `UnsupportedMaxMemory` is raised for them if it is given.
+        parser: The Turtle parser to use, see `PARSERS`. It does not apply to
+            N-Triples and N-Quads files.
+        canonical_blank_nodes: Whether or not to relabel blank nodes with canonical
+            labels, see `sort_ontology()`. It does not apply to N-Triples and N-Quads
+            files, whose blank node labels are kept as-is.
+        metrics: The metrics to record the time of each stage in, as well as the number
+            of triples and bytes, see `turtle_canon.utils.metrics`.
 
     Returns:
         If the file has been changed during the canonization, the Turtle file's
         location will be returned, otherwise `None` will be returned.
 
     """
-    valid_turtle_file = validate_turtle(turtle_file)
-    sorted_ontology = sort_ontology(valid_turtle_file)
-    changed_file = export_ontology(sorted_ontology, valid_turtle_file)
+    if metrics is None:
+        metrics = Metrics(turtle_file)
+
+    if is_ntriples(Path(turtle_file)):
+        return _canonize_ntriples(
+            turtle_file,
+            cache=cache,
+            verify=verify,
+            max_memory=max_memory,
+            metrics=metrics,
+        )
+
+    _check_max_memory(turtle_file, max_memory)
+    with metrics.stage("validate"):
+        valid_turtle_file, content = _validate_turtle(turtle_file)
+        metrics.input_bytes = len(content)
+        variant = _cache_variant(canonical_blank_nodes)
+        metrics.cached = cache is not None and cache.is_canonical(content, variant)
+    if metrics.cached:
+        return None
+
+    sorted_ontology = sort_ontology(
+        valid_turtle_file,
+        content=content,
+        verify=verify,
+        parser=parser,
+        canonical_blank_nodes=canonical_blank_nodes,
+        metrics=metrics,
+    )
+    with metrics.stage("serialize"):
+        canonized = _serialize_ontology(sorted_ontology, valid_turtle_file)
+    with canonized:
+        metrics.output_bytes = len(canonized)
+        if verify == "roundtrip":
+            with metrics.stage("verify"):
+                _verify_roundtrip(
+                    sorted_ontology, canonized.chunks(), valid_turtle_file
+                )
+
+        with metrics.stage("write"):
+            changed_file = not canonized.equals(content)
+            if changed_file:
+                canonized.commit()
+
+            if cache is not None:
+                cache.add(canonized.chunks(), variant)
 
     return Path(turtle_file) if changed_file else None
 
 
+def check(
+    turtle_file: Path | str,
+    cache: CanonCache | MemoryCanonCache | None = None,
+    verify: str = "digest",
+    max_memory: int | None = None,
+    parser: str = "rdflib",
+    canonical_blank_nodes: bool = False,
+    metrics: Metrics | None = None,
+) -> Path | None:
+    """Check whether a Turtle file is canonical, without writing to it.
+
+    The Turtle file is validated, parsed and sorted as in `canonize()`, but the
+    serialized output is compared against the file content while it is being
+    produced, stopping the serialization at the first difference.
+    The Turtle file is never written to.
+
+    If a `cache` is given, a Turtle file whose content is recorded as canonical in the
+    cache is not parsed, sorted or serialized, and canonical content is recorded in the
+    cache afterwards.
+
+    Parameters:
+        turtle_file: An absolute path or `pathlib.Path` object representing the Turtle
+            file location.
+        cache: A persistent cache of already canonical content.
+        verify: The level of verification of the sorted ontology, see
+            `VERIFICATION_LEVELS`.
+            For the `roundtrip` level, the output is always serialized in full.
+            It does not apply to N-Triples and N-Quads files.
+        max_memory: The maximum amount of memory in bytes to use for sorting the lines
+            of N-Triples and N-Quads files, see `canonize()`.
+        parser: The Turtle parser to use, see `PARSERS`.
+        canonical_blank_nodes: Whether or not to relabel blank nodes with canonical
+            labels, see `sort_ontology()`.
+        metrics: The metrics to record the time of each stage in, see `canonize()`.
+            The size of the output is only recorded if it is serialized in full.
+
+    Returns:
+        If the file would be changed by the canonization, the Turtle file's location
+        will be returned, otherwise `None` will be returned.
+
+    """
+    if metrics is None:
+        metrics = Metrics(turtle_file)
+
+    if is_ntriples(Path(turtle_file)):
+        return _canonize_ntriples(
+            turtle_file,
+            cache=cache,
+            verify=verify,
+            max_memory=max_memory,
+            check=True,
+            metrics=metrics,
+        )
+
+    _check_max_memory(turtle_file, max_memory)
+    with metrics.stage("validate"):
+        valid_turtle_file, content = _validate_turtle(turtle_file)
+        metrics.input_bytes = len(content)
+        variant = _cache_variant(canonical_blank_nodes)
+        metrics.cached = cache is not None and cache.is_canonical(content, variant)
+    if metrics.cached:
+        return None
+
+    sorted_ontology = sort_ontology(
+        valid_turtle_file,
+        content=content,
+        verify=verify,
+        parser=parser,
+        canonical_blank_nodes=canonical_blank_nodes,
+        metrics=metrics,
+    )
+    if verify == "roundtrip":
+        with metrics.stage("serialize"):
+            canonized = _serialize_ontology(sorted_ontology, valid_turtle_file)
+        with canonized:
+            metrics.output_bytes = len(canonized)
+            with metrics.stage("verify"):
+                _verify_roundtrip(
+                    sorted_ontology, canonized.chunks(), valid_turtle_file
+                )
+            canonical_file = canonized.equals(content)
+    else:
+        with metrics.stage("serialize"):
+            canonical_file = _matches_serialization(
+                sorted_ontology, valid_turtle_file, content
+            )
+
+    if not canonical_file:
+        return Path(turtle_file)
+
+    if cache is not None:
+        with metrics.stage("write"):
+            cache.add(content, variant)
+    return None
+
+
+def canonize_bytes(
+    content: bytes,
+    verify: str = "digest",
+    parser: str = "rdflib",
+    canonical_blank_nodes: bool = False,
+) -> bytes:
+    """Canonize UTF-8 encoded Turtle content in memory.
+
+    The content is parsed, sorted and serialized as in `canonize()`, without any file
+    or temporary file.
+    Relative IRIs are resolved against the current working directory, as RDFlib does.
+
+    Parameters:
+        content: The UTF-8 encoded Turtle content.
+        verify: The level of verification of the sorted ontology, see
+            `VERIFICATION_LEVELS`.
+        parser: The Turtle parser to use, see `PARSERS`.
+        canonical_blank_nodes: Whether or not to relabel blank nodes with canonical
+            labels, see `sort_ontology()`.
+
+    Returns:
+        The canonized, UTF-8 encoded Turtle content.
+
+    """
+    output = BytesIO()
+    canonize_stream(
+        content,
+        output,
+        verify=verify,
+        parser=parser,
+        canonical_blank_nodes=canonical_blank_nodes,
+    )
+    return output.getvalue()
+
+
+def canonize_text(
+    content: str,
+    verify: str = "digest",
+    parser: str = "rdflib",
+    canonical_blank_nodes: bool = False,
+) -> str:
+    """Canonize Turtle content in memory.
+
+    See `canonize_bytes()`.
+
+    Parameters:
+        content: The Turtle content.
+        verify: The level of verification of the sorted ontology, see
+            `VERIFICATION_LEVELS`.
+        parser: The Turtle parser to use, see `PARSERS`.
+        canonical_blank_nodes: Whether or not to relabel blank nodes with canonical
+            labels, see `sort_ontology()`.
+
+    Returns:
+        The canonized Turtle content.
+
+    """
+    return canonize_bytes(
+        content.encode("utf8"),
+        verify=verify,
+        parser=parser,
+        canonical_blank_nodes=canonical_blank_nodes,
+    ).decode("utf8")
+
+
+def canonize_stream(
+    content: bytes,
+    output: IO[bytes],
+    verify: str = "digest",
+    parser: str = "rdflib",
+    canonical_blank_nodes: bool = False,
+) -> None:
+    """Canonize UTF-8 encoded Turtle content, writing it to a binary stream.
+
+    The canonized content is written as soon as the triples are sorted and verified,
+    e.g., to standard output, for use as a `git` clean filter or as a format-on-save
+    hook of an editor.
+    For the `roundtrip` verification level, the canonized content is first serialized
+    in memory and verified, before it is written.
+
+    Parameters:
+        content: The UTF-8 encoded Turtle content.
+        output: The binary stream to write the canonized content to.
+        verify: The level of verification of the sorted ontology, see
+            `VERIFICATION_LEVELS`.
+        parser: The Turtle parser to use, see `PARSERS`.
+        canonical_blank_nodes: Whether or not to relabel blank nodes with canonical
+            labels, see `sort_ontology()`.
+
+    """
+    _check_verification_level(verify)
+
+    try:
+        content.decode("utf8")
+    except UnicodeDecodeError as exc:
+        raise exceptions.FailedReadingFile(
+            "The Turtle content could not be read (using UTF-8 encoding)."
+        ) from exc
+    if not content:
+        raise warnings.EmptyFile("The Turtle content is empty.")
+
+    sorted_ontology = sort_ontology(
+        None,
+        content=content,
+        verify=verify,
+        parser=parser,
+        canonical_blank_nodes=canonical_blank_nodes,
+    )
+
+    serialized = BytesIO()
+    try:
+        write_turtle(sorted_ontology, serialized if verify == "roundtrip" else output)
+    except (ValueError, RDFlibError) as exc:
+        raise exceptions.FailedExportToFile(
+            "Failed to properly serialize the loaded ontology from the Turtle content."
+        ) from exc
+
+    if verify == "roundtrip":
+        _verify_roundtrip(sorted_ontology, [serialized.getvalue()], None)
+        output.write(serialized.getvalue())
+
+
+def digest(turtle_file: Path | str, parser: str = "fast") -> str:
+    """Compute an order-independent digest of the graph in a Turtle file.
+
+    The digest only depends on the set of triples in the file, not on their order, on
+    how they are written, or on the identifiers of blank nodes, see
+    `turtle_canon.utils.digest.digest_triples()`.
+    Hence, two files have the same digest if they hold the same graph, whether or not
+    they are canonized.
+
+    The Turtle file is parsed once, and its triples are neither sorted nor serialized.
+    The file is never written to.
+    With the `fast` parser, which may give duplicate triples, the hashes of the triples
+    are kept in order to skip duplicates, hence memory grows with the number of
+    triples. An RDFlib `Graph` only holds distinct triples, but needs more memory
+    itself.
+    N-Triples (`.nt`) files are parsed as Turtle; N-Quads (`.nq`) files are not
+    supported.
+
+    Parameters:
+        turtle_file: An absolute path or `pathlib.Path` object representing the Turtle
+            file location.
+        parser: The Turtle parser to use, see `PARSERS`. With the `fast` parser, the
+            triples are streamed from the parser without building an RDFlib `Graph`.
+
+    Returns:
+        The digest as a hexadecimal string of 64 characters.
+
+    """
+    if parser not in PARSERS:
+        raise ValueError(
+            f"Unknown parser {parser!r}. Choose one of: {', '.join(PARSERS)}"
+        )
+    if is_nquads(Path(turtle_file)):
+        raise exceptions.FailedParsingFile(
+            f"Digests of N-Quads files are not supported: {turtle_file}"
+        )
+
+    valid_turtle_file, content = _validate_turtle(turtle_file, writable=False)
+
+    if parser == "fast":
+        fast_parser = TurtleParser(
+            content.decode("utf8"),
+            base=Graph().absolutize(valid_turtle_file.as_uri()),
+        )
+        try:
+            return digest_triples(fast_parser.triples())
+        except TurtleSyntaxError:
+            pass
+
+    # A graph is a set of triples
+    return digest_triples(_parse_turtle(valid_turtle_file, content), distinct=True)
+
+
+def diff(
+    old_file: Path | str, new_file: Path | str, parser: str = "rdflib"
+) -> Iterator[tuple[str, _TripleType]]:
+    """Compute the triple-level differences between two Turtle files.
+
+    Both Turtle files are parsed, their blank nodes are given canonical labels, see
+    `turtle_canon.utils.blank_nodes`, and their triples are merge-joined in the order
+    `sort_ontology()` sorts them, see `turtle_canon.utils.diff.diff_triples()`.
+    The Turtle files are never written to.
+    N-Triples (`.nt`) files are parsed as Turtle; N-Quads (`.nq`) files are not
+    supported.
+
+    Parameters:
+        old_file: An absolute path or `pathlib.Path` object representing the old
+            Turtle file location.
+        new_file: An absolute path or `pathlib.Path` object representing the new
+            Turtle file location.
+        parser: The Turtle parser to use, see `PARSERS`.
+
+    Returns:
+        An iterator over the marker of each difference, i.e., `"-"` for a removed
+        triple and `"+"` for an added triple, and the triple, grouped by subject.
+
+    """
+    if parser not in PARSERS:
+        raise ValueError(
+            f"Unknown parser {parser!r}. Choose one of: {', '.join(PARSERS)}"
+        )
+
+    triples = []
+    for turtle_file in (old_file, new_file):
+        if is_nquads(Path(turtle_file)):
+            raise exceptions.FailedParsingFile(
+                f"Differences between N-Quads files are not supported: {turtle_file}"
+            )
+        valid_turtle_file, content = _validate_turtle(turtle_file, writable=False)
+
+        parsed = (
+            _parse_turtle_fast(valid_turtle_file, content) if parser == "fast" else None
+        )
+        interned = (
+            InternedTriples(_parse_turtle(valid_turtle_file, content))
+            if parsed is None
+            else parsed[1]
+        )
+        triples.append(interned.canonicalize_blank_nodes())
+
+    return diff_triples(*triples)
+
+
 def validate_turtle(turtle_file: Path | str) -> Path:
     """Validate a Turtle file.
 
+    The file must exist, be readable and writeable, be UTF-8 encoded and non-empty.
+    The writeability is checked without writing to the file.
+
     Parameters:
         turtle_file: An absolute path or `pathlib.Path` object representing the Turtle
             file location.
@@ -53,6 +489,16 @@ def validate_turtle(turtle_file: Path | str) -> Path:
     Returns:
         A `pathlib.Path` object representing a validated Turtle file.
 
+    """
+    return _validate_turtle(turtle_file)[0]
+
+
+def _validate_turtle(
+    turtle_file: Path | str, writable: bool = True
+) -> tuple[Path, bytes]:
+    """Validate a Turtle file, returning its resolved path and its (read) content.
+
+    If `writable` is `False`, the file does not need to be writeable.
     """
     turtle_file = Path(turtle_file).resolve()
 
@@ -60,28 +506,34 @@ def validate_turtle(turtle_file: Path | str) -> Path:
         raise exceptions.TurtleFileNotFound(f"Supplied file {turtle_file} not found.")
 
     try:
-        content = turtle_file.read_text(encoding="utf8")
+        content = turtle_file.read_bytes()
+        content.decode("utf8")
     except (OSError, UnicodeDecodeError) as exc:
         raise exceptions.FailedReadingFile(
             f"The Turtle file {turtle_file} could not be opened and read (using UTF-8 "
             "encoding)."
         ) from exc
 
-    try:
-        turtle_file.write_text(content, encoding="utf8")
-    except (OSError, UnicodeDecodeError) as exc:
+    if writable and not os.access(turtle_file, os.W_OK):
         raise exceptions.FailedReadingFile(
             f"The Turtle file {turtle_file} could not be opened and written to (using "
             "UTF-8 encoding)."
-        ) from exc
+        )
 
     if not content:
         raise warnings.EmptyFile(f"The Turtle file {turtle_file} is empty.")
 
-    return turtle_file
+    return turtle_file, content
 
 
-def sort_ontology(turtle_file: Path) -> Graph:
+def sort_ontology(
+    turtle_file: Path | None,
+    content: bytes | None = None,
+    verify: str = "digest",
+    parser: str = "rdflib",
+    canonical_blank_nodes: bool = False,
+    metrics: Metrics | None = None,
+) -> Graph:
     """Load and sort triples in ontology.
 
     A validated Turtle file is expected, hence there are no "unnecessary" sanity checks
@@ -89,47 +541,160 @@ def sort_ontology(turtle_file: Path) -> Graph:
 
     Parameters:
         turtle_file: A valid `pathlib.Path` object representing the (unsorted) Turtle
-            file.
+            file. If `None`, the `content` is parsed on its own, resolving relative
+            IRIs against the current working directory, as RDFlib does.
+        content: The already read content of the Turtle file. If given, it is parsed
+            from memory instead of reading the Turtle file again.
+        verify: The level of verification of the sorted ontology, see
+            `VERIFICATION_LEVELS`. The `roundtrip` level is the same as `full` here,
+            since the sorted ontology has not yet been exported.
+        parser: The Turtle parser to use, see `PARSERS`.
+        canonical_blank_nodes: Whether or not to relabel blank nodes with canonical
+            labels, derived from their neighbourhoods, see
+            `turtle_canon.utils.blank_nodes`. Otherwise, blank nodes are ordered by
+            the identifiers generated when parsing, which differ between runs.
+            The sorted ontology is then verified against the relabelled triples.
+        metrics: The metrics to record the time of parsing, sorting and verifying in,
+            as well as the number of triples, see `turtle_canon.utils.metrics`.
 
     """
-    try:
-        ontology = Graph().parse(location=str(turtle_file), format="turtle")
-    except (SyntaxError, PermissionError, ParserError, RDFlibError) as exc:
-        raise exceptions.FailedParsingFile(
-            f"Failed to properly parse the Turtle file at {turtle_file}"
-        ) from exc
+    _check_verification_level(verify)
+    if parser not in PARSERS:
+        raise ValueError(
+            f"Unknown parser {parser!r}. Choose one of: {', '.join(PARSERS)}"
+        )
+    if metrics is None:
+        metrics = Metrics(turtle_file)
 
-    triples = sorted(ontology)
+    with metrics.stage("parse"):
+        parsed = _parse_turtle_fast(turtle_file, content) if parser == "fast" else None
+        if parsed is None:
+            ontology = _parse_turtle(turtle_file, content)
+            triples = InternedTriples(ontology)
+        else:
+            ontology, triples = parsed
+
+    if canonical_blank_nodes:
+        with metrics.stage("sort"):
+            triples.canonicalize_blank_nodes()
+    with metrics.stage("verify"):
+        expected_fingerprint = _fingerprint(
+            ontology if parsed is None and not canonical_blank_nodes else triples,
+            verify,
+        )
+    with metrics.stage("sort"):
+        triples.sort()
+    metrics.triples = len(triples)
 
     if not triples:
         raise warnings.NoTriples(
-            f"No triples found in the parsed non-empty Turtle file at {turtle_file}"
+            f"No triples found in the parsed non-empty {_source(turtle_file)}"
         )
 
-    sorted_ontology = Graph(
-        namespace_manager=ontology.namespace_manager, base=ontology.base
-    )
-    try:
-        for triple in triples:
-            sorted_ontology.add(triple)
-    except (AssertionError, RDFlibError) as exc:
-        raise exceptions.FailedCreatingOntology(
-            "Failed to properly create a sorted ontology from the triples in the "
-            f"Turtle file at {turtle_file}"
-        ) from exc
+    # Move the namespace manager (and thereby the namespace bindings) to a new graph
+    # backed only by the sorted triples, releasing the parsed graph.
+    namespace_manager = ontology.namespace_manager
+    with metrics.stage("sort"):
+        try:
+            sorted_ontology = Graph(
+                store=SortedTriplesStore(triples, namespaces=ontology.namespaces()),
+                namespace_manager=namespace_manager,
+                base=ontology.base,
+            )
+        except (AssertionError, RDFlibError) as exc:
+            raise exceptions.FailedCreatingOntology(
+                "Failed to properly create a sorted ontology from the triples in the "
+                f"{_source(turtle_file)}"
+            ) from exc
+    namespace_manager.graph = sorted_ontology
+    del ontology
 
-    if set(ontology) - set(sorted_ontology) or len(ontology) != len(sorted_ontology):
+    with metrics.stage("verify"):
+        fingerprint = _fingerprint(sorted_ontology, verify)
+    if fingerprint != expected_fingerprint:
         raise exceptions.InconsistencyError(
-            f"After sorting the ontology triples from the Turtle file at {turtle_file}"
-            " and re-creating the ontology, inconsistencies were found !"
+            f"After sorting the ontology triples from the {_source(turtle_file)} and "
+            "re-creating the ontology, inconsistencies were found !"
         )
 
     return sorted_ontology
 
 
+def _source(turtle_file: Path | None) -> str:
+    """Describe the source of Turtle content, for messages."""
+    return "Turtle content" if turtle_file is None else f"Turtle file at {turtle_file}"
+
+
+def _parse_turtle(turtle_file: Path | None, content: bytes | None = None) -> Graph:
+    """Parse a Turtle file with RDFlib's Turtle parser.
+
+    Parameters:
+        turtle_file: A valid `pathlib.Path` object representing the Turtle file, or
+            `None` for content on its own.
+        content: The already read content of the Turtle file.
+
+    Returns:
+        The parsed ontology.
+
+    """
+    try:
+        if content is None:
+            return Graph().parse(location=str(turtle_file), format="turtle")
+        return Graph().parse(
+            data=content,
+            format="turtle",
+            publicID=None if turtle_file is None else turtle_file.as_uri(),
+        )
+    except (SyntaxError, PermissionError, ParserError, RDFlibError) as exc:
+        raise exceptions.FailedParsingFile(
+            f"Failed to properly parse the {_source(turtle_file)}"
+        ) from exc
+
+
+def _parse_turtle_fast(
+    turtle_file: Path | None, content: bytes | None = None
+) -> tuple[Graph, InternedTriples] | None:
+    """Parse a Turtle file with the fast parser, see `turtle_canon.utils.turtle`.
+
+    Parameters:
+        turtle_file: A valid `pathlib.Path` object representing the Turtle file, or
+            `None` for content on its own, whose relative IRIs are resolved against
+            the current working directory, as RDFlib does.
+        content: The already read content of the Turtle file.
+
+    Returns:
+        An empty ontology, holding only the namespace bindings, as RDFlib's parser would
+        have bound them, together with the parsed triples.
+        If the content is not in the subset of Turtle supported by the fast parser,
+        `None` is returned.
+
+    """
+    if content is None:
+        if turtle_file is None:
+            raise ValueError("Either a Turtle file or its content must be given")
+        content = turtle_file.read_bytes()
+
+    ontology = Graph()
+    parser = TurtleParser(
+        content.decode("utf8"),
+        base=ontology.absolutize("" if turtle_file is None else turtle_file.as_uri()),
+    )
+    try:
+        triples = InternedTriples(parser.triples(), unique=True)
+    except TurtleSyntaxError:
+        return None
+
+    for prefix, namespace in parser.namespaces.items():
+        ontology.bind(prefix, namespace)
+    return ontology, triples
+
+
 def export_ontology(ontology: Graph, filename: Path) -> bool:
     """Export an ontology as a Turtle file.
 
+    The file is only written to if the exported ontology differs from its current
+    content.
+
     Parameters:
         ontology: A loaded ontology.
         filename: The Turtle file's fully resolved path to export to.
@@ -143,24 +708,478 @@ def export_ontology(ontology: Graph, filename: Path) -> bool:
             f"File at {filename} was unexpectedly not found !"
         )
 
-    with TemporaryDirectory() as tmp_dir:
-        tmp_turtle_file = Path(tmp_dir) / "tmp_turtle_file.ttl"
+    with _serialize_ontology(ontology, filename) as canonized:
+        if canonized.equals(filename.read_bytes()):
+            return False
+        canonized.commit()
+
+    return True
+
+
+class _CanonizedOutput:
+    """Serialized output for a Turtle file.
+
+    The output is kept in memory until it exceeds `max_size` bytes, after which it is
+    spilled to a temporary file in the Turtle file's directory.
+    This temporary file then atomically replaces the Turtle file upon committing, after
+    which the output is read from the Turtle file.
+
+    Parameters:
+        filename: The Turtle file's fully resolved path.
+        max_size: The size in bytes above which the output is spilled to disk.
+            Defaults to `SPILL_THRESHOLD`.
+
+    """
+
+    def __init__(self, filename: Path, max_size: int | None = None) -> None:
+        self._filename = filename
+        self._max_size = SPILL_THRESHOLD if max_size is None else max_size
+        self._buffer = BytesIO()
+        self._spill: IO[bytes] | None = None
+        self._committed_spill = False
+        self._size = 0
+
+    def __enter__(self) -> _CanonizedOutput:  # noqa: PYI034
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def spilled(self) -> bool:
+        """Whether or not the output has been spilled to disk."""
+        return self._spill is not None
+
+    def write(self, data: bytes) -> int:
+        """Write serialized data to the output."""
+        if self._spill is None and self._size + len(data) > self._max_size:
+            self._spill = NamedTemporaryFile(  # noqa: SIM115
+                dir=self._filename.parent,
+                prefix=f".{self._filename.name}.",
+                suffix=".tmp",
+                delete=False,
+            )
+            self._spill.write(self._buffer.getbuffer())
+            self._buffer = BytesIO()
+        (self._spill or self._buffer).write(data)
+        self._size += len(data)
+        return len(data)
+
+    def chunks(self) -> Iterator[bytes]:
+        """Iterate over the output in chunks."""
+        if self._spill is not None:
+            self._spill.flush()
+            yield from _read_chunks(Path(self._spill.name))
+        elif self._committed_spill:
+            # The spilled output has replaced the Turtle file
+            yield from _read_chunks(self._filename)
+        else:
+            yield self._buffer.getvalue()
+
+    def is_blank(self) -> bool:
+        """Whether or not the output is empty or a single whitespace character."""
+        return self._spill is None and (
+            not self._size or bool(re.match(rb"^\s$", self._buffer.getvalue()))
+        )
+
+    def equals(self, content: bytes) -> bool:
+        """Whether or not the output equals some content."""
+        if self._size != len(content):
+            return False
+        if self._spill is None and not self._committed_spill:
+            return self._buffer.getvalue() == content
+
+        content_view = memoryview(content)
+        position = 0
+        for chunk in self.chunks():
+            if content_view[position : position + len(chunk)] != chunk:
+                return False
+            position += len(chunk)
+        return True
+
+    def commit(self) -> None:
+        """Write the output to the Turtle file."""
         try:
-            ontology.serialize(tmp_turtle_file, format="turtle")
-        except (ValueError, RDFlibError) as exc:
+            if self._spill is None:
+                self._filename.write_bytes(self._buffer.getvalue())
+                return
+
+            self._spill.close()
+            shutil.copymode(self._filename, self._spill.name)
+            Path(self._spill.name).replace(self._filename)
+            self._spill = None
+            self._committed_spill = True
+        except OSError as exc:
             raise exceptions.FailedExportToFile(
-                f"Failed to properly save the loaded ontology from {filename} to file."
+                f"Failed to properly save the loaded ontology from {self._filename} to "
+                "file."
             ) from exc
 
-        canonized_ttl = tmp_turtle_file.read_text(encoding="utf8")
+    def close(self) -> None:
+        """Discard the output, removing any temporary file."""
+        if self._spill is not None:
+            self._spill.close()
+            Path(self._spill.name).unlink(missing_ok=True)
+            self._spill = None
+        self._committed_spill = False
+        self._buffer = BytesIO()
+        self._size = 0
+
+
+def _cache_variant(canonical_blank_nodes: bool) -> str:
+    """The variant of the canonical form of Turtle files, to key cache entries on."""
+    return "canonical-blank-nodes" if canonical_blank_nodes else ""
+
+
+def _check_verification_level(verify: str) -> None:
+    """Raise a `ValueError` for an unknown verification level."""
+    if verify not in VERIFICATION_LEVELS:
+        raise ValueError(
+            f"Unknown verification level {verify!r}. Choose one of: "
+            f"{', '.join(VERIFICATION_LEVELS)}"
+        )
+
+
+def _fingerprint(ontology: Graph | InternedTriples, verify: str) -> object:
+    """Return what is compared to verify the sorted ontology at a verification level."""
+    if verify in ("full", "roundtrip"):
+        return set(ontology)
+    if verify == "digest":
+        return checksum_triples(ontology)
+    if verify == "count":
+        return len(ontology)
+    return None
+
+
+def _verify_roundtrip(
+    ontology: Graph, chunks: Iterable[bytes], filename: Path | None
+) -> None:
+    """Verify that re-parsing the serialized ontology results in the same ontology.
+
+    Parameters:
+        ontology: The sorted ontology.
+        chunks: The serialized ontology, in chunks.
+        filename: The Turtle file's fully resolved path the ontology is exported to,
+            or `None` for content on its own.
+
+    """
+    from rdflib.compare import isomorphic
+
+    try:
+        reparsed_ontology = Graph().parse(
+            data=b"".join(chunks),
+            format="turtle",
+            publicID=None if filename is None else filename.as_uri(),
+        )
+    except (SyntaxError, ParserError, RDFlibError) as exc:
+        raise exceptions.InconsistencyError(
+            f"Failed to re-parse the exported ontology from the {_source(filename)} !"
+        ) from exc
+
+    if not isomorphic(ontology, reparsed_ontology):
+        raise exceptions.InconsistencyError(
+            f"After exporting the sorted ontology from the {_source(filename)} and "
+            "re-parsing it, inconsistencies were found !"
+        )
+
+
+class _OutputDiffers(Exception):
+    """Serialized output differs from the expected content."""
+
+
+class _ComparingOutput:
+    """Serialized output, compared against some expected content as it is written.
+
+    Writing raises `_OutputDiffers` as soon as the written output deviates from the
+    expected content, aborting the serialization.
+
+    Parameters:
+        expected: A binary stream of the expected content.
+
+    """
+
+    def __init__(self, expected: IO[bytes]) -> None:
+        self._expected = expected
+
+    def write(self, data: bytes) -> int:
+        """Compare data against the expected content at the current position."""
+        if self._expected.read(len(data)) != data:
+            raise _OutputDiffers
+        return len(data)
+
+    def matches(self) -> bool:
+        """Whether or not the full expected content has been written."""
+        return not self._expected.read(1)
+
+
+def _matches_serialization(ontology: Graph, filename: Path, content: bytes) -> bool:
+    """Check whether serializing an ontology as Turtle results in some content.
+
+    The serialization is stopped at the first difference.
+
+    Parameters:
+        ontology: A loaded ontology.
+        filename: The Turtle file's fully resolved path the ontology is exported to.
+        content: The content to compare the serialized ontology against.
+
+    Returns:
+        Whether or not the ontology serializes to exactly `content`.
+
+    """
+    compared = _ComparingOutput(BytesIO(content))
+    try:
+        write_turtle(ontology, compared)  # type: ignore[arg-type]
+    except _OutputDiffers:
+        return False
+    except (ValueError, RDFlibError) as exc:
+        raise exceptions.FailedExportToFile(
+            f"Failed to properly save the loaded ontology from {filename} to file."
+        ) from exc
+
+    if not compared.matches():
+        return False
+    if re.match(rb"^\s$", content):
+        raise exceptions.FailedExportToFile(
+            f"Failed to properly save the loaded ontology from {filename} to file."
+        )
+    return True
+
+
+def _serialize_ontology(ontology: Graph, filename: Path) -> _CanonizedOutput:
+    """Serialize an ontology as Turtle, using UTF-8 encoding.
 
-    if not canonized_ttl or re.match(r"^\s$", canonized_ttl):
+    Parameters:
+        ontology: A loaded ontology.
+        filename: The Turtle file's fully resolved path the ontology is exported to.
+
+    Returns:
+        The serialized ontology.
+
+    """
+    canonized = _CanonizedOutput(filename)
+    try:
+        write_turtle(ontology, canonized)  # type: ignore[arg-type]
+    except (ValueError, RDFlibError) as exc:
+        canonized.close()
         raise exceptions.FailedExportToFile(
             f"Failed to properly save the loaded ontology from {filename} to file."
+        ) from exc
+
+    if canonized.is_blank():
+        canonized.close()
+        raise exceptions.FailedExportToFile(
+            f"Failed to properly save the loaded ontology from {filename} to file."
+        )
+
+    return canonized
+
+
+def _check_max_memory(turtle_file: Path | str, max_memory: int | None) -> None:
+    """Check that no maximum amount of memory is given for a Turtle file.
+
+    Unlike the lines of N-Triples and N-Quads files, the triples of a Turtle file are
+    parsed, sorted and serialized as a whole graph in memory, since RDFlib's order of
+    the subjects and its inlining of blank nodes depend on all triples.
+
+    Parameters:
+        turtle_file: The Turtle file.
+        max_memory: The maximum amount of memory in bytes to use, if any.
+
+    Raises:
+        UnsupportedMaxMemory: If a maximum amount of memory is given.
+
+    """
+    if max_memory is not None:
+        raise exceptions.UnsupportedMaxMemory(
+            "A maximum amount of memory only applies to N-Triples and N-Quads files, "
+            f"Turtle files are canonized in memory: {turtle_file}"
+        )
+
+
+def _spill_threshold(max_memory: int | None) -> int:
+    """The size in bytes above which serialized output is spilled to disk.
+
+    Parameters:
+        max_memory: The maximum amount of memory in bytes to use, if any.
+
+    Returns:
+        `SPILL_THRESHOLD`, or `max_memory` if it is less.
+
+    """
+    if max_memory is None:
+        return SPILL_THRESHOLD
+    return min(max_memory, SPILL_THRESHOLD)
+
+
+def _canonize_ntriples(
+    ntriples_file: Path | str,
+    cache: CanonCache | MemoryCanonCache | None = None,
+    verify: str = "digest",
+    max_memory: int | None = None,
+    check: bool = False,
+    metrics: Metrics | None = None,
+) -> Path | None:
+    """Canonize an N-Triples or N-Quads file, streaming it line by line.
+
+    See `canonize()` and `check()` for the parameters and return value.
+
+    """
+    _check_verification_level(verify)
+    if metrics is None:
+        metrics = Metrics(ntriples_file)
+
+    with metrics.stage("validate"):
+        valid_ntriples_file = _validate_ntriples(ntriples_file)
+        metrics.input_bytes = valid_ntriples_file.stat().st_size
+        metrics.cached = cache is not None and cache.is_canonical(
+            _read_chunks(valid_ntriples_file)
+        )
+    if metrics.cached:
+        return None
+
+    sorted_statements = _sort_ntriples(valid_ntriples_file, max_memory=max_memory)
+    with closing(sorted_statements):
+        with metrics.stage("sort"):
+            # All lines have been read once the first sorted statement is available
+            statements = chain([next(sorted_statements)], sorted_statements)
+
+        if check:
+            with metrics.stage("write"), valid_ntriples_file.open("rb") as handle:
+                compared = _ComparingOutput(handle)
+                try:
+                    metrics.triples = _write_lines(statements, compared)
+                    canonical_file = compared.matches()
+                except _OutputDiffers:
+                    canonical_file = False
+            if not canonical_file:
+                return Path(ntriples_file)
+            if cache is not None:
+                with metrics.stage("write"):
+                    cache.add(_read_chunks(valid_ntriples_file))
+            return None
+
+        with (
+            metrics.stage("write"),
+            _CanonizedOutput(
+                valid_ntriples_file, _spill_threshold(max_memory)
+            ) as canonized,
+        ):
+            metrics.triples = _write_lines(statements, canonized)
+            metrics.output_bytes = len(canonized)
+            changed_file = not _equals_file(canonized, valid_ntriples_file)
+            if changed_file:
+                canonized.commit()
+
+            if cache is not None:
+                cache.add(canonized.chunks())
+
+    return Path(ntriples_file) if changed_file else None
+
+
+def _validate_ntriples(ntriples_file: Path | str) -> Path:
+    """Validate an N-Triples or N-Quads file without reading it.
+
+    Whether or not the file is UTF-8 encoded is only checked when streaming it.
+    """
+    ntriples_file = Path(ntriples_file).resolve()
+
+    if not ntriples_file.exists():
+        raise exceptions.TurtleFileNotFound(f"Supplied file {ntriples_file} not found.")
+
+    if not ntriples_file.is_file() or not os.access(ntriples_file, os.R_OK):
+        raise exceptions.FailedReadingFile(
+            f"The N-Triples file {ntriples_file} could not be opened and read (using "
+            "UTF-8 encoding)."
+        )
+
+    if not os.access(ntriples_file, os.W_OK):
+        raise exceptions.FailedReadingFile(
+            f"The N-Triples file {ntriples_file} could not be opened and written to "
+            "(using UTF-8 encoding)."
         )
 
-    changed = filename.read_text() != canonized_ttl
+    if not ntriples_file.stat().st_size:
+        raise warnings.EmptyFile(f"The N-Triples file {ntriples_file} is empty.")
+
+    return ntriples_file
+
+
+def _sort_ntriples(
+    ntriples_file: Path, max_memory: int | None = None
+) -> Generator[str]:
+    """Normalize, sort and de-duplicate the statements of an N-Triples or N-Quads file.
+
+    Parameters:
+        ntriples_file: A valid `pathlib.Path` object representing the N-Triples or
+            N-Quads file.
+        max_memory: The maximum amount of memory in bytes to use for sorting in memory,
+            see `turtle_canon.utils.ntriples.sort_lines()`.
+
+    Yields:
+        The sorted, canonical statements, without line terminators.
+
+    """
+    try:
+        with (
+            ntriples_file.open(encoding="utf8", newline="") as handle,
+            closing(
+                sort_lines(
+                    normalize_lines(handle, quads=is_nquads(ntriples_file)),
+                    max_memory=max_memory,
+                    directory=ntriples_file.parent,
+                )
+            ) as statements,
+        ):
+            # All lines have been read once the first sorted statement is available
+            first_statement = next(statements, None)
+            if first_statement is None:
+                raise warnings.NoTriples(
+                    f"No triples found in the parsed non-empty N-Triples file at "
+                    f"{ntriples_file}"
+                )
+            yield first_statement
+            yield from statements
+    except (OSError, UnicodeDecodeError) as exc:
+        raise exceptions.FailedReadingFile(
+            f"The N-Triples file {ntriples_file} could not be opened and read (using "
+            "UTF-8 encoding)."
+        ) from exc
+    except ValueError as exc:
+        raise exceptions.FailedParsingFile(
+            f"Failed to properly parse the N-Triples file at {ntriples_file}: {exc}"
+        ) from exc
+
+
+def _write_lines(
+    statements: Iterable[str], output: _CanonizedOutput | _ComparingOutput
+) -> int:
+    """Write statements as UTF-8 encoded lines, in batches.
+
+    Returns:
+        The number of statements written.
+
+    """
+    statements = iter(statements)
+    written = 0
+    while batch := list(islice(statements, _LINES_PER_WRITE)):
+        output.write(("\n".join(batch) + "\n").encode("utf8"))
+        written += len(batch)
+    return written
+
+
+def _read_chunks(filename: Path) -> Iterator[bytes]:
+    """Read a file in chunks."""
+    with filename.open("rb") as handle:
+        while chunk := handle.read(_CHUNK_SIZE):
+            yield chunk
 
-    filename.write_text(canonized_ttl, encoding="utf8")
 
-    return changed
+def _equals_file(canonized: _CanonizedOutput, filename: Path) -> bool:
+    """Whether or not the output equals the content of a file, read in chunks."""
+    if len(canonized) != filename.stat().st_size:
+        return False
+    with filename.open("rb") as handle:
+        return all(handle.read(len(chunk)) == chunk for chunk in canonized.chunks())
@@ -0,0 +1,156 @@
+"""Command line interface (CLI) for running `turtle-canon diff`."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from itertools import groupby
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+    from dataclasses import dataclass
+    from typing import TextIO
+
+    from rdflib.graph import _TripleType
+
+    @dataclass
+    class DiffCLIArgs:
+        """CLI parsed arguments"""
+
+        parser: str
+        format: str
+        old_file: Path
+        new_file: Path
+
+
+OUTPUT_FORMATS = ("text", "json")
+
+
+def main(args: list[str] | None = None) -> None:
+    """Show the triples removed and added between two versions of an ontology."""
+    from turtle_canon.canon import diff
+    from turtle_canon.cli import utils
+    from turtle_canon.utils.exceptions import TurtleCanonException
+    from turtle_canon.utils.options import PARSERS
+    from turtle_canon.utils.warnings import TurtleCanonWarning
+
+    parser = argparse.ArgumentParser(
+        prog="turtle-canon diff",
+        description=main.__doc__,
+        epilog=(
+            "Blank nodes are compared by canonical labels derived from their "
+            "neighbourhoods. Exits with a non-zero status if there are differences."
+        ),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--parser",
+        type=str,
+        help="The Turtle parser to use, see `turtle-canon --help`.",
+        choices=PARSERS,
+        default="rdflib",
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        help=(
+            "The output format: 'text' (the removed ('-') and added ('+') predicates "
+            "and objects under each subject) or 'json' (a JSON object with the "
+            "removed and added predicates and objects of each subject, as well as the "
+            "number of removed and added triples)."
+        ),
+        choices=OUTPUT_FORMATS,
+        default="text",
+    )
+    parser.add_argument(
+        "old_file",
+        type=Path,
+        help="Path to the old Turtle file.",
+        metavar="OLD_FILE",
+    )
+    parser.add_argument(
+        "new_file",
+        type=Path,
+        help="Path to the new Turtle file.",
+        metavar="NEW_FILE",
+    )
+
+    parsed_args: DiffCLIArgs = parser.parse_args(args)  # type: ignore[assignment]
+
+    try:
+        differences = diff(
+            parsed_args.old_file, parsed_args.new_file, parser=parsed_args.parser
+        )
+        if parsed_args.format == "json":
+            changed = _write_json(differences, parsed_args, sys.stdout)
+        else:
+            changed = _write_text(differences, sys.stdout)
+    except (TurtleCanonException, TurtleCanonWarning) as exception:
+        utils.print_error(exception)
+
+    sys.exit(1 if changed else 0)
+
+
+def _write_text(differences: Iterable[tuple[str, _TripleType]], output: TextIO) -> bool:
+    """Write the differences as text, grouped by subject.
+
+    Returns:
+        Whether or not there are any differences.
+
+    """
+    changed = False
+    for subject, subject_differences in groupby(differences, key=lambda _: _[1][0]):
+        changed = True
+        lines = [subject.n3()]
+        lines.extend(
+            f"{marker} {predicate.n3()} {object_.n3()}"
+            for marker, (_, predicate, object_) in subject_differences
+        )
+        output.write("\n".join(lines) + "\n")
+    output.flush()
+    return changed
+
+
+def _write_json(
+    differences: Iterable[tuple[str, _TripleType]],
+    parsed_args: DiffCLIArgs,
+    output: TextIO,
+) -> bool:
+    """Write the differences as a JSON object, streamed one subject at a time.
+
+    Terms are written in their N-Triples form.
+
+    Returns:
+        Whether or not there are any differences.
+
+    """
+    from turtle_canon.utils.diff import ADDED, REMOVED
+
+    output.write(
+        f'{{"old": {json.dumps(str(parsed_args.old_file))}, '
+        f'"new": {json.dumps(str(parsed_args.new_file))}, "subjects": ['
+    )
+    counts = {REMOVED: 0, ADDED: 0}
+    for subject, subject_differences in groupby(differences, key=lambda _: _[1][0]):
+        changes: dict[str, list[list[str]]] = {REMOVED: [], ADDED: []}
+        for marker, (_, predicate, object_) in subject_differences:
+            changes[marker].append([predicate.n3(), object_.n3()])
+        separator = ", " if any(counts.values()) else ""
+        counts[REMOVED] += len(changes[REMOVED])
+        counts[ADDED] += len(changes[ADDED])
+        output.write(
+            separator
+            + json.dumps(
+                {
+                    "subject": subject.n3(),
+                    "removed": changes[REMOVED],
+                    "added": changes[ADDED],
+                }
+            )
+        )
+    output.write(f'], "removed": {counts[REMOVED]}, "added": {counts[ADDED]}}}\n')
+    output.flush()
+    return any(counts.values())
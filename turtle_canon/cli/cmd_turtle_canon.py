@@ -3,13 +3,26 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
+import os
 import sys
+import time
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Generator, Iterable, Sequence
+    from concurrent.futures import Future
     from dataclasses import dataclass
+    from typing import Any, TypeVar
+
+    from turtle_canon.cli.utils import Cache
+    from turtle_canon.utils.cache import CanonCache
+    from turtle_canon.utils.metrics import Metrics
+
+    T = TypeVar("T")
 
     @dataclass
     class CLIArgs:
@@ -18,22 +31,359 @@ if TYPE_CHECKING:  # pragma: no cover
         version: str
         log_level: str
         fail_fast: bool
+        jobs: int
+        cache_dir: Path
+        no_cache: bool
+        verify: str
+        check: bool
+        max_memory: int | None
+        parser: str
+        canonical_blank_nodes: bool
+        digest: bool
+        daemon: bool
+        socket: Path
+        no_daemon: bool
+        watch: list[Path] | None
+        changed_since: str | None
+        untracked: bool
+        include: list[str] | None
+        exclude: list[str] | None
+        no_gitignore: bool
+        timings: bool
+        report: Path | None
+        profile: Path | None
+        trace_memory: bool
         turtle_files: list[Path]
 
 
 LOGGING_LEVELS = [logging.getLevelName(level).lower() for level in range(0, 51, 10)]
 
+STDIN = Path("-")
+"""The path given to read Turtle from standard input and write to standard output."""
+
+PENDING_FILES_PER_JOB = 4
+"""The number of files waiting for each worker process, when processing files in
+parallel."""
+
+DAEMON_MAX_FILES = 8
+"""The maximum number of files sent to the daemon, which canonizes them one at a time,
+when using several worker processes. Larger batches are canonized in parallel
+instead."""
+
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def _memory_size(value: str) -> int:
+    """Parse a memory size, e.g., `2G` or `512M`, into a number of bytes."""
+    number, unit = value.strip(), ""
+    if number[-1:].upper() == "B":
+        number = number[:-1]
+    if number[-1:].upper() in SIZE_UNITS:
+        number, unit = number[:-1], number[-1].upper()
+    try:
+        size = int(float(number) * SIZE_UNITS[unit])
+    except (ValueError, OverflowError) as exc:
+        raise argparse.ArgumentTypeError(f"invalid memory size: {value!r}") from exc
+    if size < 1:
+        raise argparse.ArgumentTypeError(f"memory size must be positive: {value!r}")
+    return size
+
+
+def _init_worker() -> None:
+    """Initialize a worker process.
+
+    Import the canonization machinery (and thereby RDFlib and its plugins) once per
+    worker, instead of once per file.
+    """
+    import turtle_canon.canon  # noqa: F401
+
+
+@functools.cache
+def _get_cache(cache_dir: Path) -> CanonCache:
+    """Return the persistent cache for a cache directory, once per process."""
+    from turtle_canon.utils.cache import CanonCache
+
+    return CanonCache(cache_dir)
+
+
+def _canonize_file(
+    turtle_file: Path,
+    cache_dir: Path | None = None,
+    check: bool = False,
+    **options: Any,
+) -> tuple[Path | None, Exception | None]:
+    """Canonize a single Turtle file, returning any Turtle Canon exception or warning.
+
+    Parameters:
+        turtle_file: Path to the Turtle file.
+        cache_dir: The persistent cache directory. If `None`, no cache is used.
+        check: Whether or not to only check the Turtle file, without writing to it.
+        **options: Further options for `turtle_canon.canon.canonize()` or
+            `turtle_canon.canon.check()`.
+
+    Returns:
+        The changed file (if it was, or would be, changed) and the caught Turtle Canon
+        exception or warning (if any was raised).
+
+    """
+    from turtle_canon.canon import canonize
+    from turtle_canon.canon import check as check_file
+    from turtle_canon.utils.exceptions import TurtleCanonException
+    from turtle_canon.utils.warnings import TurtleCanonWarning
+
+    try:
+        return (
+            (check_file if check else canonize)(
+                turtle_file,
+                cache=_get_cache(cache_dir) if cache_dir is not None else None,
+                **options,
+            ),
+            None,
+        )
+    except (TurtleCanonException, TurtleCanonWarning) as exception:
+        return None, exception
+
+
+def _measure_file(
+    turtle_file: Path,
+    cache_dir: Path | None = None,
+    check: bool = False,
+    profile_dir: Path | None = None,
+    trace_memory: bool = False,
+    **options: Any,
+) -> tuple[Metrics, Exception | None]:
+    """Canonize a single Turtle file like `_canonize_file()`, recording its metrics.
+
+    Parameters:
+        turtle_file: Path to the Turtle file.
+        cache_dir: The persistent cache directory. If `None`, no cache is used.
+        check: Whether or not to only check the Turtle file, see
+            `turtle_canon.canon.check()`.
+        profile_dir: The directory to write a `cProfile` statistics file of
+            canonizing the Turtle file to, see `_profile_path()`. If `None`, it is not
+            profiled.
+        trace_memory: Whether or not to trace the memory allocated while canonizing
+            the Turtle file, see `turtle_canon.utils.profiling.trace_memory()`.
+        **options: Further options for `turtle_canon.canon.canonize()`.
+
+    Returns:
+        The metrics of canonizing the Turtle file and the caught Turtle Canon exception
+        or warning (if any was raised).
+
+    """
+    from contextlib import ExitStack
+
+    from turtle_canon.canon import canonize
+    from turtle_canon.canon import check as check_file
+    from turtle_canon.utils import profiling
+    from turtle_canon.utils.exceptions import TurtleCanonException
+    from turtle_canon.utils.metrics import Metrics
+    from turtle_canon.utils.warnings import TurtleCanonWarning
+
+    metrics = Metrics(turtle_file)
+    caught: Exception | None = None
+    with ExitStack() as stack:
+        if profile_dir is not None:
+            stack.enter_context(
+                profiling.profile(_profile_path(profile_dir, turtle_file))
+            )
+        if trace_memory:
+            metrics.memory = stack.enter_context(profiling.trace_memory())
+        try:
+            metrics.changed = (check_file if check else canonize)(
+                turtle_file,
+                cache=_get_cache(cache_dir) if cache_dir is not None else None,
+                metrics=metrics,
+                **options,
+            ) is not None
+        except (TurtleCanonException, TurtleCanonWarning) as exception:
+            metrics.error = type(exception).__name__
+            caught = exception
+    return metrics, caught
+
+
+def _profile_path(profile_dir: Path, turtle_file: Path) -> Path:
+    """Return the path of the `cProfile` statistics file of a Turtle file.
+
+    The file is named after the path of the Turtle file, relative to the current
+    working directory if possible, with its parts joined by underscores, such that
+    Turtle files with the same name in different directories are told apart, e.g.,
+    `ontologies_ontology.ttl.pstats`.
+
+    """
+    try:
+        parts = turtle_file.resolve().relative_to(Path.cwd()).parts
+    except ValueError:
+        parts = turtle_file.resolve().parts[1:]
+    return profile_dir / f"{'_'.join(parts)}.pstats"
+
+
+def _digest_file(
+    turtle_file: Path, parser: str = "fast"
+) -> tuple[str | None, Exception | None]:
+    """Compute the digest of a single Turtle file, returning any Turtle Canon exception
+    or warning.
+
+    Parameters:
+        turtle_file: Path to the Turtle file.
+        parser: The Turtle parser to use, see `turtle_canon.utils.options.PARSERS`.
+
+    Returns:
+        The digest of the Turtle file's graph (if it could be computed) and the caught
+        Turtle Canon exception or warning (if any was raised).
+
+    """
+    from turtle_canon.canon import digest
+    from turtle_canon.utils.exceptions import TurtleCanonException
+    from turtle_canon.utils.warnings import TurtleCanonWarning
+
+    try:
+        return digest(turtle_file, parser=parser), None
+    except (TurtleCanonException, TurtleCanonWarning) as exception:
+        return None, exception
+
+
+def _canonize_files(
+    turtle_files: Iterable[Path],
+    jobs: int,
+    cache_dir: Path | None = None,
+    **options: Any,
+) -> Generator[tuple[int, Path | None, Exception | None]]:
+    """Canonize Turtle files, possibly in parallel.
+
+    Parameters:
+        turtle_files: Paths to the Turtle files.
+        jobs: The number of worker processes to use. If it is 1 (or less), the files
+            are canonized one at a time in the current process.
+        cache_dir: The persistent cache directory. If `None`, no cache is used.
+        **options: Further options for `_canonize_file()`.
+
+    Yields:
+        The index of the Turtle file in `turtle_files`, the changed file (if it was
+        changed) and the caught Turtle Canon exception or warning (if any was raised).
+        For parallel runs, the results are yielded in the order they complete.
+        Closing the generator cancels all pending work.
+
+    """
+    return _process_files(
+        partial(_canonize_file, cache_dir=cache_dir, **options), turtle_files, jobs
+    )
+
+
+def _measure_files(
+    turtle_files: Iterable[Path],
+    jobs: int,
+    measured: dict[int, Metrics],
+    cache_dir: Path | None = None,
+    **options: Any,
+) -> Generator[tuple[int, Path | None, Exception | None]]:
+    """Canonize Turtle files like `_canonize_files()`, recording their metrics.
+
+    Parameters:
+        turtle_files: Paths to the Turtle files.
+        jobs: The number of worker processes to use.
+        measured: The metrics of each Turtle file, by its index in `turtle_files`,
+            added to as the files are canonized.
+        cache_dir: The persistent cache directory. If `None`, no cache is used.
+        **options: Further options for `_measure_file()`.
+
+    Yields:
+        The same as `_canonize_files()`.
+
+    """
+    results = _process_files(
+        partial(_measure_file, cache_dir=cache_dir, **options), turtle_files, jobs
+    )
+    try:
+        for index, metrics, exception in results:
+            measured[index] = metrics
+            changed_file = None
+            if metrics.changed and metrics.file is not None:
+                changed_file = Path(metrics.file)
+            yield index, changed_file, exception
+    finally:
+        results.close()
+
+
+def _process_files(
+    process_file: Callable[[Path], tuple[T, Exception | None]],
+    turtle_files: Iterable[Path],
+    jobs: int,
+) -> Generator[tuple[int, T, Exception | None]]:
+    """Process Turtle files, possibly in parallel.
+
+    Parameters:
+        process_file: The (picklable) function to process a single Turtle file with,
+            returning its result and the caught Turtle Canon exception or warning.
+        turtle_files: Paths to the Turtle files. For parallel runs, the files are
+            submitted to the workers as they are iterated over, with a bounded number
+            of files waiting, such that, e.g., the files in directories are processed
+            while the directories are being walked.
+        jobs: The number of worker processes to use. If it is 1 (or less), the files
+            are processed one at a time in the current process.
+
+    Yields:
+        The index of the Turtle file in `turtle_files`, the result and the caught
+        Turtle Canon exception or warning (if any was raised).
+        For parallel runs, the results are yielded in the order they complete.
+        Closing the generator cancels all pending work.
+
+    """
+    if jobs <= 1:
+        for index, turtle_file in enumerate(turtle_files):
+            yield index, *process_file(turtle_file)
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+        futures: dict[Future[tuple[T, Exception | None]], int] = {}
+        try:
+            for index, turtle_file in enumerate(turtle_files):
+                futures[executor.submit(process_file, turtle_file)] = index
+                done = {future for future in futures if future.done()}
+                if len(futures) - len(done) >= jobs * PENDING_FILES_PER_JOB:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield futures.pop(future), *future.result()
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield futures.pop(future), *future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
 
 def main(args: list[str] | None = None) -> None:
     """Turtle Canon - It's turtles all the way down."""
+    from itertools import chain, islice
+
     from turtle_canon import __version__
-    from turtle_canon.canon import canonize
     from turtle_canon.cli import utils
+    from turtle_canon.cli.daemon import canonize_files as canonize_with_daemon
+    from turtle_canon.cli.daemon import default_socket_path, serve
+    from turtle_canon.utils.cache import DEFAULT_CACHE_DIR
     from turtle_canon.utils.exceptions import TurtleCanonException
+    from turtle_canon.utils.git import changed_files
+    from turtle_canon.utils.options import PARSERS, VERIFICATION_LEVELS
     from turtle_canon.utils.warnings import TurtleCanonWarning
 
+    if args is None:
+        args = sys.argv[1:]
+    if args[:1] == ["diff"]:
+        from turtle_canon.cli.cmd_diff import main as diff_main
+
+        diff_main(args[1:])
+
     parser = argparse.ArgumentParser(
         description=main.__doc__,
+        epilog=(
+            "Run 'turtle-canon diff --help' to show the triples removed and added "
+            "between two versions of an ontology. To canonize a file named 'diff', "
+            "use, e.g., './diff'."
+        ),
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
     parser.add_argument(
@@ -59,48 +409,594 @@ def main(args: list[str] | None = None) -> None:
             "to be canonized, and a summary will be printed at the end."
         ),
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help=(
+            "The number of worker processes to use when canonizing multiple files. "
+            "Use 1 to canonize the files one at a time in the current process."
+        ),
+        default=os.cpu_count() or 1,
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help=(
+            "The directory of the persistent cache of already canonical content. Files "
+            "with content found in the cache are skipped."
+        ),
+        default=Path(DEFAULT_CACHE_DIR),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not use (or create) the persistent cache.",
+    )
+    parser.add_argument(
+        "--verify",
+        type=str,
+        help=(
+            "The level of verification of the sorted triples, with increasing cost: "
+            "'none' (no verification), 'count' (number of triples), 'digest' "
+            "(order-independent checksum of the triples), 'full' (sets of the "
+            "triples), 'roundtrip' (re-parse the exported Turtle and compare with the "
+            "original graph)."
+        ),
+        choices=VERIFICATION_LEVELS,
+        default="digest",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help=(
+            "Only check whether the Turtle files are canonical, without writing to "
+            "them. Exit with a non-zero status if any file would be changed."
+        ),
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=_memory_size,
+        help=(
+            "The maximum amount of memory to use for sorting the lines of an "
+            "N-Triples or N-Quads file, e.g., '2G' or '512M'. Beyond it, sorted runs "
+            "of lines are spilled to temporary files next to the file and merged. By "
+            "default, all lines are sorted in memory. Turtle files are canonized in "
+            "memory, hence they are reported as errors if it is given."
+        ),
+        metavar="SIZE",
+    )
+    parser.add_argument(
+        "--parser",
+        type=str,
+        help=(
+            "The Turtle parser to use: 'rdflib' (RDFlib's Turtle parser) or 'fast' (a "
+            "faster parser for the common subset of Turtle, falling back to RDFlib's "
+            "Turtle parser for anything outside of it)."
+        ),
+        choices=PARSERS,
+        default="rdflib",
+    )
+    parser.add_argument(
+        "--canonical-blank-nodes",
+        action="store_true",
+        help=(
+            "Relabel blank nodes with canonical labels derived from their "
+            "neighbourhoods, such that the same content is always canonized in the "
+            "same way. Otherwise, blank nodes are ordered by the identifiers generated "
+            "when parsing, which differ between runs."
+        ),
+    )
+    parser.add_argument(
+        "--digest",
+        action="store_true",
+        help=(
+            "Print an order-independent digest of the graph in each Turtle file, "
+            "instead of canonizing it. Files holding the same graph have the same "
+            "digest, independent of the order of the triples and of the identifiers "
+            "of blank nodes. The files are only parsed, never written to. Memory "
+            "grows with the number of triples in each file, since duplicate triples "
+            "are only counted once."
+        ),
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help=(
+            "Run a daemon, keeping RDFlib loaded, and canonize (or check) the files "
+            "of other 'turtle-canon' calls until interrupted. Other calls send their "
+            "files to the daemon if it is running, which saves the start-up time of "
+            "each call. Since the daemon canonizes the files one at a time, large "
+            "batches of files are canonized in parallel instead, unless '--jobs 1' "
+            "is given."
+        ),
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help="The Unix domain socket of the daemon.",
+        default=default_socket_path(),
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Canonize the files in this process, even if a daemon is running.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="append",
+        type=Path,
+        help=(
+            "Watch a directory, including its subdirectories, and canonize the "
+            "Turtle files in it as they are changed, until interrupted. Can be given "
+            "multiple times."
+        ),
+        metavar="DIRECTORY",
+    )
+    parser.add_argument(
+        "--changed-since",
+        type=str,
+        help=(
+            "Only canonize the Turtle files added, modified or renamed since a Git "
+            "revision, e.g., 'origin/main', including changes that are staged or not "
+            "committed yet. Any TURTLE_FILE (or directory) given limits the files to "
+            "those paths."
+        ),
+        metavar="REVISION",
+    )
+    parser.add_argument(
+        "--untracked",
+        action="store_true",
+        help=(
+            "With --changed-since, canonize the untracked (and not ignored) Turtle "
+            "files as well."
+        ),
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        type=str,
+        # The default is given in the help, since the patterns given replace it
+        default=argparse.SUPPRESS,
+        help=(
+            "A pattern of the files to canonize in directories given as TURTLE_FILE, "
+            "in the style of '.gitignore' files: without a slash, it matches file "
+            "names, e.g., '*.ttl', otherwise paths relative to the directory, e.g., "
+            "'ontologies/**/*.ttl'. Can be given multiple times. (default: *.ttl)"
+        ),
+        metavar="PATTERN",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        type=str,
+        default=argparse.SUPPRESS,
+        help=(
+            "A pattern of the files and directories to skip in directories given as "
+            "TURTLE_FILE, in the style of '.gitignore' files, e.g., 'vendor/**'. Can "
+            "be given multiple times."
+        ),
+        metavar="PATTERN",
+    )
+    parser.add_argument(
+        "--no-gitignore",
+        action="store_true",
+        help=(
+            "Do not skip the files and directories ignored by '.gitignore' files in "
+            "directories given as TURTLE_FILE."
+        ),
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help=(
+            "Print a table of the time of each stage of canonizing each file, and the "
+            "overall throughput."
+        ),
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        help=(
+            "Write a JSON report of the metrics of canonizing each file, i.e., the "
+            "time of each stage, the number of triples and bytes, and the peak memory "
+            "usage, as well as the overall throughput, to a file."
+        ),
+        metavar="FILE",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        help=(
+            "Profile canonizing each file with cProfile, writing the statistics to a "
+            "'.pstats' file per file in a directory, e.g., to be inspected with "
+            "'python -m pstats'."
+        ),
+        metavar="DIRECTORY",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help=(
+            "Trace the memory allocated while canonizing each file with tracemalloc, "
+            "and print the peak, as well as the allocation sites of the memory in use "
+            "when the most memory is in use. This slows down the canonization "
+            "considerably."
+        ),
+    )
     parser.add_argument(
         "turtle_files",
         action="extend",
-        nargs="+",
+        nargs="*",
         type=Path,
         help=(
             "Path to the Turtle file. Can be relative or absolute. Example: "
-            "'../my_ontology.ttl'."
+            "'../my_ontology.ttl'. Directories are searched recursively for Turtle "
+            "files, see --include and --exclude. N-Triples ('.nt') and N-Quads "
+            "('.nq') files are canonized as sorted, canonical N-Triples (or N-Quads) "
+            "instead. Use '-' to read Turtle from standard input and write the "
+            "canonized Turtle to standard output, e.g., as a git clean filter."
         ),
         metavar="TURTLE_FILE",
     )
 
     parsed_args: CLIArgs = parser.parse_args(args)  # type: ignore[assignment]
 
-    cache = utils.Cache()
+    if parsed_args.jobs < 1:
+        parser.error("argument -j/--jobs: must be a positive integer")
 
-    number_of_turtle_files = len(parsed_args.turtle_files)
+    logging.basicConfig(
+        level=parsed_args.log_level.upper(), format="%(levelname)s: %(message)s"
+    )
 
-    while parsed_args.turtle_files:
-        turtle_file = parsed_args.turtle_files.pop()
-        changed_file = None
+    if parsed_args.daemon:
         try:
-            changed_file = canonize(turtle_file)
-            if changed_file:
-                cache.add_file(changed_file)
+            serve(parsed_args.socket)
         except TurtleCanonException as exception:
-            if parsed_args.fail_fast:
-                utils.print_error(exception)
-            else:
-                cache.add_error(exception)
-        except TurtleCanonWarning as warning:
+            utils.print_error(exception)
+        sys.exit()
+
+    options: dict[str, Any] = {
+        "cache_dir": None if parsed_args.no_cache else parsed_args.cache_dir.resolve(),
+        "verify": parsed_args.verify,
+        "check": parsed_args.check,
+        "max_memory": parsed_args.max_memory,
+        "parser": parsed_args.parser,
+        "canonical_blank_nodes": parsed_args.canonical_blank_nodes,
+    }
+
+    if parsed_args.watch:
+        if (
+            parsed_args.turtle_files
+            or parsed_args.check
+            or parsed_args.digest
+            or parsed_args.max_memory is not None
+        ):
+            parser.error(
+                "argument --watch: cannot be combined with TURTLE_FILE, --check, "
+                "--digest or --max-memory"
+            )
+        for directory in parsed_args.watch:
+            if not directory.is_dir():
+                parser.error(f"argument --watch: not a directory: '{directory}'")
+        _watch(
+            parsed_args.watch,
+            **{key: value for key, value in options.items() if key != "check"},
+        )
+
+    if parsed_args.untracked and parsed_args.changed_since is None:
+        parser.error("argument --untracked: requires --changed-since")
+
+    if parsed_args.changed_since is not None:
+        if STDIN in parsed_args.turtle_files:
+            parser.error("argument --changed-since: cannot be combined with '-'")
+        try:
+            parsed_args.turtle_files = changed_files(
+                parsed_args.changed_since,
+                parsed_args.turtle_files,
+                untracked=parsed_args.untracked,
+            )
+        except TurtleCanonException as exception:
+            utils.print_error(exception)
+    elif not parsed_args.turtle_files:
+        parser.error("the following arguments are required: TURTLE_FILE")
+
+    if STDIN in parsed_args.turtle_files:
+        if len(parsed_args.turtle_files) > 1:
+            parser.error(
+                "argument TURTLE_FILE: '-' cannot be combined with other files"
+            )
+        if (
+            parsed_args.check
+            or parsed_args.digest
+            or parsed_args.max_memory is not None
+        ):
+            parser.error(
+                "argument TURTLE_FILE: '-' cannot be used with --check, --digest or "
+                "--max-memory"
+            )
+        _canonize_stdin(parsed_args)
+
+    cache = utils.Cache()
+
+    # The files in directories are canonized as they are discovered
+    turtle_files: Iterable[Path] = parsed_args.turtle_files
+    jobs = min(parsed_args.jobs, len(parsed_args.turtle_files))
+    if any(path.is_dir() for path in parsed_args.turtle_files):
+        turtle_files = _discover_files(parsed_args)
+        jobs = parsed_args.jobs
+
+    if parsed_args.digest:
+        _print_digests(parsed_args, turtle_files, jobs, cache)
+
+    # Metrics are only recorded when canonizing the files in this process (or its
+    # worker processes), not by the daemon
+    profiling: dict[str, Any] = {
+        "profile_dir": parsed_args.profile,
+        "trace_memory": parsed_args.trace_memory,
+    }
+    measured: dict[int, Metrics] | None = (
+        {}
+        if parsed_args.timings or parsed_args.report or any(profiling.values())
+        else None
+    )
+    start = time.perf_counter()
+    results = None
+    if measured is None and not parsed_args.no_daemon and parsed_args.socket.exists():
+        # The daemon is sent all of the files at once, but since it canonizes them one
+        # at a time, only small batches of files are sent if worker processes are used
+        remaining = iter(turtle_files)
+        batch = list(islice(remaining, DAEMON_MAX_FILES + 1))
+        if jobs <= 1 or len(batch) <= DAEMON_MAX_FILES:
+            turtle_files = [*batch, *remaining]
+            results = canonize_with_daemon(parsed_args.socket, turtle_files, **options)
+        else:
+            turtle_files = chain(batch, remaining)
+    if results is None:
+        results = (
+            _canonize_files(turtle_files, jobs=jobs, **options)
+            if measured is None
+            else _measure_files(turtle_files, jobs, measured, **profiling, **options)
+        )
+    outcomes: dict[int, tuple[Path | None, Exception | None]] = {}
+    for index, changed_file, exception in results:
+        if isinstance(exception, TurtleCanonException) and parsed_args.fail_fast:
+            results.close()
+            utils.print_error(exception)
+        outcomes[index] = (changed_file, exception)
+    wall_time = time.perf_counter() - start
+
+    number_of_turtle_files = len(parsed_args.turtle_files)
+
+    # Keep the summary in the order the files were given
+    for index in sorted(outcomes):
+        changed_file, exception = outcomes[index]
+        if isinstance(exception, TurtleCanonException):
+            cache.add_error(exception)
+        elif isinstance(exception, TurtleCanonWarning):
             if number_of_turtle_files == 1:
-                utils.print_warning(warning)
-            cache.add_warning(warning)
-            if changed_file:
-                cache.add_file(changed_file)
+                utils.print_warning(exception)
+            cache.add_warning(exception)
+        if changed_file:
+            cache.add_file(changed_file)
 
     if number_of_turtle_files == 1 and cache.warnings:
         pass
     else:
         utils.print_summary(errors=cache.errors, warnings=cache.warnings)
 
-    utils.print_changed_files(cache.files, exit_after=bool(cache.errors))
+    if measured is not None:
+        _report_metrics(parsed_args, [measured[_] for _ in sorted(measured)], wall_time)
+
+    utils.print_changed_files(
+        cache.files,
+        exit_after=bool(cache.errors) or (parsed_args.check and bool(cache.files)),
+        title="Files that would be changed" if parsed_args.check else "Changed files",
+    )
+
+    sys.exit()
+
+
+def _print_digests(
+    parsed_args: CLIArgs, turtle_files: Iterable[Path], jobs: int, cache: Cache
+) -> None:
+    """Print the digest of each Turtle file, in the order the files were given.
+
+    Each digest is printed on a line of its own, followed by two spaces and the path
+    to the Turtle file, similar to the output of `sha256sum`.
+
+    Parameters:
+        parsed_args: The parsed CLI arguments.
+        turtle_files: Paths to the Turtle files, as given or as discovered, see
+            `_discover_files()`.
+        jobs: The number of worker processes to use.
+        cache: The CLI cache of errors and warnings.
+
+    """
+    from turtle_canon.cli import utils
+    from turtle_canon.utils.exceptions import TurtleCanonException
+
+    results = _process_files(
+        partial(_digest_file, parser=parsed_args.parser), turtle_files, jobs
+    )
+    outcomes: dict[int, tuple[str | None, Exception | None]] = {}
+    for index, digest, exception in results:
+        if isinstance(exception, TurtleCanonException) and parsed_args.fail_fast:
+            results.close()
+            utils.print_error(exception)
+        outcomes[index] = (digest, exception)
+
+    for index in sorted(outcomes):
+        digest, exception = outcomes[index]
+        if isinstance(exception, TurtleCanonException):
+            cache.add_error(exception)
+        elif exception is not None:
+            cache.add_warning(exception)
+        if digest is not None:
+            utils.print_digest(digest, parsed_args.turtle_files[index])
+
+    if cache.errors or cache.warnings:
+        utils.print_summary(
+            errors=cache.errors, warnings=cache.warnings, exit_after=bool(cache.errors)
+        )
+    sys.exit()
+
+
+def _report_metrics(
+    parsed_args: CLIArgs, metrics: list[Metrics], wall_time: float
+) -> None:
+    """Print the metrics of canonizing the Turtle files and/or write them to a report.
+
+    Parameters:
+        parsed_args: The parsed CLI arguments.
+        metrics: The metrics of each Turtle file, in the order the files were given.
+        wall_time: The wall time in seconds of canonizing all of the files.
+
+    """
+    import json
+
+    from turtle_canon import __version__
+    from turtle_canon.cli import utils
+    from turtle_canon.utils.metrics import summarize
+
+    summary = summarize(metrics, wall_time)
+    if parsed_args.timings:
+        utils.print_timings(metrics, summary)
+    if parsed_args.trace_memory:
+        utils.print_memory_traces(metrics)
+
+    if parsed_args.report is not None:
+        report = {
+            "version": __version__,
+            "options": {
+                "jobs": parsed_args.jobs,
+                "verify": parsed_args.verify,
+                "parser": parsed_args.parser,
+                "check": parsed_args.check,
+                "canonical_blank_nodes": parsed_args.canonical_blank_nodes,
+                "cache": not parsed_args.no_cache,
+            },
+            "files": [_.as_dict() for _ in metrics],
+            "summary": summary,
+        }
+        try:
+            parsed_args.report.write_text(
+                json.dumps(report, indent=2) + "\n", encoding="utf8"
+            )
+        except OSError as exc:
+            utils.print_error(f"Cannot write the report to {parsed_args.report}: {exc}")
+
 
+def _discover_files(parsed_args: CLIArgs) -> Generator[Path]:
+    """Discover the Turtle files in the files and directories given.
+
+    The given files and directories in `parsed_args.turtle_files` are replaced with the
+    discovered files, as they are discovered.
+
+    Parameters:
+        parsed_args: The parsed CLI arguments.
+
+    Yields:
+        The Turtle files, as they are discovered.
+
+    """
+    from turtle_canon.utils.discovery import DEFAULT_INCLUDE, discover
+
+    paths, parsed_args.turtle_files = parsed_args.turtle_files, []
+    for turtle_file in discover(
+        paths,
+        include=getattr(parsed_args, "include", None) or DEFAULT_INCLUDE,
+        exclude=getattr(parsed_args, "exclude", None) or (),
+        gitignore=not parsed_args.no_gitignore,
+    ):
+        parsed_args.turtle_files.append(turtle_file)
+        yield turtle_file
+
+
+def _canonize_stdin(parsed_args: CLIArgs) -> None:
+    """Canonize Turtle read from standard input, writing it to standard output.
+
+    Content without any triples is written back as-is, after printing a warning, such
+    that, e.g., a git clean filter passes it on unchanged.
+
+    Parameters:
+        parsed_args: The parsed CLI arguments.
+
+    """
+    from turtle_canon.canon import canonize_stream
+    from turtle_canon.cli import utils
+    from turtle_canon.utils.exceptions import TurtleCanonException
+    from turtle_canon.utils.warnings import TurtleCanonWarning
+
+    content = sys.stdin.buffer.read()
+    try:
+        try:
+            canonize_stream(
+                content,
+                sys.stdout.buffer,
+                verify=parsed_args.verify,
+                parser=parsed_args.parser,
+                canonical_blank_nodes=parsed_args.canonical_blank_nodes,
+            )
+        except TurtleCanonException as exception:
+            utils.print_error(exception)
+        except TurtleCanonWarning as warning:
+            utils.print_warning(warning)
+            sys.stdout.buffer.write(content)
+        sys.stdout.buffer.flush()
+    except BrokenPipeError:
+        # The reader of standard output has gone, e.g., `turtle-canon - | head`.
+        # Standard output is redirected to avoid another error when exiting.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    sys.exit()
+
+
+def _watch(
+    directories: Sequence[Path],
+    cache_dir: Path | None = None,
+    **options: Any,
+) -> None:
+    """Canonize the Turtle files in directories as they are changed, until interrupted.
+
+    The files are canonized in this process, keeping RDFlib loaded between changes.
+    The content written when canonizing a file is canonical, and is kept in an
+    in-memory cache, hence the changes made by canonizing a file are detected, but the
+    file is not parsed again.
+
+    Parameters:
+        directories: The directories to watch, including their subdirectories.
+        cache_dir: The persistent cache directory. If `None`, no persistent cache is
+            used.
+        **options: Further options for `turtle_canon.canon.canonize()`.
+
+    """
+    import signal
+
+    from turtle_canon.canon import canonize
+    from turtle_canon.cli import utils
+    from turtle_canon.utils.cache import CanonCache, MemoryCanonCache
+    from turtle_canon.utils.exceptions import TurtleCanonException
+    from turtle_canon.utils.warnings import TurtleCanonWarning
+    from turtle_canon.utils.watch import watch
+
+    cache = MemoryCanonCache(
+        backing=CanonCache(cache_dir) if cache_dir is not None else None
+    )
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit())
+    utils.print_watching(directories)
+    try:
+        for turtle_files in watch(directories):
+            for turtle_file in turtle_files:
+                try:
+                    changed_file = canonize(turtle_file, cache=cache, **options)
+                except TurtleCanonException as exception:
+                    utils.print_error(exception, exit_after=False)
+                except TurtleCanonWarning as warning:
+                    utils.print_warning(warning)
+                else:
+                    if changed_file:
+                        utils.print_changed_files([changed_file])
+    except KeyboardInterrupt:
+        pass
     sys.exit()
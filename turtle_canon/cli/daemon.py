@@ -0,0 +1,350 @@
+"""A long-running daemon canonizing Turtle files on behalf of `turtle-canon`.
+
+Most of the time of canonizing a small Turtle file goes into starting Python and
+importing RDFlib.
+The daemon, started with `turtle-canon --daemon`, imports RDFlib once and serves
+canonization (and check) requests over a Unix domain socket.
+`turtle-canon` sends its files to the daemon if it is running, and otherwise canonizes
+them in its own process.
+Until then, `turtle-canon` does not import RDFlib.
+
+The daemon keeps the keys of canonical content in memory, in front of the persistent
+cache, see `turtle_canon.utils.cache.MemoryCanonCache`, hence unchanged files are
+skipped without touching the disk cache.
+Requests are served one at a time, in the order they arrive, hence `turtle-canon` only
+sends small batches of files to the daemon, unless it uses a single worker process,
+see `turtle_canon.cli.cmd_turtle_canon.DAEMON_MAX_FILES`.
+
+The protocol consists of lines of JSON:
+
+1. The client sends a request with the Turtle Canon version, the command (`canonize`
+   or `check`), the absolute paths of the files, the cache directory and the options.
+2. The daemon replies with its Turtle Canon version, such that a client of another
+   version falls back to canonizing in its own process.
+3. The daemon sends a result for each file, as it has been canonized, with the index
+   of the file, whether or not it was (or would be) changed, and the Turtle Canon
+   exception or warning raised, if any.
+
+The socket is only accessible by the user running the daemon.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Generator, Sequence
+    from io import BufferedIOBase
+    from typing import Any
+
+    from turtle_canon.utils.cache import MemoryCanonCache
+
+COMMANDS = ("canonize", "check")
+"""The commands served by the daemon."""
+
+
+def default_socket_path() -> Path:
+    """Return the default path of the daemon's Unix domain socket.
+
+    The socket is placed in the user's runtime directory (`XDG_RUNTIME_DIR`), if set,
+    and otherwise in the temporary directory, named after the user's ID.
+    Since other users may create a socket of that name in the temporary directory
+    first, only sockets owned by the user are connected to.
+    """
+    from tempfile import gettempdir
+
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    user = f"-{os.getuid()}" if hasattr(os, "getuid") else ""
+    return Path(runtime_dir or gettempdir()) / f"turtle-canon{user}.sock"
+
+
+def serve(socket_path: Path) -> None:
+    """Serve canonization requests until interrupted or terminated.
+
+    Parameters:
+        socket_path: The path of the Unix domain socket to listen on.
+
+    """
+    import signal
+
+    from turtle_canon.cli import utils
+    from turtle_canon.utils.exceptions import DaemonError
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonError("The daemon requires Unix domain sockets.")
+
+    existing = _connect(socket_path)
+    if existing is not None:
+        existing.close()
+        raise DaemonError(f"A daemon is already listening on {socket_path}.")
+
+    # Import the canonization machinery (and thereby RDFlib and its plugins) up front
+    import turtle_canon.canon  # noqa: F401
+
+    # A socket file left behind by a daemon that did not exit cleanly is stale
+    try:
+        socket_path.unlink(missing_ok=True)
+    except OSError as exc:
+        raise DaemonError(f"Cannot listen on {socket_path}: {exc}") from exc
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        server.bind(str(socket_path))
+    except OSError as exc:
+        server.close()
+        raise DaemonError(f"Cannot listen on {socket_path}: {exc}") from exc
+    finally:
+        os.umask(umask)
+
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit())
+    caches: dict[str | None, MemoryCanonCache] = {}
+    try:
+        server.listen()
+        utils._print_message(f"Serving on {socket_path}", target=sys.stdout, prefix="")
+        while True:
+            connection, _ = server.accept()
+            try:
+                with connection, connection.makefile("rwb") as stream:
+                    _serve_request(stream, caches)
+            except OSError:
+                # The client has gone, e.g., after failing fast
+                continue
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        socket_path.unlink(missing_ok=True)
+
+
+def _serve_request(
+    stream: BufferedIOBase, caches: dict[str | None, MemoryCanonCache]
+) -> None:
+    """Serve a single request, sending a result for each file as it is canonized.
+
+    An `OSError` is raised if the client has gone.
+
+    Parameters:
+        stream: The connection to the client.
+        caches: The in-memory caches, by cache directory.
+
+    """
+    from turtle_canon import __version__
+    from turtle_canon.canon import canonize, check
+    from turtle_canon.utils.exceptions import TurtleCanonException
+    from turtle_canon.utils.warnings import TurtleCanonWarning
+
+    request = _receive(stream)
+    _send(stream, {"version": __version__})
+    if (
+        not isinstance(request, dict)
+        or request.get("version") != __version__
+        or request.get("command") not in COMMANDS
+    ):
+        return
+
+    cache_dir = request.get("cache_dir")
+    if cache_dir not in caches:
+        caches[cache_dir] = _memory_cache(cache_dir)
+    function = check if request["command"] == "check" else canonize
+
+    for index, turtle_file in enumerate(request.get("files", [])):
+        exception: Exception | None = None
+        try:
+            changed = (
+                function(turtle_file, cache=caches[cache_dir], **request["options"])
+                is not None
+            )
+        except (TurtleCanonException, TurtleCanonWarning) as caught:
+            changed, exception = False, caught
+        except Exception as caught:  # noqa: BLE001
+            # Keep serving other requests, reporting the error to the client
+            changed = False
+            exception = TurtleCanonException(
+                f"Unexpected error when canonizing {turtle_file}: {caught!r}"
+            )
+
+        _send(
+            stream,
+            {
+                "index": index,
+                "changed": changed,
+                "exception": _encode_exception(exception),
+            },
+        )
+
+
+def _memory_cache(cache_dir: str | None) -> MemoryCanonCache:
+    """Create the in-memory cache for a cache directory (or no persistent cache)."""
+    from turtle_canon.utils.cache import CanonCache, MemoryCanonCache
+
+    return MemoryCanonCache(
+        backing=CanonCache(cache_dir) if cache_dir is not None else None
+    )
+
+
+def canonize_files(
+    socket_path: Path,
+    turtle_files: Sequence[Path],
+    cache_dir: Path | None = None,
+    check: bool = False,
+    **options: Any,
+) -> Generator[tuple[int, Path | None, Exception | None]] | None:
+    """Canonize Turtle files with the daemon, if it is running.
+
+    Parameters:
+        socket_path: The path of the daemon's Unix domain socket.
+        turtle_files: Paths to the Turtle files.
+        cache_dir: The persistent cache directory. If `None`, no persistent cache is
+            used.
+        check: Whether or not to only check the Turtle files, without writing to them.
+        **options: Further options for `turtle_canon.canon.canonize()` or
+            `turtle_canon.canon.check()`.
+
+    Returns:
+        A generator of the results as they arrive, like
+        `turtle_canon.cli.cmd_turtle_canon._canonize_files()`, or `None` if no daemon
+        of the same Turtle Canon version is running, in which case the files should
+        be canonized in-process instead.
+
+    """
+    from turtle_canon import __version__
+
+    connection = _connect(socket_path)
+    if connection is None:
+        return None
+
+    stream = connection.makefile("rwb")
+    try:
+        _send(
+            stream,
+            {
+                "version": __version__,
+                "command": "check" if check else "canonize",
+                "files": [str(Path(_).resolve()) for _ in turtle_files],
+                "cache_dir": None if cache_dir is None else str(cache_dir),
+                "options": options,
+            },
+        )
+        reply = _receive(stream)
+    except OSError:
+        reply = None
+    if not isinstance(reply, dict) or reply.get("version") != __version__:
+        stream.close()
+        connection.close()
+        return None
+
+    return _results(connection, stream, turtle_files)
+
+
+def _results(
+    connection: socket.socket, stream: BufferedIOBase, turtle_files: Sequence[Path]
+) -> Generator[tuple[int, Path | None, Exception | None]]:
+    """Yield the results sent by the daemon, closing the connection when done.
+
+    Files the daemon did not send a result for, e.g., since it was stopped, are
+    reported as failed.
+    """
+    from turtle_canon.utils.exceptions import DaemonError
+
+    pending = set(range(len(turtle_files)))
+    try:
+        while pending:
+            try:
+                result = _receive(stream)
+            except OSError:
+                result = None
+            if not isinstance(result, dict):
+                break
+            index = result["index"]
+            pending.discard(index)
+            yield (
+                index,
+                turtle_files[index] if result["changed"] else None,
+                _decode_exception(result["exception"]),
+            )
+
+        for index in sorted(pending):
+            yield (
+                index,
+                None,
+                DaemonError(
+                    f"The daemon stopped before canonizing {turtle_files[index]}."
+                ),
+            )
+    finally:
+        stream.close()
+        connection.close()
+
+
+def _connect(socket_path: Path) -> socket.socket | None:
+    """Connect to the daemon, returning `None` if it is not running.
+
+    A socket owned by another user is not connected to, since its daemon would learn
+    the paths of the files and could report any result for them.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        if hasattr(os, "getuid") and socket_path.stat().st_uid != os.getuid():
+            return None
+    except OSError:
+        return None
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(str(socket_path))
+    except OSError:
+        connection.close()
+        return None
+    return connection
+
+
+def _send(stream: BufferedIOBase, message: dict[str, Any]) -> None:
+    """Send a message as a line of JSON."""
+    stream.write(json.dumps(message).encode("utf8") + b"\n")
+    stream.flush()
+
+
+def _receive(stream: BufferedIOBase) -> Any:
+    """Receive a message sent as a line of JSON, or `None` if the connection closed."""
+    line = stream.readline()
+    if not line:
+        return None
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def _encode_exception(exception: Exception | None) -> dict[str, Any] | None:
+    """Encode a Turtle Canon exception or warning as JSON."""
+    from turtle_canon.utils.warnings import TurtleCanonWarning
+
+    if exception is None:
+        return None
+    return {
+        "type": type(exception).__name__,
+        "warning": isinstance(exception, TurtleCanonWarning),
+        "message": str(exception),
+    }
+
+
+def _decode_exception(encoded: dict[str, Any] | None) -> Exception | None:
+    """Decode a Turtle Canon exception or warning from JSON."""
+    from turtle_canon.utils import exceptions, warnings
+
+    if encoded is None:
+        return None
+    module, base = (
+        (warnings, warnings.TurtleCanonWarning)
+        if encoded["warning"]
+        else (exceptions, exceptions.TurtleCanonException)
+    )
+    exception_type = getattr(module, encoded["type"], base)
+    if not (isinstance(exception_type, type) and issubclass(exception_type, base)):
+        exception_type = base
+    return exception_type(encoded["message"])
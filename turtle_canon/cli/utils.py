@@ -8,7 +8,9 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Sequence
-    from typing import TextIO
+    from typing import Any, TextIO
+
+    from turtle_canon.utils.metrics import Metrics
 
 
 class Cache:
@@ -143,15 +145,134 @@ def print_summary(
     _print_message(res[:-1], target=target, prefix="", exit_after=exit_after)
 
 
-def print_changed_files(files: Sequence[str | Path], exit_after: bool = False) -> None:
+def print_changed_files(
+    files: Sequence[str | Path],
+    exit_after: bool = False,
+    title: str = "Changed files",
+) -> None:
     """Print list of changed files.
 
     Parameters:
         files: List of files with changes.
         exit_after: Whether or not to call `sys.exit(1)` after printing the message.
+        title: The title of the list.
 
     """
-    res = "\nChanged files:\n"
+    res = f"\n{title}:\n"
     res += "{}\n".join(str(_) for _ in files)
 
     _print_message(res, target=sys.stdout, prefix="", exit_after=exit_after)
+
+
+def print_digest(digest: str, file: str | Path) -> None:
+    """Print the digest of a file, followed by two spaces and the path to the file.
+
+    Parameters:
+        digest: The digest of the file.
+        file: The path to the file.
+
+    """
+    _print_message(f"{digest}  {file}", target=sys.stdout, prefix="")
+
+
+def print_watching(directories: Sequence[str | Path]) -> None:
+    """Print the directories being watched for changed files.
+
+    Parameters:
+        directories: The directories being watched.
+
+    """
+    res = "Watching for changed Turtle files in:\n"
+    res += "\n".join(str(_) for _ in directories)
+    res += "\n\nPress Ctrl+C to stop."
+    _print_message(res, target=sys.stdout, prefix="")
+
+
+def print_timings(metrics: Sequence[Metrics], summary: dict[str, Any]) -> None:
+    """Print a table of the time of each stage of canonizing each file.
+
+    Parameters:
+        metrics: The metrics of each file.
+        summary: The summary of the metrics, see
+            `turtle_canon.utils.metrics.summarize()`.
+
+    """
+    from turtle_canon.utils.metrics import STAGES
+
+    headers = ["File", *STAGES, "total", "triples"]
+    rows = [
+        [
+            str(_.file),
+            *(_milliseconds(_.stages.get(stage)) for stage in STAGES),
+            _milliseconds(_.total),
+            "-" if _.triples is None else str(_.triples),
+        ]
+        for _ in metrics
+    ]
+    rows.append(
+        [
+            "Total",
+            *(_milliseconds(summary["stages"][stage]) for stage in STAGES),
+            _milliseconds(sum(summary["stages"].values())),
+            str(summary["triples"]),
+        ]
+    )
+    widths = [
+        max(len(row[column]) for row in [headers, *rows])
+        for column in range(len(headers))
+    ]
+
+    res = "\nTimings (ms):\n"
+    for row in [headers, *rows]:
+        res += "  ".join(
+            cell.ljust(width) if column == 0 else cell.rjust(width)
+            for column, (cell, width) in enumerate(zip(row, widths, strict=True))
+        ).rstrip()
+        res += "\n"
+
+    res += (
+        f"\n{summary['files']} file(s), {summary['triples']} triples and "
+        f"{summary['input_bytes'] / 1024**2:.2f} MB in {summary['wall_time']:.3f} s"
+    )
+    if summary["triples_per_second"] is not None:
+        res += (
+            f" ({summary['triples_per_second']:.0f} triples/s, "
+            f"{summary['megabytes_per_second']:.2f} MB/s)"
+        )
+    if summary["peak_rss"] is not None:
+        res += f", peak RSS {summary['peak_rss'] / 1024**2:.1f} MB"
+
+    _print_message(res, target=sys.stdout, prefix="")
+
+
+def print_memory_traces(metrics: Sequence[Metrics]) -> None:
+    """Print the peak of the memory traced while canonizing each file, and the
+    allocation sites of the memory in use when the most memory was in use.
+
+    Parameters:
+        metrics: The metrics of each file.
+
+    """
+    res = ""
+    for _ in metrics:
+        if _.memory is None:
+            continue
+        res += (
+            f"\nMemory traced for {_.file}: peak {_megabytes(_.memory.peak)} MB, "
+            f"{_megabytes(_.memory.current)} MB in use at:\n"
+        )
+        for location, size, count in _.memory.top:
+            res += f"  {_megabytes(size):>8} MB  {count:>8} blocks  {location}\n"
+
+    if res:
+        _print_message(res.rstrip("\n"), target=sys.stdout, prefix="")
+
+
+def _megabytes(size: int) -> str:
+    """Format a size in bytes as megabytes."""
+    return f"{size / 1024**2:.2f}"
+
+
+def _milliseconds(seconds: float | None) -> str:
+    """Format a time in seconds as milliseconds, or `-` if there is none."""
+    return "-" if seconds is None else f"{seconds * 1000:.1f}"
@@ -0,0 +1,194 @@
+"""Canonical labels for blank nodes.
+
+Blank node identifiers are generated when parsing, and differ each time the same
+content is parsed.
+Since triples are sorted by their terms, including the identifiers of their blank
+nodes, the order of blank nodes, e.g., of restrictions inlined as objects, as well as
+the labels of blank nodes referenced more than once would otherwise differ between
+runs.
+
+Canonical labels are instead derived from the blank nodes' neighbourhoods, by colour
+refinement:
+
+1. The blank nodes are split into components, connected by triples with more than one
+   blank node.
+   IRIs and literals are fixed anchors, hence the labels of the blank nodes in a
+   component only depend on the component, e.g., each OWL restriction, with any nested
+   restrictions and lists, is labelled on its own.
+2. All blank nodes of a component start with the same colour.
+   In each round, each blank node that still shares its colour with other blank nodes
+   of its component gets a new colour: a hash of its colour and of the sorted
+   signatures of its triples, in which IRIs and literals are represented by their N3
+   form and blank nodes by their colour.
+   Rounds are repeated for as long as colours are split.
+3. Blank nodes left sharing a colour cannot be told apart by their neighbourhoods,
+   typically, because they are interchangeable, e.g., the heads of two identical
+   lists.
+   One of them is then given a colour of its own, and the refinement continues.
+4. The label of a blank node is a hash of its colour and of the colours of its
+   component, such that components with a blank node of the same neighbourhood still
+   get different labels.
+   Identical components, i.e., components with the same colours, are interchangeable
+   and are numbered.
+
+This is not a general graph canonization: the individualization in step 3 picks an
+arbitrary blank node, which only leads to the same labelled triples if the tied blank
+nodes are interchangeable.
+This holds for the blank node patterns of ontologies (restrictions, axioms, lists),
+for which the labelling takes close to linear time.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from hashlib import blake2b
+from typing import TYPE_CHECKING
+
+from rdflib import BNode
+
+if TYPE_CHECKING:  # pragma: no cover
+    from array import array
+    from collections.abc import Iterable, Sequence
+
+    from rdflib.term import Node
+
+_DIGEST_SIZE = 16
+_INITIAL_COLOUR = blake2b(b"blank node", digest_size=_DIGEST_SIZE).digest()
+
+
+def _digest(data: bytes) -> bytes:
+    """A hash of some data, as a colour."""
+    return blake2b(data, digest_size=_DIGEST_SIZE).digest()
+
+
+def canonical_blank_node_labels(
+    terms: Sequence[Node], columns: tuple[array, array, array]
+) -> dict[int, str]:
+    """Compute canonical labels for the blank nodes among interned triples.
+
+    Parameters:
+        terms: The term dictionary, indexed by term ID.
+        columns: The subject, predicate and object term IDs of the triples.
+
+    Returns:
+        A mapping of the term ID of each blank node to its canonical label.
+
+    """
+    colours: dict[int, bytes] = {}
+    for term_id, term in enumerate(terms):
+        if isinstance(term, BNode):
+            colours[term_id] = _INITIAL_COLOUR
+    if not colours:
+        return {}
+
+    # The triples of each blank node, as its role in the triple and the other two terms
+    triples: dict[int, list[tuple[int, int, int]]] = {_: [] for _ in colours}
+    components = _Components(colours)
+    for subject, predicate, object_ in zip(*columns, strict=True):
+        blank_nodes = []
+        if subject in colours:
+            triples[subject].append((0, predicate, object_))
+            blank_nodes.append(subject)
+        if predicate in colours:
+            triples[predicate].append((1, subject, object_))
+            blank_nodes.append(predicate)
+        if object_ in colours:
+            triples[object_].append((2, subject, predicate))
+            blank_nodes.append(object_)
+        for blank_node in blank_nodes[1:]:
+            components.union(blank_nodes[0], blank_node)
+
+    # IRIs and literals are fixed, represented by a hash of their N3 form
+    for blank_node_triples in triples.values():
+        for _, *others in blank_node_triples:
+            for other in others:
+                if other not in colours:
+                    colours[other] = _digest(terms[other].n3().encode())
+
+    identical_components: defaultdict[bytes, list[list[int]]] = defaultdict(list)
+    for component in components.groups():
+        _refine(component, triples, colours)
+        identical_components[
+            _digest(b"".join(sorted(colours[_] for _ in component)))
+        ].append(component)
+
+    labels: dict[int, str] = {}
+    for component_colour, group in identical_components.items():
+        # Identical components are interchangeable, hence the order of numbering them
+        # does not matter
+        for number, component in enumerate(sorted(group, key=min)):
+            component_id = component_colour + number.to_bytes(8, "big")
+            for blank_node in component:
+                labels[blank_node] = (
+                    "b" + _digest(component_id + colours[blank_node]).hex()
+                )
+    return labels
+
+
+def _refine(
+    component: list[int],
+    triples: dict[int, list[tuple[int, int, int]]],
+    colours: dict[int, bytes],
+) -> None:
+    """Refine the colours of the blank nodes in a component until they are unique."""
+    unresolved = component
+    while unresolved:
+        number_of_colours = len({colours[_] for _ in unresolved})
+        refined = {
+            blank_node: _digest(
+                colours[blank_node]
+                + b"".join(
+                    sorted(
+                        bytes((role,)) + colours[first] + colours[second]
+                        for role, first, second in triples[blank_node]
+                    )
+                )
+            )
+            for blank_node in unresolved
+        }
+        colours.update(refined)
+
+        classes: defaultdict[bytes, list[int]] = defaultdict(list)
+        for blank_node in unresolved:
+            classes[colours[blank_node]].append(blank_node)
+        unresolved = [
+            blank_node
+            for members in classes.values()
+            if len(members) > 1
+            for blank_node in members
+        ]
+
+        if unresolved and len(classes) == number_of_colours:
+            # No colours were split, hence the tied blank nodes cannot be told apart
+            tied = classes[min(_ for _, members in classes.items() if len(members) > 1)]
+            individual = min(tied)
+            colours[individual] = _digest(colours[individual] + b"individual")
+            unresolved.remove(individual)
+
+
+class _Components:
+    """Disjoint sets of blank nodes (union-find), with path halving."""
+
+    def __init__(self, blank_nodes: Iterable[int]) -> None:
+        self._parents = {_: _ for _ in blank_nodes}
+
+    def find(self, blank_node: int) -> int:
+        """Return the representative of a blank node's component."""
+        parents = self._parents
+        while parents[blank_node] != blank_node:
+            parents[blank_node] = parents[parents[blank_node]]
+            blank_node = parents[blank_node]
+        return blank_node
+
+    def union(self, first: int, second: int) -> None:
+        """Merge the components of two blank nodes."""
+        first, second = self.find(first), self.find(second)
+        if first != second:
+            self._parents[max(first, second)] = min(first, second)
+
+    def groups(self) -> list[list[int]]:
+        """Return the blank nodes of each component."""
+        groups: defaultdict[int, list[int]] = defaultdict(list)
+        for blank_node in self._parents:
+            groups[self.find(blank_node)].append(blank_node)
+        return list(groups.values())
@@ -0,0 +1,348 @@
+"""Persistent on-disk cache of already canonical Turtle content.
+
+The cache records that a specific byte content is already canonical, keyed by a
+SHA-256 hash of the content together with the Turtle Canon and RDFlib versions, as well
+as the variant of the canonical form, e.g., with canonical blank node labels.
+A file whose content is found in the cache can be skipped entirely, without parsing,
+sorting or serializing it.
+
+Each entry is an empty file, named after its key, stored in a subdirectory named after
+the first two characters of the key.
+An entry's modification time is used as its last access time, which is the basis for
+the least-recently-used (LRU) eviction when the cache grows beyond its bound.
+The number of entries is kept in a file next to the subdirectories, such that
+recording an entry does not require counting all entries. Since processes sharing the
+cache may update it concurrently, the number is approximate, and it is corrected
+whenever the entries are counted while evicting them.
+
+All writes are atomic renames and all removals tolerate entries that have already
+disappeared, hence several processes may safely share the same cache directory.
+
+A long-running process, e.g., the `turtle-canon` daemon, may keep the keys of recently
+seen canonical content in memory as well, in front of the on-disk cache, see
+`MemoryCanonCache`.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+DEFAULT_CACHE_DIR = ".turtle_canon_cache"
+"""The default cache directory, relative to the current working directory."""
+
+DEFAULT_MAX_ENTRIES = 100_000
+"""The default maximum number of entries in the cache."""
+
+DEFAULT_MAX_MEMORY_ENTRIES = 10_000
+"""The default maximum number of entries in an in-memory cache."""
+
+_COUNT_FILE = ".count"
+
+
+class CanonCache:
+    """On-disk cache of byte content that is already canonical.
+
+    Parameters:
+        directory: The cache directory. It will be created if it does not exist.
+        max_entries: The maximum number of entries to keep in the cache. When exceeded,
+            the least recently used entries are evicted.
+
+    """
+
+    def __init__(
+        self,
+        directory: Path | str = DEFAULT_CACHE_DIR,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+
+        self._directory = Path(directory).resolve()
+        self._max_entries = max_entries
+        self._salt = _salt()
+
+    @property
+    def directory(self) -> Path:
+        """Get `directory` attribute."""
+        return self._directory
+
+    @property
+    def max_entries(self) -> int:
+        """Get `max_entries` attribute."""
+        return self._max_entries
+
+    def key(self, content: bytes | Iterable[bytes], variant: str = "") -> str:
+        """Return the cache key for some byte content, possibly given in chunks.
+
+        Parameters:
+            content: The byte content, possibly given in chunks.
+            variant: The variant of the canonical form, if not the default one.
+
+        Returns:
+            The cache key.
+
+        """
+        return _key(self._salt, content, variant)
+
+    def _entry(self, key: str) -> Path:
+        """Return the path to the entry for a cache key."""
+        return self._directory / key[:2] / key
+
+    def _entries(self) -> list[os.DirEntry]:
+        """Return all entries currently in the cache."""
+        entries: list[os.DirEntry] = []
+        try:
+            shards = [_ for _ in os.scandir(self._directory) if _.is_dir()]
+        except FileNotFoundError:
+            return entries
+        for shard in shards:
+            try:
+                entries.extend(_ for _ in os.scandir(shard.path) if _.is_file())
+            except FileNotFoundError:
+                continue
+        return entries
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def is_canonical(self, content: bytes | Iterable[bytes], variant: str = "") -> bool:
+        """Check whether some byte content is recorded as canonical.
+
+        A hit marks the entry as recently used.
+
+        Parameters:
+            content: The byte content of a Turtle file, possibly given in chunks.
+            variant: The variant of the canonical form, if not the default one.
+
+        Returns:
+            Whether or not the content is recorded as canonical in the cache.
+
+        """
+        return self._touch(self.key(content, variant))
+
+    def _touch(self, key: str) -> bool:
+        """Mark the entry for a cache key as recently used, if it exists."""
+        try:
+            os.utime(self._entry(key))
+        except OSError:
+            return False
+        return True
+
+    def add(self, content: bytes | Iterable[bytes], variant: str = "") -> None:
+        """Record some byte content as canonical.
+
+        Failing to write to the cache is not an error, the content is then simply not
+        recorded.
+
+        Parameters:
+            content: The canonical byte content of a Turtle file, possibly given in
+                chunks.
+            variant: The variant of the canonical form, if not the default one.
+
+        """
+        self._record(self.key(content, variant))
+
+    def _record(self, key: str) -> None:
+        """Record the entry for a cache key."""
+        entry = self._entry(key)
+        try:
+            if entry.exists():
+                os.utime(entry)
+                return
+
+            self._initialize()
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile(dir=entry.parent, delete=False) as tmp_entry:
+                pass
+            Path(tmp_entry.name).replace(entry)
+        except OSError:
+            return
+
+        if self._count_added() > self._max_entries:
+            self.evict()
+
+    def _count_added(self) -> int:
+        """Add a recorded entry to the approximate number of entries.
+
+        Returns:
+            The approximate number of entries, including the recorded entry.
+
+        """
+        try:
+            number_of_entries = (
+                int((self._directory / _COUNT_FILE).read_text(encoding="utf8")) + 1
+            )
+        except (OSError, ValueError):
+            # The entries of a cache without a valid record of their number are
+            # counted once
+            number_of_entries = len(self)
+        self._write_count(number_of_entries)
+        return number_of_entries
+
+    def _write_count(self, number_of_entries: int) -> None:
+        """Record the approximate number of entries, if possible."""
+        try:
+            with NamedTemporaryFile(
+                "w", dir=self._directory, delete=False, encoding="utf8"
+            ) as tmp_count:
+                tmp_count.write(str(number_of_entries))
+            Path(tmp_count.name).replace(self._directory / _COUNT_FILE)
+        except OSError:
+            return
+
+    def evict(self) -> None:
+        """Evict the least recently used entries exceeding `max_entries`."""
+        entries = self._entries()
+        excess = len(entries) - self._max_entries
+        if excess > 0:
+            entries.sort(key=_last_used)
+            for entry in entries[:excess]:
+                # The entry may have been evicted concurrently by another process
+                Path(entry.path).unlink(missing_ok=True)
+        self._write_count(min(len(entries), self._max_entries))
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for entry in self._entries():
+            Path(entry.path).unlink(missing_ok=True)
+        if self._directory.exists():
+            self._write_count(0)
+
+    def _initialize(self) -> None:
+        """Create the cache directory, ignored by version control systems."""
+        if self._directory.exists():
+            return
+        self._directory.mkdir(parents=True, exist_ok=True)
+        (self._directory / ".gitignore").write_text(
+            "# Created by turtle-canon automatically.\n*\n", encoding="utf8"
+        )
+
+
+class MemoryCanonCache:
+    """In-memory cache of byte content that is already canonical.
+
+    Only the keys of the content are kept, in least-recently-used (LRU) order.
+    If a persistent cache is given, it is consulted for content not found in memory,
+    and canonical content is recorded in it as well.
+
+    Parameters:
+        max_entries: The maximum number of entries to keep in memory. When exceeded,
+            the least recently used entries are evicted.
+        backing: A persistent cache behind the in-memory cache.
+
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_MEMORY_ENTRIES,
+        backing: CanonCache | None = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+
+        self._max_entries = max_entries
+        self._backing = backing
+        self._salt = _salt()
+        self._keys: OrderedDict[str, None] = OrderedDict()
+
+    @property
+    def max_entries(self) -> int:
+        """Get `max_entries` attribute."""
+        return self._max_entries
+
+    @property
+    def backing(self) -> CanonCache | None:
+        """Get `backing` attribute."""
+        return self._backing
+
+    def key(self, content: bytes | Iterable[bytes], variant: str = "") -> str:
+        """Return the cache key for some byte content, see `CanonCache.key()`."""
+        return _key(self._salt, content, variant)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def is_canonical(self, content: bytes | Iterable[bytes], variant: str = "") -> bool:
+        """Check whether some byte content is recorded as canonical.
+
+        A hit marks the entry as recently used, also in the persistent cache.
+
+        Parameters:
+            content: The byte content of a Turtle file, possibly given in chunks.
+            variant: The variant of the canonical form, if not the default one.
+
+        Returns:
+            Whether or not the content is recorded as canonical in the cache.
+
+        """
+        key = self.key(content, variant)
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return True
+        if self._backing is not None and self._backing._touch(key):
+            self._remember(key)
+            return True
+        return False
+
+    def add(self, content: bytes | Iterable[bytes], variant: str = "") -> None:
+        """Record some byte content as canonical, see `CanonCache.add()`.
+
+        Parameters:
+            content: The canonical byte content of a Turtle file, possibly given in
+                chunks.
+            variant: The variant of the canonical form, if not the default one.
+
+        """
+        key = self.key(content, variant)
+        self._remember(key)
+        if self._backing is not None:
+            self._backing._record(key)
+
+    def _remember(self, key: str) -> None:
+        """Keep a cache key in memory, evicting the least recently used keys."""
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        while len(self._keys) > self._max_entries:
+            self._keys.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the in-memory cache."""
+        self._keys.clear()
+
+
+def _salt() -> bytes:
+    """Return the salt of cache keys, given by the Turtle Canon and RDFlib versions."""
+    from rdflib import __version__ as rdflib_version
+
+    from turtle_canon import __version__
+
+    return f"turtle-canon {__version__}\0rdflib {rdflib_version}\0".encode()
+
+
+def _key(salt: bytes, content: bytes | Iterable[bytes], variant: str = "") -> str:
+    """Return the cache key for some byte content, possibly given in chunks."""
+    digest = sha256(salt)
+    if variant:
+        digest.update(f"variant {variant}\0".encode())
+    if isinstance(content, bytes):
+        digest.update(content)
+    else:
+        for chunk in content:
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _last_used(entry: os.DirEntry) -> float:
+    """Return the last time a cache entry was used."""
+    try:
+        return entry.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
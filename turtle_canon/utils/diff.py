@@ -0,0 +1,99 @@
+"""Triple-level differences between two ontologies.
+
+The triples of both ontologies are sorted in the same order, as `sort_ontology()` sorts
+them, and merge-joined in a single linear pass: a triple found only in the old triples
+is removed, a triple found only in the new triples is added.
+
+To compare triples across the two ontologies, the terms of both are ranked together,
+see `turtle_canon.utils.sorting.rank_terms()`, giving each distinct term a distinct
+rank.
+Each triple is then keyed on a single integer combining its terms' ranks, hence only
+the sorted keys of both ontologies are kept in memory, next to the interned triples,
+instead of sets of the triples of both ontologies.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from turtle_canon.utils.sorting import rank_terms
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+    from rdflib.graph import _TripleType
+
+    from turtle_canon.utils.store import InternedTriples
+
+REMOVED = "-"
+"""The marker of a triple only found in the old triples."""
+
+ADDED = "+"
+"""The marker of a triple only found in the new triples."""
+
+
+def diff_triples(
+    old: InternedTriples, new: InternedTriples
+) -> Iterator[tuple[str, _TripleType]]:
+    """Compute the differences between two sets of interned triples.
+
+    Blank nodes are compared by their identifiers, hence they should be given
+    canonical labels first, see `InternedTriples.canonicalize_blank_nodes()`.
+
+    Parameters:
+        old: The old triples.
+        new: The new triples.
+
+    Yields:
+        The marker of the difference, i.e., `REMOVED` or `ADDED`, and the removed or
+        added triple, in the order `sort_ontology()` sorts triples, hence grouped by
+        subject.
+
+    """
+    terms = old.terms + new.terms
+    ranks = rank_terms(terms, distinct=True)
+    if ranks is None:
+        # Terms of an unknown kind are ranked by their N3 form instead
+        n3_terms = [term.n3() for term in terms]
+        n3_ranks = {n3: rank for rank, n3 in enumerate(sorted(set(n3_terms)))}
+        ranks = [n3_ranks[n3] for n3 in n3_terms]
+    base = max(ranks, default=0) + 1
+
+    old_keys = _sorted_keys(old, ranks[: len(old.terms)], base)
+    new_keys = _sorted_keys(new, ranks[len(old.terms) :], base)
+
+    old_index = new_index = 0
+    while old_index < len(old_keys) and new_index < len(new_keys):
+        old_key, old_position = divmod(old_keys[old_index], len(old))
+        new_key, new_position = divmod(new_keys[new_index], len(new))
+        if old_key < new_key:
+            yield REMOVED, old[old_position]
+            old_index += 1
+        elif new_key < old_key:
+            yield ADDED, new[new_position]
+            new_index += 1
+        else:
+            old_index += 1
+            new_index += 1
+
+    for key in old_keys[old_index:]:
+        yield REMOVED, old[key % len(old)]
+    for key in new_keys[new_index:]:
+        yield ADDED, new[key % len(new)]
+
+
+def _sorted_keys(triples: InternedTriples, ranks: list[int], base: int) -> list[int]:
+    """Key the triples on their terms' ranks, sorted.
+
+    Each key combines the ranks with the position of the triple, such that the
+    position is the key modulo the number of triples.
+    """
+    number_of_triples = len(triples)
+    return sorted(
+        ((ranks[subject] * base + ranks[predicate]) * base + ranks[object_])
+        * number_of_triples
+        + index
+        for index, (subject, predicate, object_) in enumerate(
+            zip(*triples.columns, strict=True)
+        )
+    )
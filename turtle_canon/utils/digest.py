@@ -0,0 +1,91 @@
+"""Order-independent digests of sets of triples."""
+
+from __future__ import annotations
+
+from hashlib import sha256
+from typing import TYPE_CHECKING
+
+from rdflib import BNode
+
+from turtle_canon.utils.store import InternedTriples
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from rdflib.graph import _TripleType
+
+_CHECKSUM_MASK = 2**64 - 1
+_DIGEST_MODULUS = 2**256
+
+
+def checksum_triples(triples: Iterable[_TripleType]) -> tuple[int, int]:
+    """Compute a cheap, order-independent checksum of triples.
+
+    The checksum is the number of triples and the sum of the triples' hashes.
+    It only uses constant extra memory, but since it relies on Python's `hash()`, it
+    can only be compared within the same process.
+
+    Parameters:
+        triples: The triples to compute a checksum for.
+
+    Returns:
+        The number of triples and the sum of their hashes (modulo 2^64).
+
+    """
+    count = checksum = 0
+    for triple in triples:
+        count += 1
+        checksum += hash(triple)
+    return count, checksum & _CHECKSUM_MASK
+
+
+def digest_triples(triples: Iterable[_TripleType], distinct: bool = False) -> str:
+    """Compute a stable, order-independent digest of a set of triples.
+
+    Each triple is hashed with SHA-256, using the N3 form of its terms, and the hashes
+    are added, modulo 2^256 (a multiset hash).
+    Duplicate triples are only counted once, i.e., the digest is that of the set of
+    triples, hence it equals the digest of the same graph however it is parsed.
+
+    Triples without blank nodes are hashed as they are streamed.
+    Unless the triples are known to be distinct, their hashes are kept in order to
+    skip duplicates, hence memory grows with the number of triples.
+    Triples with blank nodes are collected and hashed after relabelling the blank nodes
+    with canonical labels, see `turtle_canon.utils.blank_nodes`, such that the digest
+    does not depend on the blank node identifiers generated when parsing.
+
+    Parameters:
+        triples: The triples to compute a digest for.
+        distinct: Whether the triples are known to be distinct, e.g., the triples of
+            an RDFlib `Graph`. If so, the triples without blank nodes are added to the
+            digest as they are streamed, using constant extra memory, but duplicates
+            are counted more than once.
+
+    Returns:
+        The digest as a hexadecimal string of 64 characters.
+
+    """
+    total = 0
+    hashes: set[bytes] = set()
+    blank_node_triples: list[_TripleType] = []
+    for triple in triples:
+        if any(isinstance(term, BNode) for term in triple):
+            blank_node_triples.append(triple)
+        elif distinct:
+            total += int.from_bytes(_hash_triple(triple), "big")
+        else:
+            hashes.add(_hash_triple(triple))
+
+    if blank_node_triples:
+        relabelled = InternedTriples(blank_node_triples, unique=True)
+        del blank_node_triples
+        hashes.update(map(_hash_triple, relabelled.canonicalize_blank_nodes()))
+
+    total += sum(int.from_bytes(_, "big") for _ in hashes)
+    total %= _DIGEST_MODULUS
+    return total.to_bytes(32, "big").hex()
+
+
+def _hash_triple(triple: _TripleType) -> bytes:
+    """The SHA-256 hash of a triple, in N-Triples-like form."""
+    return sha256(" ".join(term.n3() for term in triple).encode("utf8")).digest()
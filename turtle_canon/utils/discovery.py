@@ -0,0 +1,253 @@
+"""Discovering the Turtle files in directories.
+
+Directories are walked recursively with `os.scandir()`, in sorted order, and the files
+found are yielded as they are found, such that they can be canonized while the walk
+goes on.
+Hidden directories, e.g., `.git`, and symbolic links to directories are not walked.
+
+Files and directories are matched against patterns in the style of `.gitignore`
+files: a pattern without a slash matches the name of a file or directory at any
+depth, e.g., `*.ttl`, while a pattern with a slash matches the path relative to the
+walked directory, e.g., `vendor/**`.
+A trailing slash only matches directories.
+
+The `.gitignore` files in the walked directories, and in their parent directories up
+to the top-level directory of the Git repository, are respected as well, as is the
+repository's `.git/info/exclude` file.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator, Sequence
+
+DEFAULT_INCLUDE = ("*.ttl",)
+"""The default patterns of the files to include when walking directories."""
+
+
+class _Rule(NamedTuple):
+    """A pattern of a `.gitignore` file."""
+
+    base: str
+    """The directory of the `.gitignore` file, relative to the top-level directory,
+    with a trailing slash (or empty)."""
+
+    regex: re.Pattern[str]
+    """The pattern, matching a path relative to `base`."""
+
+    negated: bool
+    """Whether or not the pattern re-includes what a previous pattern excluded."""
+
+    directories_only: bool
+    """Whether or not the pattern only matches directories."""
+
+
+def discover(
+    paths: Iterable[Path],
+    include: Sequence[str] = DEFAULT_INCLUDE,
+    exclude: Sequence[str] = (),
+    gitignore: bool = True,
+) -> Iterator[Path]:
+    """Discover the files in the given paths, walking directories recursively.
+
+    Parameters:
+        paths: The files and directories. Files (or paths that do not exist) are
+            yielded as-is, independent of the patterns.
+        include: The patterns of the files to include from the directories.
+        exclude: The patterns of the files and directories to exclude from the
+            directories.
+        gitignore: Whether or not to exclude the files and directories ignored by
+            `.gitignore` files.
+
+    Yields:
+        The files, in the order the paths are given, and sorted within each directory.
+
+    """
+    included = [_compile(pattern) for pattern in include]
+    excluded = [_compile(pattern) for pattern in exclude]
+
+    for path in paths:
+        if not path.is_dir():
+            yield path
+            continue
+
+        prefix, rules = _parent_rules(path) if gitignore else ("", [])
+        yield from _walk(
+            path, "", prefix, rules, included, excluded, gitignore=gitignore
+        )
+
+
+def _walk(
+    directory: Path,
+    relative: str,
+    prefix: str,
+    rules: list[_Rule],
+    included: list[tuple[re.Pattern[str], bool]],
+    excluded: list[tuple[re.Pattern[str], bool]],
+    gitignore: bool,
+) -> Iterator[Path]:
+    """Walk a directory recursively, yielding the included files.
+
+    Parameters:
+        directory: The directory to walk.
+        relative: The path of the directory relative to the walked directory, with a
+            trailing slash (or empty).
+        prefix: The path of the walked directory relative to the top-level directory
+            of the `.gitignore` rules, with a trailing slash (or empty).
+        rules: The `.gitignore` rules of the parent directories.
+        included: The compiled patterns of the files to include.
+        excluded: The compiled patterns of the files and directories to exclude.
+        gitignore: Whether or not to respect `.gitignore` files.
+
+    """
+    if gitignore:
+        rules = rules + _read_rules(directory / ".gitignore", prefix + relative)
+
+    try:
+        with os.scandir(directory) as scanned:
+            entries = sorted(scanned, key=lambda entry: entry.name)
+    except OSError:
+        # E.g., the directory was removed or cannot be read
+        return
+
+    for entry in entries:
+        is_directory = entry.is_dir(follow_symlinks=False)
+        if is_directory and entry.name.startswith("."):
+            continue
+
+        path = relative + entry.name
+        if _matches(excluded, path, is_directory) or _ignored(
+            rules, prefix + path, is_directory
+        ):
+            continue
+
+        if is_directory:
+            yield from _walk(
+                Path(entry.path),
+                path + "/",
+                prefix,
+                rules,
+                included,
+                excluded,
+                gitignore=gitignore,
+            )
+        elif _matches(included, path, is_directory=False):
+            yield Path(entry.path)
+
+
+def _matches(
+    patterns: list[tuple[re.Pattern[str], bool]], path: str, is_directory: bool
+) -> bool:
+    """Whether or not any of the patterns match a path."""
+    return any(
+        regex.match(path) and (is_directory or not directories_only)
+        for regex, directories_only in patterns
+    )
+
+
+def _ignored(rules: list[_Rule], path: str, is_directory: bool) -> bool:
+    """Whether or not a path is ignored by `.gitignore` rules, the last match wins."""
+    for rule in reversed(rules):
+        if (
+            path.startswith(rule.base)
+            and (is_directory or not rule.directories_only)
+            and rule.regex.match(path[len(rule.base) :])
+        ):
+            return not rule.negated
+    return False
+
+
+def _parent_rules(directory: Path) -> tuple[str, list[_Rule]]:
+    """Read the `.gitignore` rules of the parent directories of a directory, up to the
+    top-level directory of its Git repository.
+
+    Returns:
+        The path of the directory relative to the top-level directory, with a trailing
+        slash (or empty), and the rules.
+        If the directory is not in a Git repository, no rules are returned.
+
+    """
+    directory = directory.resolve()
+    for top_level in (directory, *directory.parents):
+        if (top_level / ".git").exists():
+            break
+    else:
+        return "", []
+
+    relative = directory.relative_to(top_level)
+    rules = _read_rules(top_level / ".git" / "info" / "exclude", "")
+    # The `.gitignore` file of the directory itself is read when walking it
+    for parent in reversed(relative.parents):
+        base = "" if parent == Path() else f"{parent.as_posix()}/"
+        rules.extend(_read_rules(top_level / parent / ".gitignore", base))
+    return ("" if relative == Path() else f"{relative.as_posix()}/"), rules
+
+
+def _read_rules(gitignore_file: Path, base: str) -> list[_Rule]:
+    """Read the rules of a `.gitignore` file, if it exists."""
+    try:
+        lines = gitignore_file.read_text(encoding="utf8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return []
+
+    rules = []
+    for line in lines:
+        line = line.rstrip()  # noqa: PLW2901
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated or line.startswith("\\"):
+            line = line[1:]  # noqa: PLW2901
+        if not line:
+            continue
+        regex, directories_only = _compile(line)
+        rules.append(_Rule(base, regex, negated, directories_only))
+    return rules
+
+
+def _compile(pattern: str) -> tuple[re.Pattern[str], bool]:
+    """Compile a pattern in the style of `.gitignore` files into a regular expression.
+
+    Returns:
+        The regular expression, matching a relative path with slashes, and whether or
+        not the pattern only matches directories.
+
+    """
+    directories_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    if "/" not in pattern:
+        pattern = f"**/{pattern}"
+    pattern = pattern.lstrip("/")
+
+    regex, index = "", 0
+    while index < len(pattern):
+        if pattern.startswith("**/", index):
+            regex += "(?:.*/)?"
+            index += 3
+        elif pattern.startswith("/**", index) and index + 3 == len(pattern):
+            regex += "/.*"
+            index += 3
+        elif pattern[index] == "*":
+            regex += "[^/]*"
+            index += 1
+        elif pattern[index] == "?":
+            regex += "[^/]"
+            index += 1
+        elif pattern[index] == "[" and (end := pattern.find("]", index + 2)) != -1:
+            characters = pattern[index + 1 : end].replace("\\", "\\\\")
+            if characters.startswith("!"):
+                characters = f"^{characters[1:]}"
+            regex += f"[{characters}]"
+            index = end + 1
+        elif pattern[index] == "\\" and index + 1 < len(pattern):
+            regex += re.escape(pattern[index + 1])
+            index += 2
+        else:
+            regex += re.escape(pattern[index])
+            index += 1
+    return re.compile(rf"{regex}\Z"), directories_only
@@ -29,3 +29,15 @@ class FailedParsingFile(TurtleCanonException):
 
 class FailedCreatingOntology(TurtleCanonException):
     """RDFlib failed to add one or more triples to a new `rdflib.Graph` object."""
+
+
+class UnsupportedMaxMemory(TurtleCanonException):
+    """A Turtle file cannot be canonized within a maximum amount of memory."""
+
+
+class DaemonError(TurtleCanonException):
+    """The Turtle Canon daemon cannot be started or failed to serve a request."""
+
+
+class GitError(TurtleCanonException):
+    """Git failed to list the changed files, e.g., outside of a Git repository."""
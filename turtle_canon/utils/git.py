@@ -0,0 +1,92 @@
+"""Listing the Turtle files changed in a Git repository.
+
+The files are listed with Git's plumbing, run in the current working directory:
+`git diff --name-only` lists the files added, copied, modified or renamed since a
+revision, in the index or in the working tree, and `git ls-files --others` lists the
+untracked files, not ignored.
+Renames are always detected, independent of Git's configuration, such that a renamed
+file is listed by its new path.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from turtle_canon.utils.exceptions import GitError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+CHANGED_FILTER = "ACMRT"
+"""The kinds of changes (`git diff --diff-filter`) of the listed files: added, copied,
+modified, renamed or changed in type, i.e., not deleted."""
+
+
+def changed_files(
+    revision: str,
+    paths: Iterable[Path] = (),
+    untracked: bool = False,
+    suffixes: Iterable[str] = (".ttl",),
+) -> list[Path]:
+    """List the Turtle files changed since a revision.
+
+    Parameters:
+        revision: The revision to compare with, e.g., `origin/main`.
+        paths: The files or directories to limit the listed files to. If none are
+            given, the whole repository is searched.
+        untracked: Whether or not to list untracked files, which are not ignored, as
+            well.
+        suffixes: The (lower case) suffixes of the files to list.
+
+    Returns:
+        The existing changed files, relative to the current working directory, sorted.
+
+    """
+    pathspecs = ["--", *(str(path) for path in paths)]
+    names = _names(
+        "diff",
+        "--name-only",
+        "--find-renames",
+        f"--diff-filter={CHANGED_FILTER}",
+        revision,
+        *pathspecs,
+    )
+    if untracked:
+        names |= _names(
+            "ls-files", "--others", "--exclude-standard", "--full-name", *pathspecs
+        )
+
+    # The names are relative to the top-level directory of the repository
+    top_level = Path(_git("rev-parse", "--show-toplevel").strip())
+    suffixes = tuple(_.lower() for _ in suffixes)
+    return sorted(
+        Path(os.path.relpath(top_level / name))
+        for name in names
+        if Path(name).suffix.lower() in suffixes and (top_level / name).is_file()
+    )
+
+
+def _names(command: str, *args: str) -> set[str]:
+    """Run a Git command listing files, returning the names of the files."""
+    return {_ for _ in _git(command, "-z", *args).split("\0") if _}
+
+
+def _git(*args: str) -> str:
+    """Run a Git command, returning its output."""
+    from subprocess import CalledProcessError, run  # nosec B404
+
+    try:
+        # The arguments are passed to Git as-is, without a shell
+        output = run(  # nosec B603 B607
+            ["git", *args], check=True, capture_output=True, text=True
+        ).stdout
+    except FileNotFoundError as exc:
+        raise GitError("Cannot find the 'git' executable.") from exc
+    except CalledProcessError as exc:
+        raise GitError(
+            f"'git {args[0]}' failed with exit code {exc.returncode}: "
+            f"{exc.stderr.strip()}"
+        ) from exc
+    return output
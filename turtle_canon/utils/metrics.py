@@ -0,0 +1,176 @@
+"""Per-stage timing and resource metrics of canonizing Turtle files.
+
+`turtle_canon.canon.canonize()` and `turtle_canon.canon.check()` record the wall time
+of each of their stages in a `Metrics` object, if one is given, see `STAGES`, together
+with the number of triples, the number of bytes read and written, and the peak
+resident set size (RSS) of the process.
+
+The metrics of several files are summarized, e.g., for a report, by `summarize()`.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from turtle_canon.utils.profiling import checkpoint
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
+    from typing import Any
+
+    from turtle_canon.utils.profiling import MemoryTrace
+
+LOGGER = logging.getLogger(__name__)
+
+STAGES = ("validate", "parse", "sort", "verify", "serialize", "write")
+"""The stages of canonizing a Turtle file, in order:
+
+- `validate`: Check and read the file, and look up its content in the cache.
+- `parse`: Parse the content into triples.
+- `sort`: Sort the triples (and give blank nodes canonical labels).
+- `verify`: Verify the sorted triples, see `VERIFICATION_LEVELS`.
+- `serialize`: Serialize the sorted triples as Turtle.
+- `write`: Compare the serialized content with the file, write it if it differs, and
+  record it in the cache.
+
+N-Triples and N-Quads files are parsed and sorted in a single stream, recorded as
+`sort` until the first sorted statement is available, and serialized while being
+written, recorded as `write`.
+"""
+
+
+class Metrics:
+    """The metrics of canonizing (or checking) a single Turtle file.
+
+    Parameters:
+        file: The Turtle file, if any.
+
+    """
+
+    def __init__(self, file: Path | str | None = None) -> None:
+        self.file = file
+        self.stages: dict[str, float] = {}
+        """The wall time in seconds of each stage, see `STAGES`."""
+
+        self.triples: int | None = None
+        """The number of (sorted, distinct) triples."""
+
+        self.input_bytes: int | None = None
+        """The size in bytes of the file's content."""
+
+        self.output_bytes: int | None = None
+        """The size in bytes of the canonized content, if it was fully serialized."""
+
+        self.peak_rss: int | None = None
+        """The peak resident set size in bytes of the process, at the end of the last
+        stage, if available."""
+
+        self.cached = False
+        """Whether or not the content was found in the cache."""
+
+        self.changed = False
+        """Whether or not the file was (or would be) changed."""
+
+        self.error: str | None = None
+        """The name of the Turtle Canon exception or warning raised, if any."""
+
+        self.memory: MemoryTrace | None = None
+        """The memory traced while canonizing the file, if it was, see
+        `turtle_canon.utils.profiling.trace_memory()`."""
+
+    @property
+    def total(self) -> float:
+        """The total wall time in seconds of all stages."""
+        return sum(self.stages.values())
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a stage, adding its wall time to any previous time of the stage, and
+        record the peak resident set size of the process at its end.
+
+        The time is logged at the `DEBUG` level as well.
+        The end of a stage is a checkpoint of any memory trace, see
+        `turtle_canon.utils.profiling.checkpoint()`.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+            self.peak_rss = peak_rss()
+            checkpoint()
+            LOGGER.debug("%s: %s took %.3f s", self.file or "-", name, elapsed)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a JSON serializable dictionary."""
+        return {
+            "file": None if self.file is None else str(self.file),
+            "changed": self.changed,
+            "cached": self.cached,
+            "error": self.error,
+            "triples": self.triples,
+            "input_bytes": self.input_bytes,
+            "output_bytes": self.output_bytes,
+            "peak_rss": self.peak_rss,
+            "stages": {
+                name: self.stages[name] for name in STAGES if name in self.stages
+            },
+            "total": self.total,
+            **({} if self.memory is None else {"memory": self.memory.as_dict()}),
+        }
+
+
+def peak_rss() -> int | None:
+    """Return the peak resident set size in bytes of the process, if available."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover
+        # Not available on Windows
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # The size is given in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def summarize(metrics: Sequence[Metrics], wall_time: float) -> dict[str, Any]:
+    """Summarize the metrics of several files.
+
+    Parameters:
+        metrics: The metrics of each file.
+        wall_time: The wall time in seconds of canonizing all of the files, e.g., in
+            parallel.
+
+    Returns:
+        The number of files, triples, bytes read and written, the peak resident set
+        size of any process, the total time of each stage, and the throughput in
+        triples and (read) megabytes per second of wall time.
+
+    """
+    triples = sum(_.triples or 0 for _ in metrics)
+    input_bytes = sum(_.input_bytes or 0 for _ in metrics)
+    peak_rss_values = [_.peak_rss for _ in metrics if _.peak_rss is not None]
+    return {
+        "files": len(metrics),
+        "changed": sum(_.changed for _ in metrics),
+        "cached": sum(_.cached for _ in metrics),
+        "errors": sum(_.error is not None for _ in metrics),
+        "triples": triples,
+        "input_bytes": input_bytes,
+        "output_bytes": sum(_.output_bytes or 0 for _ in metrics),
+        "peak_rss": max(peak_rss_values, default=None),
+        "stages": {
+            name: sum(_.stages.get(name, 0.0) for _ in metrics) for name in STAGES
+        },
+        "wall_time": wall_time,
+        "triples_per_second": triples / wall_time if wall_time > 0 else None,
+        "megabytes_per_second": (
+            input_bytes / 1024**2 / wall_time if wall_time > 0 else None
+        ),
+    }
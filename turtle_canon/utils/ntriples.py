@@ -0,0 +1,305 @@
+"""Line-based normalization of N-Triples and N-Quads.
+
+Every statement in an N-Triples (or N-Quads) document is on a line of its own, hence a
+document can be canonized one line at a time, without building an RDFlib `Graph`:
+each line is parsed and written back in canonical form, after which the canonical lines
+are sorted and de-duplicated.
+
+The canonical form follows the canonical N-Triples form of
+[RDF 1.2 N-Triples](https://www.w3.org/TR/rdf12-n-triples/#canonical-ntriples):
+
+- The terms are separated by a single space and the statement is terminated by a
+  space and a period (`" ."`).
+  Comments and lines without a statement are dropped.
+- IRIs and literals are written without escapes (as UTF-8), except for the characters
+  that must be escaped.
+  Escapes use uppercase hexadecimal digits.
+- `xsd:string` datatypes are dropped.
+  Language tags are lowercased, as done by RDFlib.
+
+Blank node labels are kept as they are.
+
+The canonical lines are sorted in memory, or, if a maximum amount of memory is given,
+using an external merge sort: bounded runs of lines are sorted in memory and spilled to
+compressed temporary files, which are then merged.
+"""
+
+from __future__ import annotations
+
+import gzip
+import heapq
+import re
+import sys
+from contextlib import ExitStack
+from itertools import islice
+from tempfile import TemporaryFile
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Generator, Iterable, Iterator
+    from pathlib import Path
+    from typing import IO
+
+NTRIPLES_SUFFIXES = (".nt", ".nq")
+"""File suffixes of N-Triples and N-Quads files, respectively."""
+
+MAX_MERGE_RUNS = 64
+"""The maximum number of sorted runs merged at once in an external merge sort."""
+
+_LINE_OVERHEAD = 64
+_LINES_PER_WRITE = 10_000
+
+_XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+
+_UCHAR = r"\\u[0-9A-Fa-f]{4}|\\U[0-9A-Fa-f]{8}"
+_IRI_CHARS = r"[^\x00-\x20<>\"{}|^`\\]*"
+_IRIREF = rf"<({_IRI_CHARS}(?:(?:{_UCHAR}){_IRI_CHARS})*)>"
+_PN_CHARS_BASE = (
+    r"A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF"
+    r"\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD"
+    r"\U00010000-\U000EFFFF"
+)
+_PN_CHARS = rf"{_PN_CHARS_BASE}_:0-9\-\u00B7\u0300-\u036F\u203F-\u2040"
+_BLANK_NODE_LABEL = rf"(_:[{_PN_CHARS_BASE}_:0-9](?:[{_PN_CHARS}.]*[{_PN_CHARS}])?)"
+_STRING_CHARS = r"[^\"\\\n\r]*"
+_LITERAL = (
+    rf"\"({_STRING_CHARS}(?:(?:\\[tbnrf\"'\\]|{_UCHAR}){_STRING_CHARS})*)\""
+    rf"(?:\^\^{_IRIREF}|@([a-zA-Z]+(?:-[a-zA-Z0-9]+)*))?"
+)
+_WS = r"[ \t]*"
+_STATEMENT = (
+    rf"{_WS}(?:{_IRIREF}|{_BLANK_NODE_LABEL})"
+    rf"{_WS}{_IRIREF}"
+    rf"{_WS}(?:{_IRIREF}|{_BLANK_NODE_LABEL}|{_LITERAL})"
+)
+_END = rf"{_WS}\.{_WS}(?:#[^\n\r]*)?[\n\r]*"
+
+_TRIPLE_LINE = re.compile(rf"{_STATEMENT}{_END}")
+_QUAD_LINE = re.compile(
+    rf"{_STATEMENT}(?:{_WS}(?:{_IRIREF}|{_BLANK_NODE_LABEL}))?{_END}"
+)
+_EMPTY_LINE = re.compile(r"[ \t]*(?:#[^\n\r]*)?[\n\r]*")
+
+_ESCAPE = re.compile(r"\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|[tbnrf\"'\\])")
+_UNESCAPED = {
+    "\\t": "\t",
+    "\\b": "\b",
+    "\\n": "\n",
+    "\\r": "\r",
+    "\\f": "\f",
+    '\\"': '"',
+    "\\'": "'",
+    "\\\\": "\\",
+}
+
+_IRI_ESCAPES = re.compile(r"[\x00-\x20<>\"{}|^`\\]")
+_LITERAL_ESCAPES = re.compile(r"[\x00-\x1F\x7F\"\\]")
+_ESCAPED = {
+    "\b": "\\b",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\f": "\\f",
+    "\r": "\\r",
+    '"': '\\"',
+    "\\": "\\\\",
+}
+
+
+def is_ntriples(filename: Path) -> bool:
+    """Whether or not a file is an N-Triples or N-Quads file, judged by its suffix."""
+    return filename.suffix.lower() in NTRIPLES_SUFFIXES
+
+
+def is_nquads(filename: Path) -> bool:
+    """Whether or not a file is an N-Quads file, judged by its suffix."""
+    return filename.suffix.lower() == ".nq"
+
+
+def normalize_line(line: str, quads: bool = False) -> str | None:
+    """Normalize a line of N-Triples or N-Quads.
+
+    Parameters:
+        line: The line to normalize, possibly including its line terminator.
+        quads: Whether or not the line is N-Quads, i.e., may contain a graph label.
+
+    Raises:
+        ValueError: If the line is not a valid line of N-Triples (or N-Quads).
+
+    Returns:
+        The statement on the line in canonical form, without a line terminator, or
+        `None` if there is no statement on the line.
+
+    """
+    match = (_QUAD_LINE if quads else _TRIPLE_LINE).fullmatch(line)
+    if match is None:
+        if _EMPTY_LINE.fullmatch(line):
+            return None
+        raise ValueError(f"Invalid {'N-Quads' if quads else 'N-Triples'}: {line!r}")
+
+    (
+        subject_iri,
+        subject_bnode,
+        predicate,
+        object_iri,
+        object_bnode,
+        value,
+        datatype,
+        language,
+        *graph,
+    ) = match.groups()
+
+    if object_iri is not None:
+        object_ = _iri(object_iri)
+    elif object_bnode is not None:
+        object_ = object_bnode
+    else:
+        object_ = _literal(value, datatype, language)
+
+    statement = f"{subject_bnode or _iri(subject_iri)} {_iri(predicate)} {object_}"
+    if graph and (graph[0] is not None or graph[1] is not None):
+        statement += f" {graph[1] or _iri(graph[0])}"
+    return statement + " ."
+
+
+def normalize_lines(lines: Iterable[str], quads: bool = False) -> Iterator[str]:
+    """Normalize lines of N-Triples or N-Quads, see `normalize_line()`.
+
+    Parameters:
+        lines: The lines to normalize.
+        quads: Whether or not the lines are N-Quads.
+
+    Raises:
+        ValueError: If a line is not a valid line of N-Triples (or N-Quads). The error
+            message includes the line number.
+
+    Yields:
+        The statements in canonical form, one per line with a statement.
+
+    """
+    for line_number, line in enumerate(lines, start=1):
+        try:
+            statement = normalize_line(line, quads=quads)
+        except ValueError as exc:
+            raise ValueError(f"Line {line_number}: {exc}") from exc
+        if statement is not None:
+            yield statement
+
+
+def sort_lines(
+    statements: Iterable[str],
+    max_memory: int | None = None,
+    directory: Path | str | None = None,
+) -> Generator[str]:
+    """Sort and de-duplicate canonical statements.
+
+    The statements are sorted by code point, which is the same as sorting their UTF-8
+    encoding byte-wise.
+
+    If `max_memory` is given, the statements are sorted using an external merge sort:
+    runs of statements taking up (approximately) at most `max_memory` bytes of memory
+    are sorted in memory and spilled to temporary files as gzip-compressed UTF-8
+    lines.
+    The runs are then merged, at most `MAX_MERGE_RUNS` at a time.
+    The result is the same as when sorting all statements in memory.
+
+    Parameters:
+        statements: The canonical statements to sort.
+        max_memory: The maximum amount of memory in bytes to use for sorting in memory.
+            If `None`, all statements are sorted in memory.
+        directory: The directory to create the temporary files in. Defaults to the
+            default temporary directory.
+
+    Yields:
+        The sorted, unique statements.
+
+    """
+    if max_memory is None:
+        yield from sorted(set(statements))
+        return
+
+    with ExitStack() as stack:
+        runs: list[IO[bytes]] = []
+        statements = iter(statements)
+        while True:
+            run, size = [], 0
+            for statement in statements:
+                run.append(statement)
+                size += sys.getsizeof(statement) + _LINE_OVERHEAD
+                if size >= max_memory:
+                    break
+            if not run:
+                break
+            runs.append(stack.enter_context(_spill(sorted(set(run)), directory)))
+            del run
+
+        while len(runs) > MAX_MERGE_RUNS:
+            merged = runs[:MAX_MERGE_RUNS]
+            runs = [
+                *runs[MAX_MERGE_RUNS:],
+                stack.enter_context(_spill(_merge(merged), directory)),
+            ]
+            for merged_run in merged:
+                merged_run.close()
+
+        yield from _merge(runs)
+
+
+def _spill(statements: Iterable[str], directory: Path | str | None) -> IO[bytes]:
+    """Write sorted statements to a temporary file, rewound for reading."""
+    run = TemporaryFile(dir=directory)  # noqa: SIM115
+    with gzip.GzipFile(fileobj=run, mode="wb", compresslevel=1) as compressed:
+        statements = iter(statements)
+        while batch := list(islice(statements, _LINES_PER_WRITE)):
+            compressed.write(("\n".join(batch) + "\n").encode("utf8"))
+    run.seek(0)
+    return run
+
+
+def _merge(runs: list[IO[bytes]]) -> Iterator[str]:
+    """Merge sorted runs of statements, dropping duplicates across the runs."""
+    previous = None
+    for line in heapq.merge(*(gzip.GzipFile(fileobj=run, mode="rb") for run in runs)):
+        if line != previous:
+            yield line[:-1].decode("utf8")
+            previous = line
+
+
+def _unescape(match: re.Match) -> str:
+    """Return the character represented by an escape sequence."""
+    hex_digits = match.group(1) or match.group(2)
+    if hex_digits:
+        return chr(int(hex_digits, 16))
+    return _UNESCAPED[match.group()]
+
+
+def _iri(iri: str) -> str:
+    """Return an IRI in canonical form."""
+    if "\\" in iri:
+        iri = _IRI_ESCAPES.sub(
+            lambda match: f"\\u{ord(match.group()):04X}",
+            _ESCAPE.sub(_unescape, iri),
+        )
+    return f"<{iri}>"
+
+
+def _literal(value: str, datatype: str | None, language: str | None) -> str:
+    """Return a literal in canonical form."""
+    if "\\" in value:
+        value = _ESCAPE.sub(_unescape, value)
+    if _LITERAL_ESCAPES.search(value):
+        value = _LITERAL_ESCAPES.sub(_escape_literal_character, value)
+
+    if language is not None:
+        return f'"{value}"@{language.lower()}'
+    if datatype is None:
+        return f'"{value}"'
+    datatype = _iri(datatype)
+    if datatype == f"<{_XSD_STRING}>":
+        return f'"{value}"'
+    return f'"{value}"^^{datatype}'
+
+
+def _escape_literal_character(match: re.Match) -> str:
+    """Return the escape sequence for a character in a literal."""
+    character = match.group()
+    return _ESCAPED.get(character) or f"\\u{ord(character):04X}"
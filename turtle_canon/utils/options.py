@@ -0,0 +1,32 @@
+"""Choices of options for canonizing ontologies.
+
+The choices are kept apart from `turtle_canon.canon`, such that they can be used, e.g.,
+for parsing command line arguments, without importing RDFlib.
+"""
+
+from __future__ import annotations
+
+VERIFICATION_LEVELS = ("none", "count", "digest", "full", "roundtrip")
+"""Levels of verification of the sorted ontology, with increasing cost and safety.
+
+Each level includes the checks of the previous levels:
+
+- `none`: No verification. No extra cost.
+- `count`: Compare the number of triples. Negligible cost.
+- `digest`: Compare an order-independent checksum of the triples. One extra pass over
+  the triples, hashing each of them, using constant extra memory.
+- `full`: Compare the sets of triples. Extra memory for two sets of all triples.
+- `roundtrip`: Re-parse the exported Turtle and compare the resulting graph with the
+  sorted ontology, taking blank nodes into account (graph isomorphism). Costs a full
+  extra parse, as well as copying and canonicalizing both graphs.
+"""
+
+PARSERS = ("rdflib", "fast")
+"""Turtle parsers to choose from.
+
+- `rdflib`: RDFlib's Turtle parser.
+- `fast`: A faster parser for the common subset of Turtle, see
+  `turtle_canon.utils.turtle`. It streams the triples directly into the sorted
+  triples, without building an RDFlib `Graph`. Content outside of the supported subset
+  is parsed with RDFlib's Turtle parser instead.
+"""
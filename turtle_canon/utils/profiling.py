@@ -0,0 +1,167 @@
+"""Profiling the canonization of Turtle files.
+
+`profile()` profiles the code run in its context with `cProfile`, writing the
+statistics to a file for `pstats` (or, e.g., `snakeviz`).
+
+`trace_memory()` traces the memory allocated in its context with `tracemalloc`,
+recording the peak, as well as the allocation sites of the memory in use when the most
+memory is in use, see `MemoryTrace`.
+Since the memory of a canonized Turtle file is released once it has been written, the
+allocation sites are recorded at checkpoints: at the end of each stage of canonizing a
+Turtle file, see `turtle_canon.utils.metrics.Metrics.stage()`, e.g., once the triples
+are parsed and once they are serialized.
+
+Neither adds any overhead when not used.
+
+Example:
+    ```python
+    from turtle_canon.canon import canonize
+    from turtle_canon.utils.profiling import profile, trace_memory
+
+    with profile("ontology.pstats"), trace_memory() as trace:
+        canonize("ontology.ttl")
+    print(trace.peak, trace.top)
+    ```
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+    from cProfile import Profile
+    from typing import Any
+
+DEFAULT_TOP_ALLOCATIONS = 10
+"""The default number of allocation sites recorded by `trace_memory()`."""
+
+_TRACES: list[MemoryTrace] = []
+"""The active memory traces."""
+
+
+class MemoryTrace:
+    """The memory traced by `trace_memory()`.
+
+    Parameters:
+        limit: The number of allocation sites to record.
+
+    """
+
+    def __init__(self, limit: int = DEFAULT_TOP_ALLOCATIONS) -> None:
+        self.limit = limit
+        self.peak = 0
+        """The peak size in bytes of the traced memory, once the tracing has ended."""
+
+        self.current = 0
+        """The size in bytes of the traced memory in use when the allocation sites
+        were recorded."""
+
+        self.top: list[tuple[str, int, int]] = []
+        """The allocation sites (file name and line number) with the most memory in
+        use, when the most memory was in use at a checkpoint, and their size in bytes
+        and number of memory blocks."""
+
+    def _record(self, snapshot: tracemalloc.Snapshot, current: int) -> None:
+        """Record the allocation sites with the most memory in use."""
+        self.current = current
+        self.top = [
+            (
+                f"{statistic.traceback[0].filename}:{statistic.traceback[0].lineno}",
+                statistic.size,
+                statistic.count,
+            )
+            for statistic in snapshot.statistics("lineno")[: self.limit]
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trace as a JSON serializable dictionary."""
+        return {
+            "peak": self.peak,
+            "current": self.current,
+            "top": [
+                {"location": location, "size": size, "count": count}
+                for location, size, count in self.top
+            ],
+        }
+
+
+@contextmanager
+def profile(output: Path | str) -> Iterator[Profile]:
+    """Profile the code run in the context with `cProfile`.
+
+    Parameters:
+        output: The file to write the statistics to, loadable with `pstats.Stats`.
+            Its directory is created if it does not exist.
+
+    Yields:
+        The profiler.
+
+    """
+    from cProfile import Profile
+
+    profiler = Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(output)
+
+
+@contextmanager
+def trace_memory(limit: int = DEFAULT_TOP_ALLOCATIONS) -> Iterator[MemoryTrace]:
+    """Trace the memory allocated in the context with `tracemalloc`.
+
+    If `tracemalloc` is already tracing, its peak is reset, and it keeps tracing
+    afterwards.
+
+    Parameters:
+        limit: The number of allocation sites to record.
+
+    Yields:
+        The memory trace, which is complete once the context has been exited.
+
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    else:
+        tracemalloc.reset_peak()
+
+    trace = MemoryTrace(limit)
+    _TRACES.append(trace)
+    try:
+        yield trace
+    finally:
+        _TRACES.remove(trace)
+        current, trace.peak = tracemalloc.get_traced_memory()
+        if not trace.top:
+            trace._record(_take_snapshot(), current)
+        if started:
+            tracemalloc.stop()
+
+
+def checkpoint() -> None:
+    """Record the allocation sites of the active memory traces, if more memory is in
+    use than at any of their previous checkpoints."""
+    if not _TRACES:
+        return
+
+    current = tracemalloc.get_traced_memory()[0]
+    snapshot = None
+    for trace in _TRACES:
+        if current > trace.current:
+            snapshot = snapshot or _take_snapshot()
+            trace._record(snapshot, current)
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    """Take a snapshot of the traced memory, excluding `tracemalloc` itself."""
+    return tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__)]
+    )
@@ -0,0 +1,309 @@
+"""Fast sorting of RDF triples.
+
+Sorting triples with `sorted()` relies on RDFlib's rich comparison of `URIRef`,
+`BNode` and `Literal` objects, dispatching to Python-level `__lt__` methods for every
+single comparison.
+Instead, a sort key is computed once per term, and the triples are sorted on plain
+tuples of these keys.
+The resulting order is the same as the one given by `sorted()`.
+
+Terms that are not literals are keyed on their kind (ordered as in RDFlib: blank nodes,
+then IRIs) and their lexical form.
+Literals are compared by value in RDFlib, hence they are instead ranked once, as a
+whole, and keyed on their (integer) rank.
+
+Likewise, all distinct terms can be ranked once, such that triples of interned terms
+can be sorted on their terms' integer ranks, see
+`turtle_canon.utils.store.InternedTriples`.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from decimal import Decimal
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+from rdflib import BNode, Literal, URIRef
+from rdflib.namespace import XSD
+from rdflib.term import _NUMERIC_LITERAL_TYPES
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterable, Sequence
+    from typing import Any
+
+    from rdflib.graph import _TripleType
+    from rdflib.term import Node
+
+    TripleKey = tuple[int, str | int, int, str | int, int, str | int]
+
+_NUMBER_TYPES = {bool, int, float, Decimal}
+
+KIND_RANKS: dict[type, int] = {BNode: 10, URIRef: 30, Literal: 40}
+"""The rank of each kind of term, as in RDFlib's ordering of terms."""
+
+
+def sort_triples(triples: Iterable[_TripleType]) -> list[_TripleType]:
+    """Sort triples in the same order as `sorted()` would.
+
+    Parameters:
+        triples: The triples to sort.
+
+    Returns:
+        A new list of the sorted triples.
+
+    """
+    triples = list(triples)
+    key = triple_sort_key(triples)
+    return sorted(triples) if key is None else sorted(triples, key=key)
+
+
+def triple_sort_key(
+    triples: Iterable[_TripleType],
+) -> Callable[[_TripleType], TripleKey] | None:
+    """Create a sort key function for triples.
+
+    Parameters:
+        triples: All the triples that are to be sorted with the key function.
+
+    Returns:
+        A key function ordering the given triples in the same way as `sorted()` would,
+        or `None` if the triples contain terms of an unknown kind, for which the
+        triples should be sorted with `sorted()` instead.
+
+    """
+    literals: set[Literal] = set()
+    for triple in triples:
+        for term in triple:
+            if type(term) is Literal:
+                literals.add(term)
+            elif type(term) not in KIND_RANKS:
+                return None
+
+    literal_ranks = rank_literals(literals)
+    kind_ranks = KIND_RANKS
+    literal_kind_rank = KIND_RANKS[Literal]
+
+    def key(triple: _TripleType) -> TripleKey:
+        subject, predicate, object_ = triple
+        if type(object_) is Literal:
+            object_kind, object_value = literal_kind_rank, literal_ranks[object_]
+        else:
+            object_kind, object_value = kind_ranks[type(object_)], str(object_)
+        return (
+            kind_ranks[type(subject)],
+            str(subject),
+            kind_ranks[type(predicate)],
+            str(predicate),
+            object_kind,
+            object_value,
+        )
+
+    return key
+
+
+def rank_terms(terms: Sequence[Node], distinct: bool = False) -> list[int] | None:
+    """Rank distinct terms in the order RDFlib sorts them.
+
+    Terms that RDFlib considers neither less nor greater than each other get the same
+    rank, see `rank_literals()`, unless `distinct` is set.
+
+    Parameters:
+        terms: The distinct terms to rank.
+        distinct: Whether or not to give each term a distinct rank. Terms that RDFlib
+            considers neither less nor greater than each other, e.g., numeric literals
+            with the same value, are then ordered by their datatype, language and
+            lexical form, instead of being left in the order they are given in.
+
+    Returns:
+        The rank of each term, in the order of `terms`, or `None` if there are terms of
+        an unknown kind, which cannot be ranked.
+
+    """
+    literals: list[Literal] = []
+    for term in terms:
+        if type(term) is Literal:
+            literals.append(term)
+        elif type(term) not in KIND_RANKS:
+            return None
+
+    literal_ranks = rank_literals(literals)
+    shared_ranks = (
+        {rank for rank, count in Counter(literal_ranks.values()).items() if count > 1}
+        if distinct
+        else set()
+    )
+    kind_ranks = KIND_RANKS
+    keys: list[tuple[Any, ...]] = [
+        (
+            (
+                (kind_ranks[Literal], literal_ranks[term])
+                if literal_ranks[term] not in shared_ranks
+                else (
+                    kind_ranks[Literal],
+                    literal_ranks[term],
+                    str(term.datatype or ""),
+                    term.language or "",
+                    str(term),
+                )
+            )
+            if type(term) is Literal
+            else (kind_ranks[type(term)], str(term))
+        )
+        for term in terms
+    ]
+
+    ranks = [0] * len(keys)
+    rank, previous = -1, None
+    for index in sorted(range(len(keys)), key=keys.__getitem__):
+        if keys[index] != previous:
+            rank += 1
+            previous = keys[index]
+        ranks[index] = rank
+    return ranks
+
+
+def rank_literals(literals: Iterable[Literal]) -> dict[Literal, int]:
+    """Rank literals in the order RDFlib sorts them.
+
+    Literals that RDFlib considers neither less nor greater than each other, e.g.,
+    numeric literals with the same value, get the same rank.
+
+    RDFlib orders literals with different datatypes by their datatype, except for
+    numeric literals, which are always compared by value.
+    Literals are therefore grouped by datatype and the groups are ordered by datatype.
+    If several numeric datatypes are present, their literals form a single group,
+    compared by value, provided that no other datatype is ordered in between the
+    numeric datatypes, and otherwise all literals are compared using RDFlib.
+    Plain literals, language-tagged literals and `xsd:string` literals are compared
+    by language and lexical form, and literals of other datatypes with plain numeric,
+    boolean or string values are compared by value, both of which is done using plain
+    keys.
+    Any other literals are compared using RDFlib.
+
+    Parameters:
+        literals: The literals to rank.
+
+    Returns:
+        A mapping of each literal to its rank.
+
+    """
+    groups: defaultdict[URIRef, list[Literal]] = defaultdict(list)
+    for literal in literals:
+        groups[literal.datatype or XSD.string].append(literal)
+
+    ranks: dict[Literal, int] = {}
+    blocks = [(datatype, groups[datatype]) for datatype in sorted(groups, key=str)]
+    numeric = [
+        index
+        for index, (datatype, _) in enumerate(blocks)
+        if datatype in _NUMERIC_LITERAL_TYPES
+    ]
+    if len(numeric) > 1:
+        numeric_literals = [
+            literal for index in numeric for literal in blocks[index][1]
+        ]
+        if numeric[-1] - numeric[0] + 1 != len(numeric) or not _has_plain_values(
+            numeric_literals
+        ):
+            _rank_by_comparison(
+                [literal for group in groups.values() for literal in group], ranks
+            )
+            return ranks
+        blocks[numeric[0] : numeric[-1] + 1] = [
+            (blocks[numeric[0]][0], numeric_literals)
+        ]
+
+    for datatype, literals in blocks:
+        if datatype == XSD.string:
+            _rank_by_key(literals, _string_literal_key, ranks)
+        elif _has_plain_values(literals):
+            _rank_by_key(literals, _value_literal_key, ranks)
+        else:
+            _rank_by_comparison(literals, ranks)
+
+    return ranks
+
+
+def _string_literal_key(literal: Literal) -> tuple[bool, str, str]:
+    """Sort key for plain, language-tagged and `xsd:string` literals."""
+    return bool(literal.language), literal.language or "", str(literal)
+
+
+def _value_literal_key(literal: Literal) -> Any:
+    """Sort key for literals with plain values, see `_has_plain_values()`."""
+    return literal.value
+
+
+def _has_plain_values(literals: list[Literal]) -> bool:
+    """Whether or not literals of the same datatype can be compared by plain value.
+
+    This is the case if all literals are well-typed and their values are either all
+    (non-NaN) numbers (including booleans) or all strings.
+    """
+    value_types = set()
+    for literal in literals:
+        value = literal.value
+        if value is None or literal.ill_typed or value != value:
+            return False
+        value_types.add(type(value))
+    return value_types <= _NUMBER_TYPES or value_types == {str}
+
+
+def _rank_by_key(
+    literals: list[Literal],
+    key: Callable[[Literal], Any],
+    ranks: dict[Literal, int],
+) -> None:
+    """Rank literals using a key function, continuing from the existing ranks."""
+    rank = len(ranks) - 1
+    previous = None
+    for literal_key, literal in sorted(
+        ((key(_), _) for _ in literals), key=itemgetter(0)
+    ):
+        if literal_key != previous:
+            rank += 1
+        ranks[literal] = rank
+        previous = literal_key
+
+
+def _rank_by_comparison(literals: list[Literal], ranks: dict[Literal, int]) -> None:
+    """Rank literals using RDFlib's comparison, continuing from the existing ranks.
+
+    Some literals cannot be compared by RDFlib, e.g., a NaN `xsd:double` with an
+    `xsd:decimal`, which raises an error.
+    If so, NaN literals are instead ranked after all other literals, by datatype and
+    lexical form.
+    """
+    try:
+        ordered = sorted(literals)
+    except (ArithmeticError, TypeError):
+        not_a_number = [_ for _ in literals if _is_nan(_)]
+        ordered = sorted(_ for _ in literals if not _is_nan(_))
+    else:
+        not_a_number = []
+
+    rank = len(ranks) - 1
+    previous = None
+    for literal in ordered:
+        if previous is None or previous < literal:
+            rank += 1
+        ranks[literal] = rank
+        previous = literal
+
+    _rank_by_key(not_a_number, _nan_literal_key, ranks)
+
+
+def _is_nan(literal: Literal) -> bool:
+    """Whether or not a literal has a NaN value."""
+    value = literal.value
+    try:
+        return value != value
+    except ArithmeticError:
+        # A signaling NaN decimal
+        return True
+
+
+def _nan_literal_key(literal: Literal) -> tuple[str, str]:
+    """Sort key for literals with a NaN value."""
+    return str(literal.datatype), str(literal)
@@ -0,0 +1,276 @@
+"""A lean, read-only RDFlib store for sorted triples.
+
+RDFlib's default `Memory` store maintains three indexes for all triples.
+When the triples have already been sorted, they are grouped by subject, hence a single
+list of the triples and the position of each subject in the list suffices to serve the
+lookups needed for serializing the triples.
+
+The triples can be kept compactly as interned terms: each distinct term is stored once
+in a term dictionary, and the triples are stored as three columns of integer term IDs.
+Triples are only turned back into tuples of RDFlib terms when they are looked up.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, overload
+
+from rdflib import BNode
+from rdflib.store import Store
+
+from turtle_canon.utils.blank_nodes import canonical_blank_node_labels
+from turtle_canon.utils.sorting import rank_terms
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+    from typing import Any
+
+    from rdflib.graph import _ContextType, _TriplePatternType, _TripleType
+    from rdflib.term import Node, URIRef
+
+
+class InternedTriples(Sequence):
+    """Triples of interned terms, stored as three columns of integer term IDs.
+
+    Parameters:
+        triples: The triples to intern.
+        unique: Whether or not to drop duplicate triples, e.g., when the triples are
+            not taken from an RDFlib `Graph`, but streamed from a parser.
+
+    """
+
+    def __init__(
+        self, triples: Iterable[_TripleType] = (), unique: bool = False
+    ) -> None:
+        term_ids: dict[Node, int] = {}
+        terms: list[Node] = []
+        subjects, predicates, objects = array("q"), array("q"), array("q")
+        seen: set[tuple[int, ...]] = set()
+
+        for triple in triples:
+            ids = []
+            for term in triple:
+                term_id = term_ids.get(term)
+                if term_id is None:
+                    term_id = term_ids[term] = len(terms)
+                    terms.append(term)
+                ids.append(term_id)
+
+            if unique:
+                key = tuple(ids)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+            subject, predicate, object_ = ids
+            subjects.append(subject)
+            predicates.append(predicate)
+            objects.append(object_)
+
+        self._terms = terms
+        self._columns = (subjects, predicates, objects)
+
+    @property
+    def terms(self) -> list[Node]:
+        """Get `terms` attribute, the term dictionary, indexed by term ID."""
+        return self._terms
+
+    @property
+    def columns(self) -> tuple[array, array, array]:
+        """Get `columns` attribute, the subject, predicate and object term IDs."""
+        return self._columns
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    @overload
+    def __getitem__(self, index: int) -> _TripleType: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_TripleType]: ...
+
+    def __getitem__(self, index: int | slice) -> _TripleType | list[_TripleType]:
+        terms = self._terms
+        subjects, predicates, objects = self._columns
+        if isinstance(index, slice):
+            return [
+                (terms[subjects[_]], terms[predicates[_]], terms[objects[_]])
+                for _ in range(*index.indices(len(self)))
+            ]
+        return terms[subjects[index]], terms[predicates[index]], terms[objects[index]]
+
+    def __iter__(self) -> Iterator[_TripleType]:
+        terms = self._terms
+        for subject, predicate, object_ in zip(*self._columns, strict=True):
+            yield terms[subject], terms[predicate], terms[object_]
+
+    def sort(self) -> InternedTriples:
+        """Sort the triples in place, in the same order as `sorted()` would.
+
+        Each distinct term is ranked once, after which each triple is sorted on a
+        single integer combining its terms' ranks and its current position.
+        Terms that RDFlib considers neither less nor greater than each other are
+        ranked by their datatype, language and lexical form, see `rank_terms()`, such
+        that the order does not depend on the order the triples were added in.
+
+        Returns:
+            The sorted triples, i.e., `self`.
+
+        """
+        number_of_triples = len(self)
+        ranks = rank_terms(self._terms, distinct=True)
+        if ranks is None:
+            order = sorted(range(number_of_triples), key=self.__getitem__)
+        else:
+            base = max(ranks, default=0) + 1
+            order = [
+                key % number_of_triples
+                for key in sorted(
+                    ((ranks[subject] * base + ranks[predicate]) * base + ranks[object_])
+                    * number_of_triples
+                    + index
+                    for index, (subject, predicate, object_) in enumerate(
+                        zip(*self._columns, strict=True)
+                    )
+                )
+            ]
+
+        self._columns = tuple(  # type: ignore[assignment]
+            array("q", map(column.__getitem__, order)) for column in self._columns
+        )
+        return self
+
+    def canonicalize_blank_nodes(self) -> InternedTriples:
+        """Relabel the blank nodes in place, with canonical labels.
+
+        The labels only depend on the triples, not on the blank nodes' identifiers,
+        see `turtle_canon.utils.blank_nodes`.
+
+        Returns:
+            The relabelled triples, i.e., `self`.
+
+        """
+        for term_id, label in canonical_blank_node_labels(
+            self._terms, self._columns
+        ).items():
+            self._terms[term_id] = BNode(label)
+        return self
+
+    def subject_ranges(self) -> dict[Node, tuple[int, int]]:
+        """Return the range of positions of each run of the same subject.
+
+        For sorted triples, each subject has a single run.
+        """
+        ranges: dict[Node, tuple[int, int]] = {}
+        subjects = self._columns[0]
+        start = 0
+        for index in range(1, len(subjects) + 1):
+            if index == len(subjects) or subjects[index] != subjects[start]:
+                ranges[self._terms[subjects[start]]] = (start, index)
+                start = index
+        return ranges
+
+
+class SortedTriplesStore(Store):
+    """A read-only RDFlib store for sorted triples.
+
+    Parameters:
+        triples: The sorted triples, e.g., as a list or as `InternedTriples`. The
+            sequence is used as-is, i.e., it is not copied.
+        namespaces: Initial namespace bindings, as pairs of prefix and namespace.
+
+    """
+
+    def __init__(
+        self,
+        triples: Sequence[_TripleType],
+        namespaces: Iterable[tuple[str, URIRef]] = (),
+    ) -> None:
+        super().__init__()
+        self._triples = triples
+        self._subjects: dict[Node, tuple[int, int]] = {}
+        self._namespace: dict[str, URIRef] = {}
+        self._prefix: dict[URIRef, str] = {}
+
+        if isinstance(triples, InternedTriples):
+            self._subjects = triples.subject_ranges()
+        else:
+            start = 0
+            for index in range(1, len(triples) + 1):
+                if index == len(triples) or triples[index][0] != triples[start][0]:
+                    self._subjects[triples[start][0]] = (start, index)
+                    start = index
+
+        for prefix, namespace in namespaces:
+            self.bind(prefix, namespace)
+
+    @property
+    def sorted_triples(self) -> Sequence[_TripleType]:
+        """Get `sorted_triples` attribute, the sorted triples backing the store."""
+        return self._triples
+
+    def triples(
+        self,
+        triple_pattern: _TriplePatternType,
+        context: _ContextType | None = None,  # noqa: ARG002
+    ) -> Iterator[tuple[_TripleType, Iterator[_ContextType | None]]]:
+        """Iterate over the triples matching a triple pattern, in sorted order."""
+        subject, predicate, object_ = triple_pattern
+        if subject is None:
+            start, end = 0, len(self._triples)
+        else:
+            start, end = self._subjects.get(subject, (0, 0))
+
+        for index in range(start, end):
+            triple = self._triples[index]
+            if (predicate is None or triple[1] == predicate) and (
+                object_ is None or triple[2] == object_
+            ):
+                yield triple, iter(())
+
+    def __len__(self, context: _ContextType | None = None) -> int:
+        return len(self._triples)
+
+    def add(self, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
+        raise TypeError(f"{self.__class__.__name__} is read-only.")
+
+    def addN(self, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
+        raise TypeError(f"{self.__class__.__name__} is read-only.")
+
+    def remove(self, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
+        raise TypeError(f"{self.__class__.__name__} is read-only.")
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        """Bind a prefix to a namespace, as RDFlib's `Memory` store does."""
+        bound_namespace = self._namespace.get(prefix)
+        bound_prefix = self._prefix.get(namespace)
+        if bound_prefix is None and bound_namespace is not None:
+            bound_prefix = self._prefix.get(bound_namespace)
+
+        if override:
+            if bound_prefix is not None:
+                del self._namespace[bound_prefix]
+            if bound_namespace is not None:
+                del self._prefix[bound_namespace]
+            self._prefix[namespace] = prefix
+            self._namespace[prefix] = namespace
+        else:
+            if bound_namespace is None:
+                bound_namespace = namespace
+            if bound_prefix is None:
+                bound_prefix = prefix
+            self._prefix[bound_namespace] = bound_prefix
+            self._namespace[bound_prefix] = bound_namespace
+
+    def namespace(self, prefix: str) -> URIRef | None:
+        """Return the namespace bound to a prefix."""
+        return self._namespace.get(prefix)
+
+    def prefix(self, namespace: URIRef) -> str | None:
+        """Return the prefix bound to a namespace."""
+        return self._prefix.get(namespace)
+
+    def namespaces(self) -> Iterator[tuple[str, URIRef]]:
+        """Iterate over all namespace bindings."""
+        yield from self._namespace.items()
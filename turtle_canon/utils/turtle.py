@@ -0,0 +1,417 @@
+"""A fast parser for the common subset of Turtle.
+
+RDFlib's Turtle parser (the `notation3` parser) scans its input character by
+character.
+This parser instead tokenizes the input with a single regular expression and parses
+the tokens with a small recursive descent parser, yielding triples as soon as each
+statement has been parsed.
+
+The supported subset covers:
+
+- `@prefix`/`PREFIX` and `@base`/`BASE` directives.
+- IRIs, prefixed names and the `a` keyword.
+- Blank node labels, blank node property lists (`[ ... ]`) and collections
+  (`( ... )`).
+- String literals in all four quoting styles, with a language tag or a datatype,
+  as well as numbers and booleans.
+
+The triples are the same as the ones RDFlib's parser produces, down to the lexical
+forms of the literals and the (generated) blank node identifiers, which have the
+same order as RDFlib's.
+Anything outside of the supported subset, as well as any invalid Turtle, raises a
+`TurtleSyntaxError`, upon which the content should be parsed with RDFlib instead.
+"""
+
+from __future__ import annotations
+
+import re
+from decimal import Decimal
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from rdflib import BNode, Literal, URIRef
+from rdflib.namespace import RDF, XSD
+from rdflib.plugins.parsers.notation3 import join
+
+from turtle_canon.utils.ntriples import _PN_CHARS_BASE, _UCHAR
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterator
+
+    from rdflib.graph import _TripleType
+    from rdflib.term import Node
+
+
+class TurtleSyntaxError(ValueError):
+    """The content is not in the subset of Turtle supported by `TurtleParser`."""
+
+
+# Characters ending a name, as in RDFlib's parser
+_STOP = r"[\t\r\n !\"#$&'()*,+/;<=>?@\[\\\]^`{|}~]"
+_NAME_END = rf"(?={_STOP}|\.(?:{_STOP}|\Z)|\Z)"
+_KEYWORD_END = rf"(?={_STOP}|\.|\Z)"
+
+_PN_CHARS_U = rf"{_PN_CHARS_BASE}_"
+_PN_CHARS = rf"{_PN_CHARS_U}0-9\-\u00B7\u0300-\u036F\u203F-\u2040"
+_PN_PREFIX = rf"[{_PN_CHARS_BASE}](?:[{_PN_CHARS}.]*[{_PN_CHARS}])?"
+_PLX = r"%[0-9A-Fa-f]{2}|\\[_~.\-!$&'()*+,;=/?#@%]"
+_PN_LOCAL = (
+    rf"(?:[{_PN_CHARS_U}:0-9]|{_PLX})"
+    rf"(?:(?:[{_PN_CHARS}.:]|{_PLX})*(?:[{_PN_CHARS}:]|{_PLX}))?"
+)
+_BLANK_NODE_LABEL = rf"[{_PN_CHARS_U}0-9](?:[{_PN_CHARS}.]*[{_PN_CHARS}])?"
+
+_IRI_CHARS = r"[^\x00-\x20<>\"{}|^`\\]*"
+_ECHAR = r"\\(?:[abfrtvn\\\"']|u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8})"
+_LANGUAGE_TAG = r"[a-zA-Z0-9]+(?:-[a-zA-Z0-9]+)*"
+
+
+def _long_string(quote: str, group: int) -> str:
+    """Pattern for a long string, capturing its content and trailing quotes."""
+    return (
+        rf"{quote * 3}(?P<long{group}>[^{quote}\\]*"
+        rf"(?:(?:{_ECHAR}|{quote}(?!{quote * 2}))[^{quote}\\]*)*)"
+        rf"(?P<quotes{group}>{quote}{{0,2}}){quote * 3}"
+    )
+
+
+def _string(quote: str, group: int) -> str:
+    """Pattern for a (short) string, capturing its content."""
+    chars = rf"[^{quote}\\\n\r]*"
+    return rf"{quote}(?P<short{group}>{chars}(?:{_ECHAR}{chars})*){quote}"
+
+
+_TOKENS = re.compile(
+    r"(?:[ \t\r\n]|#[^\r\n]*)*(?:"
+    + "|".join(
+        (
+            rf"(?P<IRI><{_IRI_CHARS}(?:(?:{_UCHAR}){_IRI_CHARS})*>)",
+            rf"(?P<PNAME>(?P<prefix>{_PN_PREFIX})?:(?P<local>{_PN_LOCAL})?){_NAME_END}",
+            rf"(?P<BNODE>_:{_BLANK_NODE_LABEL}){_NAME_END}",
+            r"(?P<STRING>(?:"
+            + "|".join(
+                (
+                    _long_string('"', 1),
+                    _long_string("'", 2),
+                    _string('"', 1),
+                    _string("'", 2),
+                )
+            )
+            + rf")(?:@(?P<language>{_LANGUAGE_TAG})|(?P<datatype>\^\^))?)",
+            r"(?P<DOUBLE>[-+]?(?:[0-9]+\.[0-9]*|\.[0-9]+|[0-9]+)[eE][-+]?[0-9]+)",
+            r"(?P<DECIMAL>[-+]?[0-9]*\.[0-9]+)",
+            r"(?P<INTEGER>[-+]?[0-9]+)",
+            rf"(?P<A>a){_KEYWORD_END}",
+            rf"(?P<BOOLEAN>true|false){_KEYWORD_END}",
+            rf"(?P<AT_PREFIX>@prefix){_KEYWORD_END}",
+            rf"(?P<AT_BASE>@base){_KEYWORD_END}",
+            rf"(?P<PREFIX>(?i:prefix))(?={_STOP})",
+            rf"(?P<BASE>(?i:base))(?={_STOP})",
+            r"(?P<DOT>\.)",
+            r"(?P<SEMICOLON>;)",
+            r"(?P<COMMA>,)",
+            r"(?P<OPEN_BRACKET>\[)",
+            r"(?P<CLOSE_BRACKET>\])",
+            r"(?P<OPEN_PARENTHESIS>\()",
+            r"(?P<CLOSE_PARENTHESIS>\))",
+            r"(?P<END>\Z)",
+            r"(?P<ERROR>.)",
+        )
+    )
+    + ")",
+    re.DOTALL,
+)
+
+_STRING_ESCAPE = re.compile(
+    r"\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|([abfrtvn\\\"']))"
+)
+_UNESCAPED = dict(zip("abfrtvn\\\"'", "\a\b\f\r\t\v\n\\\"'", strict=True))
+_LOCAL_ESCAPE = re.compile(r"\\(.)")
+
+_TERM_TOKENS = frozenset(("IRI", "PNAME"))
+_OBJECT_END_TOKENS = frozenset(("DOT", "CLOSE_BRACKET"))
+
+
+class TurtleParser:
+    """A fast parser for the common subset of Turtle.
+
+    Parameters:
+        content: The Turtle content to parse.
+        base: The base IRI to resolve relative IRIs against, i.e., the absolute IRI
+            of the Turtle document.
+
+    """
+
+    def __init__(self, content: str, base: str) -> None:
+        self._content = content
+        self._base = base
+        self._namespaces: dict[str, str] = {}
+        self._terms: dict[str, URIRef] = {}
+        self._literals: dict[tuple[str, str | None, URIRef | None], Literal] = {}
+        self._blank_nodes: dict[str, BNode] = {}
+        self._blank_node_prefix = f"n{uuid4().hex}b"
+        self._blank_node_count = 0
+        self._statements: list[_TripleType] = []
+        self._next_token: Callable[[], re.Match]
+        self._token: re.Match
+        self._kind: str
+
+    @property
+    def namespaces(self) -> dict[str, str]:
+        """Get `namespaces` attribute, the declared prefixes and their namespaces.
+
+        The namespaces are complete once all triples have been parsed.
+        """
+        return self._namespaces
+
+    def triples(self) -> Iterator[_TripleType]:
+        """Parse the content, yielding the triples of each statement in turn.
+
+        Raises:
+            TurtleSyntaxError: If the content is not in the supported subset of Turtle
+                or is not valid Turtle.
+
+        Yields:
+            The parsed triples.
+
+        """
+        self._next_token = _TOKENS.finditer(self._content).__next__
+        self._advance()
+        statements = self._statements
+        while self._kind != "END":
+            self._statement()
+            yield from statements
+            statements.clear()
+
+    def _advance(self) -> None:
+        """Move on to the next token."""
+        self._token = self._next_token()
+        self._kind = self._token.lastgroup  # type: ignore[assignment]
+
+    def _expect(self, kind: str) -> re.Match:
+        """Consume a token of a specific kind."""
+        token = self._token
+        if self._kind != kind:
+            raise self._syntax_error(f"expected {kind}")
+        self._advance()
+        return token
+
+    def _syntax_error(self, message: str) -> TurtleSyntaxError:
+        """Create a `TurtleSyntaxError` for the current token."""
+        position = self._token.start(self._kind)
+        line = self._content.count("\n", 0, position) + 1
+        return TurtleSyntaxError(
+            f"Line {line}: {message}, found {self._content[position:position + 20]!r}"
+        )
+
+    def _statement(self) -> None:
+        """Parse a directive or a statement of triples."""
+        kind = self._kind
+        if kind in ("AT_PREFIX", "PREFIX"):
+            self._advance()
+            prefix = self._expect("PNAME")
+            if prefix["local"]:
+                raise self._syntax_error("expected a prefix")
+            namespace = join(self._base, self._iri(self._expect("IRI")))
+            self._namespaces[prefix["prefix"] or ""] = namespace
+            self._terms.clear()
+            if kind == "AT_PREFIX":
+                self._expect("DOT")
+            return
+
+        if kind in ("AT_BASE", "BASE"):
+            self._advance()
+            self._base = join(self._base, self._iri(self._expect("IRI")))
+            self._terms.clear()
+            if kind == "AT_BASE":
+                self._expect("DOT")
+            return
+
+        if kind == "OPEN_BRACKET":
+            subject = self._blank_node_property_list()
+            if self._kind != "DOT":
+                self._predicate_object_list(subject)
+        else:
+            self._predicate_object_list(self._subject())
+        self._expect("DOT")
+
+    def _subject(self) -> Node:
+        """Parse a subject, other than a blank node property list."""
+        kind = self._kind
+        if kind in _TERM_TOKENS:
+            return self._named_node()
+        if kind == "BNODE":
+            return self._blank_node()
+        if kind == "OPEN_PARENTHESIS":
+            return self._collection()
+        raise self._syntax_error("expected a subject")
+
+    def _predicate_object_list(self, subject: Node) -> None:
+        """Parse predicates and their objects for a subject."""
+        while True:
+            if self._kind == "A":
+                self._advance()
+                predicate: Node = RDF.type
+            elif self._kind in _TERM_TOKENS:
+                predicate = self._named_node()
+            else:
+                raise self._syntax_error("expected a predicate")
+
+            self._object(subject, predicate)
+            while self._kind == "COMMA":
+                self._advance()
+                self._object(subject, predicate)
+
+            if self._kind != "SEMICOLON":
+                return
+            while self._kind == "SEMICOLON":
+                self._advance()
+            if self._kind in _OBJECT_END_TOKENS:
+                return
+
+    def _object(self, subject: Node, predicate: Node) -> None:
+        """Parse an object, adding the triple it completes."""
+        self._statements.append((subject, predicate, self._term()))
+
+    def _term(self) -> Node:
+        """Parse a term in object position, i.e., any term."""
+        kind = self._kind
+        if kind in _TERM_TOKENS:
+            return self._named_node()
+        if kind == "STRING":
+            return self._string()
+        if kind == "BNODE":
+            return self._blank_node()
+        if kind == "OPEN_BRACKET":
+            return self._blank_node_property_list()
+        if kind == "OPEN_PARENTHESIS":
+            return self._collection()
+        if kind in ("INTEGER", "DECIMAL", "DOUBLE", "BOOLEAN"):
+            return self._number()
+        raise self._syntax_error("expected an object")
+
+    def _named_node(self) -> URIRef:
+        """Parse an IRI or a prefixed name."""
+        token = self._token
+        text = token[self._kind]
+        term = self._terms.get(text)
+        if term is None:
+            if self._kind == "IRI":
+                term = URIRef(join(self._base, self._iri(token)))
+            else:
+                namespace = self._namespaces.get(token["prefix"] or "")
+                if namespace is None:
+                    raise self._syntax_error("undeclared prefix")
+                local = token["local"] or ""
+                if "\\" in local:
+                    local = _LOCAL_ESCAPE.sub(r"\1", local)
+                term = URIRef(f"{namespace}{local}")
+            self._terms[text] = term
+        self._advance()
+        return term
+
+    def _iri(self, token: re.Match) -> str:
+        """Return the IRI of an IRI token, resolved against the base IRI."""
+        iri = token["IRI"][1:-1]
+        if "\\" in iri:
+            iri = _STRING_ESCAPE.sub(_unescape, iri)
+        try:
+            resolved = join(self._base, iri)
+        except (AssertionError, ValueError) as exc:
+            raise self._syntax_error("cannot resolve IRI") from exc
+        if iri.endswith("#") and not resolved.endswith("#"):
+            resolved += "#"
+        return resolved
+
+    def _string(self) -> Literal:
+        """Parse a string literal, possibly with a language tag or a datatype."""
+        token = self._token
+        if token["long1"] is not None:
+            value = token["long1"] + token["quotes1"]
+        elif token["long2"] is not None:
+            value = token["long2"] + token["quotes2"]
+        else:
+            value = token["short1"] if token["short2"] is None else token["short2"]
+        if "\\" in value:
+            value = _STRING_ESCAPE.sub(_unescape, value)
+        language = token["language"]
+        self._advance()
+
+        datatype = None
+        if token["datatype"] is not None:
+            if self._kind not in _TERM_TOKENS:
+                raise self._syntax_error("expected a datatype")
+            datatype = self._named_node()
+            language = None
+
+        key = (value, language, datatype)
+        literal = self._literals.get(key)
+        if literal is None:
+            if datatype is None:
+                literal = Literal(value, lang=language)
+            else:
+                literal = Literal(value, datatype=datatype)
+            self._literals[key] = literal
+        return literal
+
+    def _number(self) -> Literal:
+        """Parse a number or a boolean, normalizing it as RDFlib does."""
+        kind = self._kind
+        text = self._token[kind]
+        self._advance()
+
+        if kind == "INTEGER":
+            return Literal(str(int(text)), datatype=XSD.integer)
+        if kind == "DECIMAL":
+            value = str(Decimal(text))
+            return Literal("0" if value == "-0" else value, datatype=XSD.decimal)
+        if kind == "DOUBLE":
+            return Literal(text, datatype=XSD.double)
+        return Literal(text, datatype=XSD.boolean)
+
+    def _new_blank_node(self) -> BNode:
+        """Create a new blank node, identified as RDFlib's parser does."""
+        self._blank_node_count += 1
+        return BNode(f"{self._blank_node_prefix}{self._blank_node_count}")
+
+    def _blank_node(self) -> BNode:
+        """Parse a blank node label."""
+        label = self._token["BNODE"]
+        self._advance()
+        blank_node = self._blank_nodes.get(label)
+        if blank_node is None:
+            blank_node = self._blank_nodes[label] = self._new_blank_node()
+        return blank_node
+
+    def _blank_node_property_list(self) -> BNode:
+        """Parse a blank node property list, including the enclosing brackets."""
+        self._advance()
+        blank_node = self._new_blank_node()
+        if self._kind != "CLOSE_BRACKET":
+            self._predicate_object_list(blank_node)
+        self._expect("CLOSE_BRACKET")
+        return blank_node
+
+    def _collection(self) -> Node:
+        """Parse a collection, including the enclosing parentheses."""
+        self._advance()
+        items = []
+        while self._kind != "CLOSE_PARENTHESIS":
+            items.append(self._term())
+        self._advance()
+
+        if not items:
+            return RDF.nil
+        nodes = [self._new_blank_node() for _ in items]
+        for node, item, rest in zip(nodes, items, [*nodes[1:], RDF.nil], strict=True):
+            self._statements.append((node, RDF.first, item))
+            self._statements.append((node, RDF.rest, rest))
+        return nodes[0]
+
+
+def _unescape(match: re.Match) -> str:
+    """Return the character represented by an escape sequence."""
+    hex_digits = match.group(1) or match.group(2)
+    if hex_digits:
+        return chr(int(hex_digits, 16))
+    return _UNESCAPED[match.group(3)]
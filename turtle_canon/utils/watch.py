@@ -0,0 +1,241 @@
+"""Watching directories for changed files.
+
+Changes are detected with inotify on Linux, through `ctypes` without any further
+dependencies, and otherwise by polling the modification times and sizes of the files.
+
+Saving a file often results in a burst of changes, e.g., writing a temporary file and
+renaming it, hence changes are debounced: once a file has changed, changes are
+collected until none have been detected for a short while, and then reported together.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+DEFAULT_DEBOUNCE = 0.1
+"""The default time in seconds without any changes, before changes are reported."""
+
+DEFAULT_POLL_INTERVAL = 0.25
+"""The default time in seconds between polling the files for changes."""
+
+# From <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_IN_ISDIR = 0x40000000
+_IN_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+_EVENT = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+def watch(
+    directories: Iterable[Path],
+    suffixes: Iterable[str] = (".ttl",),
+    debounce: float = DEFAULT_DEBOUNCE,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    use_inotify: bool = True,
+) -> Iterator[list[Path]]:
+    """Watch directories, including their subdirectories, for changed files.
+
+    Parameters:
+        directories: The directories to watch.
+        suffixes: The (lower case) suffixes of the files to watch.
+        debounce: The time in seconds without any changes, before changes are
+            reported.
+        poll_interval: The time in seconds between polling the files for changes, if
+            inotify is not used.
+        use_inotify: Whether or not to use inotify, if it is available.
+
+    Yields:
+        The existing files changed (or created) since the previous batch, sorted.
+
+    """
+    directories = [Path(_).resolve() for _ in directories]
+    suffixes = tuple(_.lower() for _ in suffixes)
+    watcher: _InotifyWatcher | _PollingWatcher | None = (
+        _InotifyWatcher.create(directories) if use_inotify else None
+    )
+    if watcher is None:
+        watcher = _PollingWatcher(directories, suffixes, poll_interval)
+
+    try:
+        while True:
+            changed = watcher.read(None)
+            while more := watcher.read(debounce):
+                changed |= more
+            files = sorted(
+                path
+                for path in changed
+                if path.suffix.lower() in suffixes and path.is_file()
+            )
+            if files:
+                yield files
+    finally:
+        watcher.close()
+
+
+def _walk(directory: Path) -> Iterator[tuple[Path, list[str]]]:
+    """Yield each (sub)directory and its files, skipping hidden directories."""
+    for root, subdirectories, files in os.walk(directory):
+        subdirectories[:] = [_ for _ in subdirectories if not _.startswith(".")]
+        yield Path(root), files
+
+
+class _PollingWatcher:
+    """Detect changed files by polling their modification times and sizes."""
+
+    def __init__(
+        self, directories: list[Path], suffixes: tuple[str, ...], poll_interval: float
+    ) -> None:
+        self._directories = directories
+        self._suffixes = suffixes
+        self._poll_interval = poll_interval
+        self._states = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        """Return the modification time and size of each watched file."""
+        states = {}
+        for directory in self._directories:
+            for root, files in _walk(directory):
+                for name in files:
+                    path = root / name
+                    if path.suffix.lower() not in self._suffixes:
+                        continue
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    states[path] = (stat.st_mtime_ns, stat.st_size)
+        return states
+
+    def read(self, timeout: float | None) -> set[Path]:
+        """Wait for changed files, for at most `timeout` seconds (if not `None`)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            states = self._scan()
+            changed = {
+                path
+                for path, state in states.items()
+                if self._states.get(path) != state
+            }
+            self._states = states
+            if changed:
+                return changed
+
+            if deadline is None:
+                time.sleep(self._poll_interval)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return changed
+            time.sleep(min(self._poll_interval, remaining))
+
+    def close(self) -> None:
+        """Stop watching."""
+
+
+class _InotifyWatcher:
+    """Detect changed files with inotify (Linux only)."""
+
+    def __init__(self, libc: object, file_descriptor: int) -> None:
+        self._libc = libc
+        self._file_descriptor = file_descriptor
+        self._directories: dict[int, Path] = {}
+
+    @classmethod
+    def create(cls, directories: list[Path]) -> _InotifyWatcher | None:
+        """Create a watcher of directories, or return `None` if inotify is not
+        available."""
+        if not sys.platform.startswith("linux"):
+            return None
+
+        import ctypes
+        import ctypes.util
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            file_descriptor = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if file_descriptor < 0:
+            return None
+
+        watcher = cls(libc, file_descriptor)
+        for directory in directories:
+            if watcher._add_tree(directory) is None:
+                watcher.close()
+                return None
+        return watcher
+
+    def _add_tree(self, directory: Path) -> set[Path] | None:
+        """Watch a directory and its subdirectories.
+
+        Returns:
+            The files already in the directories, or `None` if a directory could not
+            be watched, e.g., since the limit of inotify watches was reached.
+
+        """
+        files: set[Path] = set()
+        for root, names in _walk(directory):
+            watch_descriptor = self._libc.inotify_add_watch(  # type: ignore[attr-defined]
+                self._file_descriptor, os.fsencode(root), _IN_MASK
+            )
+            if watch_descriptor < 0:
+                return None
+            self._directories[watch_descriptor] = root
+            files.update(root / name for name in names)
+        return files
+
+    def read(self, timeout: float | None) -> set[Path]:
+        """Wait for changed files, for at most `timeout` seconds (if not `None`)."""
+        readable, _, _ = select.select([self._file_descriptor], [], [], timeout)
+        changed: set[Path] = set()
+        if not readable:
+            return changed
+
+        try:
+            data = os.read(self._file_descriptor, _READ_SIZE)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset < len(data):
+            watch_descriptor, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                # Events were lost, hence all files are considered changed
+                for directory in set(self._directories.values()):
+                    if directory.is_dir():
+                        changed.update(directory.iterdir())
+                continue
+
+            directory = self._directories.get(watch_descriptor)
+            if directory is None or not name:
+                continue
+            path = directory / name
+            if mask & _IN_ISDIR:
+                if mask & _IN_CREATE and not name.startswith("."):
+                    # Files may have been added before the new directory was watched
+                    changed.update(self._add_tree(path) or ())
+            elif mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO):
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        """Stop watching."""
+        if self._file_descriptor >= 0:
+            os.close(self._file_descriptor)
+            self._file_descriptor = -1
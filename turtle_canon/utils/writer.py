@@ -0,0 +1,444 @@
+"""A streaming writer of sorted triples as canonical Turtle.
+
+RDFlib's `TurtleSerializer` produces the canonical Turtle output, but it looks up every
+subject's triples through RDFlib's generic graph API, builds dictionaries of all
+subjects, references and serialized nodes keyed on RDFlib terms, and writes every
+token to the output stream separately.
+
+For triples that are already sorted and interned, see
+`turtle_canon.utils.store.InternedTriples`, the same output can be written directly
+from the integer term ID columns:
+
+1. A first pass over the triples counts the references to each term and computes the
+   prefixed name of each distinct term once, in the same order as RDFlib does, to find
+   the prefixes to declare.
+2. Subjects are ordered as RDFlib orders them, and each subject block (including any
+   blank nodes and collections inlined into it) is written to the output stream as
+   soon as it is complete, such that only a single subject block is held in memory at
+   a time.
+
+Prefixed names and the lexical forms of terms are computed as RDFlib's
+`TurtleSerializer` computes them, such that the output is identical, byte for byte, to
+the output of `Graph.serialize(format="turtle")`.
+Prefixed names are computed once per distinct IRI. For most IRIs, i.e., a namespace
+bound on the graph followed by a simple local name, this is a single lookup in an
+index of the bound namespaces, instead of RDFlib's character-by-character splitting of
+the IRI and search for the longest matching namespace.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from rdflib import BNode, Literal, URIRef
+from rdflib.namespace import RDF, RDFS, XMLNS
+from rdflib.plugins.serializers.turtle import OBJECT, SUBJECT, VERB, TurtleSerializer
+from rdflib.term import _is_valid_uri
+
+from turtle_canon.utils.store import InternedTriples, SortedTriplesStore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import IO
+
+    from rdflib import Graph
+    from rdflib.term import Node
+
+_ENCODING = "utf-8"
+_INDENT = "    "
+_SIMPLE_LOCAL_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+
+
+def write_turtle(ontology: Graph, stream: IO[bytes]) -> None:
+    """Serialize an ontology as Turtle, using UTF-8 encoding.
+
+    The output is the same as the output of
+    `ontology.serialize(stream, format="turtle", encoding="utf-8")`.
+    If the ontology is backed by sorted, interned triples, the output is written by a
+    streaming writer, and otherwise by RDFlib's `TurtleSerializer`.
+
+    Parameters:
+        ontology: The ontology to serialize.
+        stream: The binary stream to write the serialized ontology to.
+
+    """
+    store = ontology.store
+    triples = store.sorted_triples if isinstance(store, SortedTriplesStore) else None
+    if not isinstance(triples, InternedTriples) or not all(
+        isinstance(triples.terms[predicate], URIRef)
+        for predicate in set(triples.columns[1])
+    ):
+        ontology.serialize(stream, format="turtle", encoding=_ENCODING)
+        return
+
+    _TurtleWriter(ontology, triples, stream).write()
+
+
+class _PrefixedNames:
+    """Compute prefixed names as `TurtleSerializer.get_pname()` does, once per IRI.
+
+    An IRI made up of a namespace ending in `#` or `/` and a simple local name, i.e.,
+    ASCII letters, digits, `_` and `-`, not starting with a digit or `-`, is split by
+    RDFlib right after the namespace, and needs no escaping. If that namespace is bound
+    on the graph, and not extended by another bound namespace, it is therefore the
+    longest matching namespace, and the prefixed name is found with a single lookup.
+    All other IRIs are left to RDFlib.
+
+    Parameters:
+        serializer: The serializer to declare the prefixes of the prefixed names in.
+
+    """
+
+    def __init__(self, serializer: TurtleSerializer) -> None:
+        self._serializer = serializer
+        self._names: dict[str, str] = {}
+
+        bound = {
+            str(namespace): prefix
+            for prefix, namespace in serializer.store.namespaces()
+        }
+        self._namespaces = {
+            namespace: (prefix, URIRef(namespace))
+            for namespace, prefix in bound.items()
+            if namespace[-1:] in ("#", "/")
+            and _is_valid_uri(namespace)
+            and not any(
+                other != namespace and other.startswith(namespace) for other in bound
+            )
+        }
+
+    def __call__(self, iri: URIRef, generate: bool) -> str | None:
+        """The prefixed name of an IRI, if any.
+
+        Parameters:
+            iri: The IRI to compact.
+            generate: Whether or not to generate (and bind) a prefix for the IRI's
+                namespace, if no prefix is bound to it.
+
+        Returns:
+            The prefixed name, or `None` if the IRI cannot be written as a prefixed
+            name (yet).
+
+        """
+        name = self._names.get(iri)
+        if name is not None:
+            return name
+
+        split = max(iri.rfind("#"), iri.rfind("/")) + 1
+        binding = self._namespaces.get(iri[:split])
+        if (
+            binding is not None
+            and not iri.startswith(XMLNS)
+            and _SIMPLE_LOCAL_NAME.fullmatch(iri, split)
+        ):
+            prefix = self._serializer.addNamespace(*binding)
+            name = f"{prefix}:{iri[split:]}"
+        else:
+            name = self._serializer.get_pname(iri, gen_prefix=generate)
+
+        if name is not None:
+            self._names[iri] = name
+        return name
+
+
+class _TurtleWriter:
+    """Write interned triples as Turtle, in the same way as RDFlib's `TurtleSerializer`.
+
+    The names of the methods mirror the names of the methods of `TurtleSerializer`,
+    which they replicate.
+    Terms are referred to by their term IDs throughout.
+
+    Parameters:
+        ontology: The ontology to serialize, backed by `triples`.
+        triples: The sorted, interned triples, with only IRIs as predicates.
+        stream: The binary stream to write the serialized ontology to.
+
+    """
+
+    def __init__(
+        self, ontology: Graph, triples: InternedTriples, stream: IO[bytes]
+    ) -> None:
+        self._serializer = TurtleSerializer(ontology)
+        self._serializer.base = ontology.base
+        self._prefixed_names = _PrefixedNames(self._serializer)
+        self._stream = stream
+        self._terms = triples.terms
+        self._subjects, self._predicates, self._objects = triples.columns
+
+        self._ranges: dict[int, tuple[int, int]] = {}
+        start = 0
+        for index in range(1, len(self._subjects) + 1):
+            if (
+                index == len(self._subjects)
+                or self._subjects[index] != self._subjects[start]
+            ):
+                self._ranges[self._subjects[start]] = (start, index)
+                start = index
+
+        special_terms = dict.fromkeys(
+            (RDF.type, RDF.first, RDF.rest, RDF.nil, RDFS.Class, RDFS.label)
+        )
+        term_ids = {
+            term: term_id
+            for term_id, term in enumerate(self._terms)
+            if term in special_terms
+        }
+        self._type = term_ids.get(RDF.type)
+        self._first = term_ids.get(RDF.first)
+        self._rest = term_ids.get(RDF.rest)
+        self._nil = term_ids.get(RDF.nil)
+        self._class = term_ids.get(RDFS.Class)
+        self._predicate_order = [
+            term_ids[_] for _ in (RDF.type, RDFS.label) if _ in term_ids
+        ]
+
+        self._references: Counter[int] = Counter()
+        self._serialized: set[int] = set()
+        self._labels: dict[int, str] = {}
+        self._verb_labels: dict[int, str] = {}
+        self._depth = 0
+        self._parts: list[str] = []
+
+    def write(self) -> None:
+        """Write the triples to the stream."""
+        self.preprocess()
+        subjects = self.order_subjects()
+        self.start_document()
+        for subject in subjects:
+            if subject in self._serialized:
+                continue
+            self.statement(subject)
+            self._parts.append("\n")
+            self._flush()
+        self._stream.write(b"\n")
+
+    def preprocess(self) -> None:
+        """Count references and declare the prefixes of all terms' prefixed names.
+
+        Prefixed names are computed in the order of the triples, since prefixes are
+        generated for the namespaces of predicates on the fly, and computing the
+        prefixed name of a term has no further effect after the first time.
+        """
+        self._references = Counter(self._objects)
+
+        get_pname = self._prefixed_name
+        terms = self._terms
+        base = self._serializer.base
+        keyword = self._type
+        done: set[int] = set()
+        verbs_done: set[int] = set()
+
+        for subject, predicate, object_ in zip(
+            self._subjects, self._predicates, self._objects, strict=True
+        ):
+            if subject not in done:
+                done.add(subject)
+                get_pname(terms[subject], generate=False)
+
+            if predicate not in verbs_done:
+                verbs_done.add(predicate)
+                node = terms[predicate]
+                if predicate != keyword and not (
+                    base is not None
+                    and node.startswith(base)  # type: ignore[attr-defined]
+                    and "#" not in node.replace(base, "")  # type: ignore[attr-defined]
+                    and "/" not in node.replace(base, "")  # type: ignore[attr-defined]
+                ):
+                    get_pname(node, generate=True)
+
+            if object_ not in done:
+                done.add(object_)
+                node = terms[object_]
+                get_pname(node, generate=False)
+                if isinstance(node, Literal) and node.datatype:
+                    get_pname(node.datatype, generate=False)
+
+    def order_subjects(self) -> list[int]:
+        """Order the subjects: classes first, then by kind and number of references."""
+        terms = self._terms
+        # Subjects are ranked by their position, since the triples are sorted
+        position = {subject: start for subject, (start, _) in self._ranges.items()}
+        ordered = sorted(
+            {
+                subject
+                for subject, predicate, object_ in zip(
+                    self._subjects, self._predicates, self._objects, strict=True
+                )
+                if predicate == self._type and object_ == self._class
+            },
+            key=position.__getitem__,
+        )
+        seen = set(ordered)
+
+        references = self._references
+        ordered.extend(
+            sorted(
+                (_ for _ in self._ranges if _ not in seen),
+                key=lambda _: (
+                    isinstance(terms[_], BNode),
+                    references[_],
+                    position[_],
+                ),
+            )
+        )
+        return ordered
+
+    def start_document(self) -> None:
+        """Declare the base IRI and the prefixes."""
+        base = self._serializer.base
+        if base:
+            self._parts.append(f"@base <{base}> .\n")
+        for prefix, namespace in sorted(self._serializer.namespaces.items()):
+            self._parts.append(f"@prefix {prefix}: <{namespace}> .\n")
+        self._flush()
+
+    def statement(self, subject: int) -> None:
+        """Write a subject block."""
+        self._serialized.add(subject)
+        if self._references[subject] == 0 and isinstance(self._terms[subject], BNode):
+            self._parts.append("\n[]")
+        else:
+            self._parts.append("\n" + self._depth * _INDENT)
+            self._parts.append(self.label(subject, SUBJECT))
+        self.predicate_list(subject)
+        self._parts.append(" .")
+
+    def path(self, node: int, position: int, newline: bool = False) -> None:
+        """Write a term, inlining blank nodes referenced at most once."""
+        if not self.p_squared(node, position, newline):
+            if position != SUBJECT and not newline:
+                self._parts.append(" ")
+            self._parts.append(self.label(node, position))
+
+    def label(self, node: int, position: int) -> str:
+        """The lexical form of a term, as a prefixed name if possible."""
+        labels = self._verb_labels if position == VERB else self._labels
+        label = labels.get(node)
+        if label is not None:
+            return label
+
+        term = self._terms[node]
+        if node == self._nil:
+            label = "()"
+        elif position == VERB and node == self._type:
+            label = "a"
+        elif isinstance(term, Literal):
+            label = term._literal_n3(
+                use_plain=True,
+                qname_callback=lambda datatype: self._prefixed_name(datatype, False),
+            )
+        else:
+            term = self._serializer.relativize(term)  # type: ignore[type-var]
+            label = self._prefixed_name(term, position == VERB) or term.n3()
+        labels[node] = label
+        return label
+
+    def _prefixed_name(self, node: Node, generate: bool) -> str | None:
+        """The prefixed name of a term, if any, see `TurtleSerializer.get_pname()`."""
+        if not isinstance(node, URIRef):
+            return None
+        return self._prefixed_names(node, generate)
+
+    def p_squared(self, node: int, position: int, newline: bool = False) -> bool:
+        """Inline a blank node as a collection or a property list, if possible."""
+        if (
+            not isinstance(self._terms[node], BNode)
+            or node in self._serialized
+            or self._references[node] > 1
+            or position == SUBJECT
+        ):
+            return False
+
+        if not newline:
+            self._parts.append(" ")
+
+        if self.is_valid_list(node):
+            self._parts.append("(")
+            self._depth += 1
+            self.do_list(node)
+            self._depth -= 1
+            self._parts.append(" )")
+        else:
+            self._serialized.add(node)
+            self._depth += 2
+            self._parts.append("[")
+            self._depth -= 1
+            self.predicate_list(node)
+            self._parts.append(" ]")
+            self._depth -= 1
+
+        return True
+
+    def is_valid_list(self, node: int | None) -> bool:
+        """Whether or not a node is the head of a collection of only list nodes."""
+        if self.value(node, self._first) is None:
+            return False
+        while node is not None and self._terms[node]:
+            if node != self._nil:
+                start, end = self._ranges.get(node, (0, 0))
+                if end - start != 2:
+                    return False
+            node = self.value(node, self._rest)
+        return True
+
+    def do_list(self, node: int | None) -> None:
+        """Write the items of a collection."""
+        while node is not None and self._terms[node]:
+            item = self.value(node, self._first)
+            if item is not None:
+                self.path(item, OBJECT)
+                self._serialized.add(node)
+            node = self.value(node, self._rest)
+
+    def value(self, subject: int | None, predicate: int | None) -> int | None:
+        """The first object of a subject and predicate, if any."""
+        if subject is None or predicate is None:
+            return None
+        start, end = self._ranges.get(subject, (0, 0))
+        for index in range(start, end):
+            if self._predicates[index] == predicate:
+                return self._objects[index]
+        return None
+
+    def predicate_list(self, subject: int) -> None:
+        """Write the predicates and objects of a subject."""
+        start, end = self._ranges.get(subject, (0, 0))
+        if start == end:
+            return
+
+        properties: dict[int, list[int]] = {}
+        for index in range(start, end):
+            properties.setdefault(self._predicates[index], []).append(
+                self._objects[index]
+            )
+        predicates = [_ for _ in self._predicate_order if _ in properties]
+        predicates.extend(_ for _ in properties if _ not in predicates)
+
+        for index, predicate in enumerate(predicates):
+            if index:
+                self._parts.append(" ;\n" + (self._depth + 1) * _INDENT)
+            self.path(predicate, VERB, newline=index > 0)
+            self.object_list(properties[predicate])
+
+    def object_list(self, objects: list[int]) -> None:
+        """Write the objects of a subject and predicate."""
+        terms = self._terms
+        if sum(isinstance(terms[_], Literal) for _ in objects) > 1:
+            # Objects are sorted, except for literals RDFlib considers neither less
+            # nor greater than each other, which RDFlib's sort may reorder
+            objects.sort(key=terms.__getitem__)  # type: ignore[arg-type]
+
+        # RDFlib means to indent a single object less, but its `(count == 1) and 0 or 1`
+        # expression always evaluates to 1
+        self._depth += 1
+        self.path(objects[0], OBJECT)
+        for object_ in objects[1:]:
+            self._parts.append(",\n" + (self._depth + 1) * _INDENT)
+            self.path(object_, OBJECT, newline=True)
+        self._depth -= 1
+
+    def _flush(self) -> None:
+        """Write the buffered output to the stream."""
+        self._stream.write("".join(self._parts).encode(_ENCODING, "replace"))
+        self._parts.clear()